@@ -0,0 +1,155 @@
+"""
+Flowery.Uno Utils Command Line
+
+One entry point for the documentation and repository tools. A subcommand imports its
+tool only when it runs, so `python -m Utils loc` does not pay for the imports of the
+site generator.
+
+Usage (from the repository root):
+    python -m Utils docs                # generate_docs.py: llms/ from the C# controls and curated docs
+    python -m Utils site [options]      # generate_site.py: the static site (same options)
+    python -m Utils query "glass blur"  # docs_query.py: BM25 search over the curated docs
+    python -m Utils loc [options]       # count_loc.py: lines of C# and XAML
+    python -m Utils i18n [lang]         # check_missing_translations.py
+    python -m Utils all [site options]  # docs, site, loc and i18n in one process
+    python -m Utils startup             # Cold-start time of each subcommand
+
+Options after the subcommand go to the tool (`python -m Utils site --help`). Every tool
+finds the repository root the same way (repo_paths.py) and keeps its cache in a subfolder
+of one cache folder: <root>/.cache, or --cache-dir given before the subcommand.
+
+The all pipeline hands the docs generate_docs.py wrote to the site build in memory, so
+llms/ is not read back. It stops at the first stage that fails and prints the time of
+each stage.
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))  # The tools import each other by module name
+from repo_paths import CACHE_DIR_ENV, UTILS_DIR, repo_root
+
+
+# Subcommand -> (tool module, description)
+COMMANDS = {
+    'docs': ('generate_docs', "Generate llms/ from the C# controls and the curated docs"),
+    'site': ('generate_site', "Build the static site into docs/ (or --serve it)"),
+    'query': ('docs_query', "Search the curated docs (BM25 over sections)"),
+    'loc': ('count_loc', "Count lines of C# and XAML code"),
+    'i18n': ('check_missing_translations', "Check the Gallery translations for missing keys"),
+}
+
+# Fresh interpreters started per subcommand by `startup`; the median counts
+STARTUP_RUNS = 5
+
+
+def exit_code(stage: Callable[[], object]) -> int:
+    """Run a stage and return its exit code: from sys.exit(), or 0 (tools exit on failure; count_loc returns it)."""
+    try:
+        result = stage()
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    return result if type(result) is int else 0
+
+
+def run_tool(command: str, argv: list[str], **kwargs):
+    """Import the tool of a subcommand and run its main(argv). Returns what main() returned."""
+    sys.argv[0] = f"python -m Utils {command}"  # Shown in the tool's usage and errors
+    module = importlib.import_module(COMMANDS[command][0])
+    return module.main(argv, **kwargs)
+
+
+def run_all(site_argv: list[str]) -> int:
+    """docs, site (on the docs generated in memory), loc and i18n, in one process."""
+    generated: dict[Path, str] = {}
+
+    def docs():
+        generated.update(run_tool('docs', []).outputs)
+
+    stages = [
+        ('docs', docs),
+        ('site', lambda: run_tool('site', site_argv, generated_docs=generated)),
+        ('loc', lambda: run_tool('loc', [str(repo_root()), '--verbose'])),
+        ('i18n', lambda: run_tool('i18n', [])),
+    ]
+    timings = []
+    code = 0
+    for i, (name, stage) in enumerate(stages):
+        print(f"\n=== {name} ===", flush=True)
+        start = time.perf_counter()
+        code = exit_code(stage)
+        timings.append(f"{name} {time.perf_counter() - start:.1f} s")
+        if code:
+            print(f"\nStage '{name}' failed (exit code {code})" + ("; later stages skipped" if i < len(stages) - 1 else ""))
+            break
+    print(f"\nStages: {', '.join(timings)}")
+    return code
+
+
+def report_startup(runs: int) -> int:
+    """
+    Print the cold-start time of each subcommand: a fresh interpreter running
+    `python -m Utils <command> --help` (imports and argument parsing, no work).
+    """
+    import statistics
+    import subprocess
+    def timed(args: list[str]) -> float:
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, *args], cwd=UTILS_DIR.parent, check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            samples.append(time.perf_counter() - start)
+        return statistics.median(samples) * 1000
+
+    interpreter = timed(['-c', 'pass'])
+    print(f"Cold start (median of {runs} runs, `--help`):")
+    print(f"  {'python (no imports)':<24} {interpreter:7.0f} ms")
+    for label, args in [('python -m Utils', ['-m', 'Utils', '--help']),
+                        *((f"python -m Utils {command}", ['-m', 'Utils', command, '--help']) for command in COMMANDS)]:
+        elapsed = timed(args)
+        print(f"  {label:<24} {elapsed:7.0f} ms  (+{elapsed - interpreter:.0f} ms over the interpreter)")
+    return 0
+
+
+def main() -> int:
+    commands = '\n'.join(f"  {name:<8} {description}" for name, (_, description) in COMMANDS.items())
+    parser = argparse.ArgumentParser(
+        prog="python -m Utils",
+        description="Flowery.Uno documentation and repository tools.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Commands:
+{commands}
+  all      docs, site, loc and i18n in one process (options go to site)
+  startup  Report the cold-start time of each command
+
+Options after the command go to the tool, e.g. python -m Utils site --help
+        """
+    )
+    parser.add_argument('--cache-dir', metavar='DIR',
+                        help='Cache folder shared by all tools (default: <repo root>/.cache)')
+    parser.add_argument('command', choices=[*COMMANDS, 'all', 'startup'], metavar='COMMAND',
+                        help='One of the commands below')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.cache_dir:
+        os.environ[CACHE_DIR_ENV] = str(Path(args.cache_dir).resolve())
+    if args.command == 'all':
+        return run_all(args.args)
+    if args.command == 'startup':
+        return report_startup(STARTUP_RUNS)
+    return exit_code(lambda: run_tool(args.command, args.args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
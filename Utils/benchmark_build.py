@@ -0,0 +1,552 @@
+#!/usr/bin/env python3
+"""
+Flowery.Uno Docs Build Benchmark
+
+Generates a synthetic repository at several sizes and runs generate_docs.py and
+generate_site.py against it, recording wall time and peak RSS per build stage.
+Fails when a stage regresses against the committed baseline.
+
+Usage:
+    python Utils/benchmark_build.py                       # 100 and 1k controls
+    python Utils/benchmark_build.py --sizes 100 10000     # Selected sizes (10k takes most of an hour)
+    python Utils/benchmark_build.py --update-baseline     # Record the results as the new baseline
+    python Utils/benchmark_build.py --keep --work /tmp/b  # Keep the corpus and build output
+    python Utils/benchmark_build.py --streaming           # Bounded-memory build (generate_site.py --streaming)
+
+Synthetic corpus (per size N, deterministic):
+    Flowery.Uno/Controls/DaisyBenchNNNNN.cs  - Controls with XML docs, enums and DependencyProperties
+    llms-static/DaisyBenchNNNNN.md           - Curated docs: tables, alerts, code fences, images, links
+    llms-static/images/*.png                 - Screenshots: single, chunked (_a/_b) and Name(Mode).png
+    llms-static/<guides>.md                  - The standalone guides (GUIDE_FILES)
+    llms/categories/*.md                     - Categories of CATEGORY_SIZE controls
+
+Each size runs in its own process, so peak RSS is not inherited from a smaller run.
+Stages are the "[n/N] ..." steps the generators print; the RSS of a stage is the
+high-water mark of the process (and its worker processes) at the end of the stage.
+
+Baselines (Utils/benchmark_baseline.json):
+    Seconds and peak RSS per size and stage, one baseline per environment (OS, Python
+    major.minor, Pillow, brotli and the image tools installed) and build mode (--shell,
+    --streaming). Each size also times a fixed CPU workload ("calibration", before and
+    after its builds), and the baseline timings are scaled by the ratio of the two
+    calibrations, so a faster or slower machine is compared with what the baseline
+    would take there. Without a
+    baseline for its environment, a run is compared with the closest one of its mode
+    (with a warning). It fails when a size or stage is in only one of the run and the
+    baseline. --update-baseline records or extends the current environment's baseline.
+
+Streaming builds should keep peak RSS nearly flat across sizes: the results end with
+the growth of the generate_site peak RSS per 1000 controls between the smallest and
+the largest size, to compare with the default build.
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import io
+import json
+import platform
+import random
+import re
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+try:
+    import resource  # Unix only
+except ImportError:
+    resource = None
+
+
+# 10k controls take most of an hour: opt in with --sizes
+DEFAULT_SIZES = (100, 1000)
+
+# Controls per synthetic category
+CATEGORY_SIZE = 25
+
+# A stage regresses when it is this many times slower than the baseline AND slower by at least MIN_SECONDS_DELTA
+DEFAULT_TOLERANCE = 1.5
+MIN_SECONDS_DELTA = 0.5
+
+# ... or when its peak RSS grows by this factor AND by at least MIN_RSS_DELTA_MB
+RSS_TOLERANCE = 1.25
+MIN_RSS_DELTA_MB = 32
+
+BASELINE_FILE = Path(__file__).parent / "benchmark_baseline.json"
+
+# Synthetic screenshot size (pixels); big enough for responsive variants to apply
+IMAGE_SIZE = (960, 540)
+
+WORDS = '''
+    button card theme variant size primary secondary accent neutral ghost outline
+    layout padding margin border radius shadow color brush template binding state
+    pointer focus keyboard accessible animation duration easing content header item
+'''.split()
+
+
+# =============================================================================
+# Synthetic corpus
+# =============================================================================
+
+def control_name(index: int) -> str:
+    return f"DaisyBench{index:05d}"
+
+
+def sentence(rng: random.Random, words: int = 12) -> str:
+    text = ' '.join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + '.'
+
+
+def synthetic_png(rng: random.Random) -> bytes:
+    """An RGB PNG of color bands and gradients (compresses roughly like a UI screenshot, not like flat color)."""
+    width, height = IMAGE_SIZE
+    base = [rng.randrange(256) for _ in range(3)]
+    rows = []
+    for y in range(height):
+        row = bytearray([0])  # Filter type: None
+        band = (y // 40) * 17
+        for x in range(0, width, 8):
+            pixel = bytes(((c + band + x // 8) & 0xff) for c in base)
+            row += pixel * 8
+        rows.append(bytes(row))
+        if y % 50 == 0:
+            base = [rng.randrange(256) for _ in range(3)]
+
+    def chunk(kind: bytes, body: bytes) -> bytes:
+        return struct.pack('>I4s', len(body), kind) + body + struct.pack('>I', zlib.crc32(kind + body) & 0xffffffff)
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header)
+            + chunk(b'IDAT', zlib.compress(b''.join(rows), 6)) + chunk(b'IEND', b''))
+
+
+def control_source(rng: random.Random, name: str) -> str:
+    """A C# control file in the shape CSharpParser expects."""
+    enum_name = f"{name}Variant"
+    values = ',\n        '.join(f"Value{v}" for v in range(rng.randint(3, 8)))
+    lines = [
+        "namespace Flowery.Controls",
+        "{",
+        f"    public enum {enum_name}",
+        "    {",
+        f"        {values}",
+        "    }",
+        "",
+        "    /// <summary>",
+        f"    /// {sentence(rng)}",
+        "    /// </summary>",
+        f"    public partial class {name} : ContentControl",
+        "    {",
+    ]
+    for p in range(rng.randint(5, 15)):
+        prop_type, default = rng.choice([
+            ('bool', 'false'), ('double', '12.0'), ('string', '"text"'),
+            (enum_name, f"{enum_name}.Value0"), ('Thickness', 'new Thickness(4)'),
+        ])
+        lines += [
+            "        /// <summary>",
+            f"        /// {sentence(rng, 8)}",
+            "        /// </summary>",
+            f"        public static readonly DependencyProperty Prop{p}Property =",
+            f"            DependencyProperty.Register(nameof(Prop{p}), typeof({prop_type}), typeof({name}),",
+            f"                new PropertyMetadata({default}, OnChanged));",
+            "",
+        ]
+    lines += ["    }", "}", ""]
+    return '\n'.join(lines)
+
+
+def curated_markdown(rng: random.Random, name: str, images: list[str], count: int) -> str:
+    """Curated docs with the constructs the site converter handles: tables, alerts, fences, images, links."""
+    others = [control_name(rng.randrange(count)) for _ in range(3)]
+    lines = [
+        "<!-- Supplementary documentation for the benchmark corpus -->",
+        "# Overview",
+        "",
+        sentence(rng, 30),
+        "",
+        f"See also [{others[0]}]({others[0]}.md) and **{others[1]}** (`{others[2]}`).",
+        "",
+        "## Variants",
+        "",
+        "| Variant | Description | Default |",
+        "|---------|-------------|---------|",
+    ]
+    for v in range(rng.randint(4, 12)):
+        lines.append(f"| `Value{v}` | {sentence(rng, 8)} | {'Yes' if v == 0 else 'No'} |")
+    lines += [
+        "",
+        f"> [!{rng.choice(['NOTE', 'TIP', 'WARNING', 'IMPORTANT'])}]",
+        f"> {sentence(rng, 20)}",
+        "> - First point with `inline code`",
+        "> - Second point",
+        "",
+        "## Quick Examples",
+        "",
+        "```xml",
+        f'<controls:{name} Variant="Value1" Prop0="True">',
+        "    <!-- A comment inside a code block stays -->",
+        f'    <TextBlock Text="{sentence(rng, 4)}"/>',
+        f"</controls:{name}>",
+        "```",
+        "",
+        "```csharp",
+        f"var control = new {name} {{ Prop0 = true }};",
+        "control.Loaded += (s, e) => Console.WriteLine(\"loaded\");",
+        "```",
+        "",
+        "## Usage Notes",
+        "",
+    ]
+    for _ in range(rng.randint(3, 8)):
+        lines.append(f"- {sentence(rng, 10)}")
+    for image in images[1:]:
+        lines += ["", f"![{name} detail]({image})"]
+    lines += ["", "1. Step one", "2. Step two with a [link](https://example.com)", ""]
+    return '\n'.join(lines)
+
+
+def guide_markdown(rng: random.Random, title: str) -> str:
+    lines = [f"# {title}", ""]
+    for section in range(6):
+        lines += [f"## Section {section}", "", sentence(rng, 40), "",
+                  "```csharp", f"// {sentence(rng, 6)}", "var x = 1;", "```", ""]
+    return '\n'.join(lines)
+
+
+def build_corpus(root: Path, count: int, guide_files: list[str], seed: int = 42):
+    """Write the synthetic repository for count controls under root."""
+    rng = random.Random(seed)
+    controls_dir = root / "Flowery.Uno" / "Controls"
+    curated_dir = root / "llms-static"
+    images_dir = curated_dir / "images"
+    categories_dir = root / "llms" / "categories"
+    for folder in (controls_dir, images_dir, categories_dir):
+        folder.mkdir(parents=True, exist_ok=True)
+
+    # Screenshots repeat after a few distinct ones: real docs reuse similar images, and
+    # generating thousands of distinct PNGs would dominate the benchmark setup
+    pngs = [synthetic_png(rng) for _ in range(8)]
+    names = [control_name(i) for i in range(count)]
+    for i, name in enumerate(names):
+        (controls_dir / f"{name}.cs").write_text(control_source(rng, name), encoding='utf-8')
+        images = [f"images/{name}.png"]
+        if i % 10 == 0:
+            images += [f"images/{name}_a.png", f"images/{name}_b.png"]
+        if i % 7 == 0:
+            images.append(f"images/{name}(Mode).png")
+        for image in images:
+            (curated_dir / image).write_bytes(pngs[rng.randrange(len(pngs))])
+        (curated_dir / f"{name}.md").write_text(curated_markdown(rng, name, images, count), encoding='utf-8')
+
+    for guide in guide_files:
+        (curated_dir / guide).write_text(guide_markdown(rng, Path(guide).stem), encoding='utf-8')
+
+    for start in range(0, count, CATEGORY_SIZE):
+        members = names[start:start + CATEGORY_SIZE]
+        lines = [f"# Bench Group {start // CATEGORY_SIZE}", "",
+                 f"This category contains {len(members)} controls:", ""]
+        lines += [f"- **[{name}](../controls/{name}.html)**: {sentence(rng, 8)}" for name in members]
+        lines += ["", "See individual control documentation for detailed usage.", ""]
+        (categories_dir / f"bench-group-{start // CATEGORY_SIZE:04d}.md").write_text('\n'.join(lines), encoding='utf-8')
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+def peak_rss_mb() -> float | None:
+    """High-water mark of this process and its (finished) worker processes, in MB."""
+    if resource is None:
+        return None
+    usage = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return usage / (1024 * 1024) if sys.platform == 'darwin' else usage / 1024  # bytes on macOS, KB elsewhere
+
+
+class StageRecorder(io.TextIOBase):
+    """stdout replacement that times the "[n/N] Stage..." steps a generator prints and logs its output."""
+
+    HEADER = re.compile(r'^\[\d+/\d+\] (.+?)\.*$')
+
+    def __init__(self, tool: str, log):
+        self.tool = tool
+        self.log = log
+        self.stages: dict[str, dict] = {}
+        self.current = f"{tool}: setup"
+        self.start = self.tool_start = time.perf_counter()
+
+    def write(self, text: str) -> int:
+        for line in text.splitlines():
+            m = self.HEADER.match(line.strip())
+            if m:
+                self._close()
+                self.current = f"{self.tool}: {m.group(1)}"
+        self.log.write(text)
+        return len(text)
+
+    def _close(self):
+        now = time.perf_counter()
+        self.stages[self.current] = {'seconds': round(now - self.start, 3), 'rss_mb': peak_rss_mb()}
+        self.start = now
+
+    def finish(self) -> dict[str, dict]:
+        """Close the last stage and add the tool total."""
+        self._close()
+        self.stages[f"{self.tool}: total"] = {'seconds': round(time.perf_counter() - self.tool_start, 3),
+                                              'rss_mb': peak_rss_mb()}
+        return self.stages
+
+
+def calibrate(rounds: int = 5) -> float:
+    """
+    Seconds (best of rounds) of a fixed workload of the kinds the generators spend their time
+    on: regular expressions, string building, JSON, hashing and zlib. It does not use the
+    generators, so a change to them never changes it; it only tells how fast the machine is.
+    """
+    rng = random.Random(0)
+    text = '\n'.join(sentence(rng, 20) for _ in range(4000))
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        html = re.sub(r'\b(\w+) (\w+)\b', r'<em>\1</em> \2', text)
+        words = {}
+        for word in re.findall(r'\w+', html):
+            words[word] = words.get(word, 0) + 1
+        data = json.dumps({'words': words, 'lines': html.splitlines()}).encode('utf-8')
+        hashlib.sha256(zlib.compress(data, 9)).hexdigest()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best, 4)
+
+
+def run_size(work: Path, count: int, shell: str, streaming: bool = False) -> dict[str, dict]:
+    """Build the corpus for count controls and run both generators (in this process)."""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from generate_docs import DocumentationGenerator
+    from generate_site import SiteGenerator
+
+    calibration = calibrate()
+    stages = {'calibration': None}
+    root = work / f"controls-{count}"
+    shutil.rmtree(root, ignore_errors=True)
+    start = time.perf_counter()
+    build_corpus(root, count, SiteGenerator.GUIDE_FILES)
+    stages['corpus: generate'] = {'seconds': round(time.perf_counter() - start, 3), 'rss_mb': peak_rss_mb()}
+
+    with open(root / "build.log", 'w', encoding='utf-8') as log:
+        for tool, build in (
+            ('generate_docs', lambda: DocumentationGenerator(root).generate()),
+            ('generate_site', lambda: SiteGenerator(root / "llms", root / "docs", curated_dir=root / "llms-static",
+                                                    cache_dir=root / ".cache" / "site", shell_mode=shell,
+                                                    streaming=streaming).generate()),
+        ):
+            recorder = StageRecorder(tool, log)
+            stdout, sys.stdout = sys.stdout, recorder
+            try:
+                build()
+            finally:
+                sys.stdout = stdout
+            stages.update(recorder.finish())
+    # Calibrated before and after the builds: the speed of a shared machine drifts during a long run
+    stages['calibration'] = {'seconds': round((calibration + calibrate()) / 2, 4), 'rss_mb': None}
+    return stages
+
+
+def environment() -> dict:
+    """
+    What changes which work the build does, besides the code. Machine speed is not part of it:
+    the calibration stage measures that.
+    """
+    def has(module: str) -> bool:
+        return importlib.util.find_spec(module) is not None
+
+    return {
+        'os': platform.system(),
+        'python': '.'.join(platform.python_version_tuple()[:2]),
+        'pillow': has('PIL'),
+        'brotli': has('brotli'),
+        'tools': sorted(tool for tool in ('ffmpeg', 'oxipng', 'optipng') if shutil.which(tool)),
+    }
+
+
+def find_baseline(baselines: list[dict], env: dict, shell: str, streaming: bool) -> dict | None:
+    """The baseline recorded in env for this layout and build mode, or None."""
+    for baseline in baselines:
+        if (baseline['environment'] == env and baseline['shell'] == shell
+                and baseline['streaming'] == streaming):
+            return baseline
+    return None
+
+
+def closest_baseline(baselines: list[dict], env: dict, shell: str, streaming: bool) -> dict | None:
+    """The baseline of this layout and build mode whose environment has the most attributes of env, or None."""
+    candidates = [b for b in baselines if b['shell'] == shell and b['streaming'] == streaming]
+    return max(candidates, key=lambda b: sum(b['environment'].get(k) == v for k, v in env.items()), default=None)
+
+
+# =============================================================================
+# Baseline comparison
+# =============================================================================
+
+def speed_ratio(stages: dict[str, dict], base_stages: dict[str, dict]) -> float:
+    """Calibration time of a run over that of its baseline: baseline seconds times this are the expected seconds."""
+    measured, base = stages.get('calibration'), base_stages.get('calibration')
+    return measured['seconds'] / base['seconds'] if measured and base else 1.0
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    """
+    Regressions of results against the baseline (timings scaled by the calibration ratio),
+    and sizes or stages only one of them has.
+    """
+    regressions = []
+    for size, stages in results.items():
+        if size not in baseline:
+            regressions.append(f"{size} controls: no baseline for this size")
+            continue
+        speed = speed_ratio(stages, baseline[size])
+        for stage in sorted(baseline[size].keys() - stages.keys()):
+            regressions.append(f"{size} controls, {stage}: in the baseline but not measured")
+        for stage, measured in stages.items():
+            base = baseline[size].get(stage)
+            if base is None:
+                regressions.append(f"{size} controls, {stage}: no baseline for this stage")
+                continue
+            if stage == 'calibration' or stage.startswith('corpus:'):
+                continue
+            seconds, base_seconds = measured['seconds'], base['seconds'] * speed
+            if seconds > base_seconds * tolerance and seconds - base_seconds >= MIN_SECONDS_DELTA:
+                regressions.append(f"{size} controls, {stage}: {seconds:.2f} s (baseline {base_seconds:.2f} s)")
+            rss, base_rss = measured.get('rss_mb'), base.get('rss_mb')
+            if rss and base_rss and rss > base_rss * RSS_TOLERANCE and rss - base_rss >= MIN_RSS_DELTA_MB:
+                regressions.append(f"{size} controls, {stage}: peak RSS {rss:.0f} MB (baseline {base_rss:.0f} MB)")
+    return regressions
+
+
+def print_results(results: dict[str, dict], baseline: dict[str, dict]):
+    for size, stages in results.items():
+        speed = speed_ratio(stages, baseline.get(size, {}))
+        print(f"\n{size} controls (baseline timings x{speed:.2f} for the speed of this machine)")
+        print(f"  {'Stage':<52} {'Seconds':>9} {'Baseline':>9} {'Peak RSS':>10}")
+        for stage, measured in stages.items():
+            base = baseline.get(size, {}).get(stage)
+            base_text = f"{base['seconds'] * (1 if stage == 'calibration' else speed):.2f}" if base else '-'
+            rss = f"{measured['rss_mb']:.0f} MB" if measured.get('rss_mb') else '-'
+            print(f"  {stage:<52} {measured['seconds']:>9.2f} {base_text:>9} {rss:>10}")
+
+
+def rss_growth(results: dict[str, dict]) -> float | None:
+    """Growth of the generate_site peak RSS per 1000 controls from the smallest to the largest size, in MB."""
+    sizes = sorted(int(size) for size in results)
+    if len(sizes) < 2:
+        return None
+    rss = [results[str(size)].get('generate_site: total', {}).get('rss_mb') for size in (sizes[0], sizes[-1])]
+    if not all(rss):
+        return None
+    return (rss[1] - rss[0]) / (sizes[-1] - sizes[0]) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark generate_docs.py and generate_site.py on synthetic corpora.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python Utils/benchmark_build.py                      # 100 and 1k controls against the baseline
+  python Utils/benchmark_build.py --sizes 100 10000    # Selected sizes (10k takes most of an hour)
+  python Utils/benchmark_build.py --update-baseline    # Record the results as the new baseline
+        """
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help='Numbers of controls to benchmark (default: 100 1000)')
+    parser.add_argument('--work', metavar='DIR', help='Folder for the corpora and build output (default: a temp folder)')
+    parser.add_argument('--keep', action='store_true', help='Keep the work folder after the run')
+    parser.add_argument('--shell', choices=('pages', 'iframe'), default='pages', help='Site layout to build')
+    parser.add_argument('--streaming', action='store_true', help='Build the site in bounded-memory streaming mode')
+    parser.add_argument('--baseline', metavar='FILE', default=str(BASELINE_FILE), help='Baseline JSON file')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Write the results of the benchmarked sizes into the baseline file')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'Allowed slowdown factor per stage (default: {DEFAULT_TOLERANCE})')
+    parser.add_argument('--output', metavar='FILE', help='Also write the results as JSON')
+    parser.add_argument('--child', type=int, help=argparse.SUPPRESS)  # Internal: run one size, print JSON
+    args = parser.parse_args()
+
+    if args.child is not None:
+        print(json.dumps(run_size(Path(args.work), args.child, args.shell, args.streaming)))
+        return
+
+    baseline_path = Path(args.baseline)
+    baselines = (json.loads(baseline_path.read_text(encoding='utf-8'))['baselines']
+                 if baseline_path.exists() else [])
+    env = environment()
+    recorded = find_baseline(baselines, env, args.shell, args.streaming)
+    reference = recorded
+    if recorded is None and not args.update_baseline:
+        reference = closest_baseline(baselines, env, args.shell, args.streaming)
+        if reference is None:
+            sys.exit(f"Error: no baseline in {baseline_path} for shell={args.shell}, streaming={args.streaming} "
+                     f"(record one with --update-baseline)")
+        differences = ', '.join(f"{key} {reference['environment'].get(key)} -> {value}"
+                                for key, value in env.items() if reference['environment'].get(key) != value)
+        print(f"WARNING: no baseline for this environment; comparing with the closest one ({differences}).")
+        print("Stages that depend on these (images, precompression) may differ for that reason alone.")
+    baseline = reference['results'] if reference else {}
+    missing = [str(size) for size in args.sizes if str(size) not in baseline]
+    if missing and not args.update_baseline:
+        sys.exit(f"Error: no baseline for {', '.join(missing)} controls in this environment "
+                 f"(record one with --update-baseline)")
+
+    work = Path(args.work) if args.work else Path(tempfile.mkdtemp(prefix="flowery-bench-"))
+    work.mkdir(parents=True, exist_ok=True)
+
+    results = {}
+    try:
+        for size in args.sizes:
+            print(f"Benchmarking {size} controls...", flush=True)
+            child = subprocess.run(
+                [sys.executable, __file__, '--child', str(size), '--work', str(work), '--shell', args.shell]
+                + (['--streaming'] if args.streaming else []),
+                capture_output=True, text=True)
+            if child.returncode != 0:
+                print(child.stdout[-2000:] + child.stderr[-4000:])
+                sys.exit(f"Benchmark of {size} controls failed")
+            results[str(size)] = json.loads(child.stdout.strip().splitlines()[-1])
+    finally:
+        if not args.keep:
+            shutil.rmtree(work, ignore_errors=True)
+
+    print_results(results, baseline)
+    growth = rss_growth(results)
+    if growth is not None:
+        print(f"\ngenerate_site peak RSS growth: {growth:.1f} MB per 1000 controls")
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+
+    if args.update_baseline:
+        merged = {**baseline, **results}
+        if recorded is None:
+            recorded = {'environment': env, 'shell': args.shell, 'streaming': args.streaming}
+            baselines.append(recorded)
+        recorded['results'] = dict(sorted(merged.items(), key=lambda i: int(i[0])))
+        baseline_path.write_text(json.dumps({'baselines': baselines}, indent=2) + '\n', encoding='utf-8')
+        print(f"\nBaseline updated: {baseline_path}")
+        return
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\nREGRESSIONS:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print("\nNo regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Flowery.Uno Markdown Converter Micro-Benchmarks
+
+Times MarkdownToHtml.convert (generate_site.py) per markdown construct on generated
+inputs of doubling size and prints throughput curves, so superlinear code paths show
+up long before a real page is big enough to hurt a build.
+
+Usage:
+    python Utils/benchmark_markdown.py                     # All constructs
+    python Utils/benchmark_markdown.py fences alerts_nested # Selected constructs
+    python Utils/benchmark_markdown.py --max-units 2048     # Smaller inputs (quicker)
+    python Utils/benchmark_markdown.py --json curves.json   # Also save the curves
+
+Each construct is converted at 16, 32, 64, ... units (code blocks, table rows, list
+items, nesting levels, ...) up to --max-units, or until one conversion takes longer
+than --max-seconds. Every size reports the best of --repeat runs.
+
+The "exponent" column is the local growth rate of the time against the input size
+between one size and the previous one: 1.0 is linear, 2.0 quadratic. Constructs whose
+exponent stays above SUPERLINEAR_EXPONENT at the largest sizes are flagged.
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from generate_site import MarkdownToHtml
+
+
+# Growth exponent (time vs. input size) above which a construct is reported as superlinear
+SUPERLINEAR_EXPONENT = 1.3
+
+# Sizes start here and double up to --max-units
+MIN_UNITS = 16
+
+# Width of the throughput bars
+BAR_WIDTH = 30
+
+
+def fences(n: int) -> str:
+    """Many small fenced code blocks: n __CODE_BLOCK_i__ placeholders to restore."""
+    return '\n'.join(f"Step {i}:\n\n```xml\n<daisy:DaisyButton Content=\"{i}\"/>\n```\n" for i in range(n))
+
+
+def fence_long(n: int) -> str:
+    """One fenced code block of n lines (with blank runs to collapse)."""
+    body = '\n'.join(f'    <TextBlock Text="line {i}"/>' + ('\n\n' if i % 10 == 0 else '') for i in range(n))
+    return f"```xml\n{body}\n```\n"
+
+
+def table_rows(n: int) -> str:
+    """One table with n rows and inline code in the cells."""
+    rows = '\n'.join(f"| `Value{i}` | Description of value {i} with **bold** text | `{i}` |" for i in range(n))
+    return f"| Name | Description | Default |\n|------|-------------|---------|\n{rows}\n"
+
+
+def tables(n: int) -> str:
+    """n small tables separated by paragraphs."""
+    return '\n'.join(f"Table {i}\n\n| A | B |\n|---|---|\n| `a{i}` | b{i} |\n| c | d |\n" for i in range(n))
+
+
+def alerts(n: int) -> str:
+    """n GitHub alerts (each converted by a recursive convert call)."""
+    kinds = ('NOTE', 'TIP', 'WARNING', 'IMPORTANT')
+    return '\n'.join(f"> [!{kinds[i % 4]}]\n> Alert {i} with `code` and a [link](Doc{i}.md)\n> - item\n"
+                     for i in range(n))
+
+
+def alerts_nested(n: int) -> str:
+    """One alert nested n levels deep (> > > [!NOTE] ...): n recursive convert calls."""
+    lines = []
+    for level in range(n):
+        lines.append('> ' * (level + 1) + '[!NOTE]')
+        lines.append('> ' * (level + 1) + f'Level {level} text')
+    return '\n'.join(lines) + '\n'
+
+
+def list_run(n: int) -> str:
+    """One uninterrupted run of n list items."""
+    return '\n'.join(f"- Item {i} with *emphasis* and `code`" for i in range(n)) + '\n'
+
+
+def lists(n: int) -> str:
+    """n short lists separated by paragraphs."""
+    return '\n'.join(f"Paragraph {i}\n\n- a\n- b\n- c\n" for i in range(n))
+
+
+def links(n: int) -> str:
+    """n links (local .md, external and anchors) in one paragraph."""
+    targets = ('DaisyButton.md', 'https://example.com/page', '#section')
+    return ' '.join(f"[link {i}]({targets[i % 3]})" for i in range(n)) + '\n'
+
+
+def images(n: int) -> str:
+    """n image references, each on its own line."""
+    return '\n\n'.join(f"![Screenshot {i}](images/Shot{i}.png)" for i in range(n)) + '\n'
+
+
+def headings(n: int) -> str:
+    """n headings with repeated titles (anchor disambiguation)."""
+    return '\n\n'.join(f"{'#' * (i % 4 + 1)} Section {i % 10}\n\nText {i}." for i in range(n)) + '\n'
+
+
+def inline(n: int) -> str:
+    """A paragraph with n bold, italic and inline-code spans."""
+    return ' '.join(f"**bold {i}** *italic {i}* `code{i}`" for i in range(n)) + '\n'
+
+
+CONSTRUCTS: dict[str, Callable[[int], str]] = {
+    'fences': fences,
+    'fence_long': fence_long,
+    'table_rows': table_rows,
+    'tables': tables,
+    'alerts': alerts,
+    'alerts_nested': alerts_nested,
+    'list_run': list_run,
+    'lists': lists,
+    'links': links,
+    'images': images,
+    'headings': headings,
+    'inline': inline,
+}
+
+
+def time_convert(converter: MarkdownToHtml, markdown: str, repeat: int) -> float:
+    """Best of repeat conversions, in seconds."""
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        converter.convert(markdown)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(name: str, max_units: int, max_seconds: float, repeat: int) -> list[dict]:
+    """Throughput curve of one construct: one point per size."""
+    converter = MarkdownToHtml()
+    points = []
+    units = MIN_UNITS
+    while units <= max_units:
+        markdown = CONSTRUCTS[name](units)
+        try:
+            seconds = time_convert(converter, markdown, repeat)
+        except RecursionError:
+            points.append({'units': units, 'bytes': len(markdown.encode('utf-8')), 'error': 'RecursionError'})
+            break
+        point = {'units': units, 'bytes': len(markdown.encode('utf-8')), 'seconds': seconds}
+        if points and 'seconds' in points[-1]:
+            previous = points[-1]
+            point['exponent'] = (math.log(max(seconds, 1e-9) / max(previous['seconds'], 1e-9))
+                                 / math.log(point['bytes'] / previous['bytes']))
+        points.append(point)
+        if seconds > max_seconds:
+            break
+        units *= 2
+    return points
+
+
+def print_curve(name: str, points: list[dict]) -> bool:
+    """Print the throughput curve of a construct. Returns True if it grows superlinearly."""
+    print(f"\n{name}: {CONSTRUCTS[name].__doc__}")
+    print(f"  {'units':>7} {'KB':>9} {'ms':>10} {'units/s':>11} {'MB/s':>7} {'exponent':>8}  throughput")
+    timed = [p for p in points if 'seconds' in p]
+    fastest = max((p['bytes'] / max(p['seconds'], 1e-9) for p in timed), default=1)
+    for point in points:
+        if 'error' in point:
+            print(f"  {point['units']:>7} {point['bytes'] / 1024:>9.1f}  {point['error']}")
+            continue
+        rate = point['bytes'] / max(point['seconds'], 1e-9)
+        exponent = f"{point['exponent']:.2f}" if 'exponent' in point else ''
+        bar = '#' * max(1, round(BAR_WIDTH * rate / fastest))
+        print(f"  {point['units']:>7} {point['bytes'] / 1024:>9.1f} {point['seconds'] * 1000:>10.2f} "
+              f"{point['units'] / max(point['seconds'], 1e-9):>11,.0f} {rate / 1e6:>7.2f} {exponent:>8}  {bar}")
+
+    # Judge by the largest sizes: small inputs are dominated by per-call overhead
+    tail = [p['exponent'] for p in timed[-2:] if 'exponent' in p]
+    failed = any('error' in p for p in points)
+    superlinear = failed or (bool(tail) and sum(tail) / len(tail) > SUPERLINEAR_EXPONENT)
+    if superlinear:
+        print(f"  => SUPERLINEAR ({'fails at this size' if failed else f'exponent {sum(tail) / len(tail):.2f}'})")
+    return superlinear
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Micro-benchmarks of MarkdownToHtml per markdown construct.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python Utils/benchmark_markdown.py                      # All constructs
+  python Utils/benchmark_markdown.py fences alerts_nested # Selected constructs
+  python Utils/benchmark_markdown.py --max-units 2048     # Quicker
+        """
+    )
+    parser.add_argument('constructs', nargs='*', metavar='CONSTRUCT',
+                        help=f"Constructs to benchmark (default: all): {', '.join(CONSTRUCTS)}")
+    parser.add_argument('--max-units', type=int, default=8192, help='Largest input size in units (default: 8192)')
+    parser.add_argument('--max-seconds', type=float, default=2.0,
+                        help='Stop growing a construct once one conversion takes longer (default: 2.0)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per size; the best counts (default: 3)')
+    parser.add_argument('--json', metavar='FILE', help='Also write the curves as JSON')
+    args = parser.parse_args()
+    unknown = [name for name in args.constructs if name not in CONSTRUCTS]
+    if unknown:
+        parser.error(f"unknown construct(s): {', '.join(unknown)} (choose from {', '.join(CONSTRUCTS)})")
+
+    curves = {}
+    flagged = []
+    for name in args.constructs or CONSTRUCTS:
+        curves[name] = measure(name, args.max_units, args.max_seconds, args.repeat)
+        if print_curve(name, curves[name]):
+            flagged.append(name)
+
+    print(f"\nSuperlinear constructs: {', '.join(flagged) if flagged else 'none'}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(curves, indent=2) + '\n', encoding='utf-8')
+
+
+if __name__ == "__main__":
+    main()
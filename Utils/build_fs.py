@@ -0,0 +1,356 @@
+"""
+Flowery.Uno Build Filesystem
+
+The file operations of generate_docs.py and generate_site.py behind one interface, so a
+build runs on the disk (DiskFS, the default) or in memory (MemoryFS). Tests build the
+full corpus without temp folders, and `generate_site.py --check` compares a build with
+docs/ without writing to it.
+
+Both work on absolute paths. A MemoryFS holds the files written to it and reads every
+other path from an optional base filesystem, so it can build from the real sources
+while all writes (outputs and caches) stay in memory:
+
+    fs = MemoryFS(base=DiskFS())       # Sources from disk, outputs in memory
+    fs = MemoryFS()                    # Nothing on disk: load() the sources first
+    fs.load(DiskFS(), root / "llms-static")
+
+Writes leave files that already hold the same bytes untouched (their mtime is kept on
+disk, and a MemoryFS does not copy them). changes() lists the files a MemoryFS build
+wrote with new bytes or deleted under a folder: what the build would change on the base.
+
+on_disk tells whether paths are real files, which external programs (ffmpeg, PNG
+encoders) and worker processes can open; in memory the generators do that work
+in-process or skip it.
+"""
+
+import hashlib
+import io
+import itertools
+import os
+import shutil
+import time
+from abc import ABC, abstractmethod
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import IO
+
+
+def file_sha256(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """
+    Write data atomically (temp file + rename) unless the file already holds exactly these bytes.
+    Unchanged files keep their mtime, so rsync and deploy uploads skip them. Returns True if written.
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    return True
+
+
+def replace_if_changed(tmp: Path, path: Path) -> bool:
+    """Move a fully written temp file over path, or discard it if path already has the same bytes."""
+    if path.exists() and path.stat().st_size == tmp.stat().st_size and file_sha256(path) == file_sha256(tmp):
+        tmp.unlink()
+        return False
+    tmp.replace(path)
+    return True
+
+
+class BuildFS(ABC):
+    """
+    File operations of a build on absolute paths (see the module docstring). Text is UTF-8.
+    A subclass implements the abstract methods; one that misses any cannot be created.
+    """
+
+    on_disk = False  # Paths are real files other programs can open
+
+    @abstractmethod
+    def read_bytes(self, path: Path) -> bytes:
+        raise NotImplementedError
+
+    def read_text(self, path: Path) -> str:
+        """Content of a text file, with line breaks normalized like Path.read_text()."""
+        with self.open(path) as f:
+            return f.read()
+
+    @abstractmethod
+    def open(self, path: Path, mode: str = 'r') -> IO:
+        """
+        Open a file: 'r' or 'rb' to read, 'w' or 'wb' to (over)write it. Text is written
+        without newline translation. A written file appears when it is closed.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def exists(self, path: Path) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_file(self, path: Path) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iterdir(self, folder: Path) -> list[Path]:
+        """Files and folders directly in folder, sorted."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def files(self, folder: Path) -> list[Path]:
+        """Every file under folder (at any depth), sorted."""
+        raise NotImplementedError
+
+    def glob(self, folder: Path, pattern: str) -> list[Path]:
+        """Files in folder whose name matches pattern ('*.md'), or under it at any depth for '**/' + pattern. Sorted."""
+        if not self.exists(folder):
+            return []
+        if pattern.startswith('**/'):
+            return [path for path in self.files(folder) if fnmatchcase(path.name, pattern[3:])]
+        return [path for path in self.iterdir(folder) if fnmatchcase(path.name, pattern) and self.is_file(path)]
+
+    @abstractmethod
+    def stat(self, path: Path) -> tuple[int, int]:
+        """(size, mtime_ns) of a file. Copies keep the mtime of their source."""
+        raise NotImplementedError
+
+    def size(self, path: Path) -> int:
+        return self.stat(path)[0]
+
+    def sha256(self, path: Path) -> str:
+        return hashlib.sha256(self.read_bytes(path)).hexdigest()
+
+    @abstractmethod
+    def write_bytes(self, path: Path, data: bytes) -> bool:
+        """Write data unless the file already holds exactly these bytes. Returns True if written."""
+        raise NotImplementedError
+
+    def write_text(self, path: Path, text: str) -> bool:
+        return self.write_bytes(path, text.encode('utf-8'))
+
+    @abstractmethod
+    def replace_if_changed(self, tmp: Path, path: Path) -> bool:
+        """Move a written temp file over path, or discard it if path already has the same bytes."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def copy(self, src: Path, dest: Path, link: bool = False) -> str:
+        """Replace dest with a copy of src (or a hardlink where possible). Returns 'copied' or 'linked'."""
+        raise NotImplementedError
+
+    def same_file(self, a: Path, b: Path) -> bool:
+        """True if a and b are the same file (hardlinks), not just equal content."""
+        return False
+
+    @abstractmethod
+    def unlink(self, path: Path, missing_ok: bool = False):
+        raise NotImplementedError
+
+    @abstractmethod
+    def mkdir(self, folder: Path):
+        """Create a folder and its parents (nothing if it exists)."""
+        raise NotImplementedError
+
+
+class DiskFS(BuildFS):
+    """The real filesystem."""
+
+    on_disk = True
+
+    def read_bytes(self, path: Path) -> bytes:
+        return path.read_bytes()
+
+    def read_text(self, path: Path) -> str:
+        return path.read_text(encoding='utf-8')
+
+    def open(self, path: Path, mode: str = 'r') -> IO:
+        if 'b' in mode:
+            return open(path, mode)
+        return open(path, mode, encoding='utf-8', newline='' if 'w' in mode else None)
+
+    def exists(self, path: Path) -> bool:
+        return path.exists()
+
+    def is_file(self, path: Path) -> bool:
+        return path.is_file()
+
+    def iterdir(self, folder: Path) -> list[Path]:
+        return sorted(folder.iterdir())
+
+    def files(self, folder: Path) -> list[Path]:
+        return sorted(path for path in folder.rglob("*") if path.is_file())
+
+    def stat(self, path: Path) -> tuple[int, int]:
+        stat = path.stat()
+        return stat.st_size, stat.st_mtime_ns
+
+    def sha256(self, path: Path) -> str:
+        return file_sha256(path)
+
+    def write_bytes(self, path: Path, data: bytes) -> bool:
+        return write_if_changed(path, data)
+
+    def replace_if_changed(self, tmp: Path, path: Path) -> bool:
+        return replace_if_changed(tmp, path)
+
+    def copy(self, src: Path, dest: Path, link: bool = False) -> str:
+        # Link or copy to a temp name, then rename over the old file: atomic, and
+        # never writes through a hardlink into the source folder
+        tmp = dest.with_name(dest.name + '.tmp')
+        tmp.unlink(missing_ok=True)
+        if link:
+            try:
+                os.link(src, tmp)
+                tmp.replace(dest)
+                return 'linked'
+            except OSError:
+                pass  # Different filesystem or no hardlink support - fall back to copying
+        shutil.copy2(src, tmp)
+        tmp.replace(dest)
+        return 'copied'
+
+    def same_file(self, a: Path, b: Path) -> bool:
+        return os.path.samefile(a, b)
+
+    def unlink(self, path: Path, missing_ok: bool = False):
+        path.unlink(missing_ok=missing_ok)
+
+    def mkdir(self, folder: Path):
+        folder.mkdir(parents=True, exist_ok=True)
+
+
+class _MemoryFile(io.BytesIO):
+    """A file opened for writing on a MemoryFS: stored when closed."""
+
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+
+    def close(self):
+        if not self.closed:
+            self.store(self.getvalue())
+        super().close()
+
+
+class MemoryFS(BuildFS):
+    """
+    Files in memory over an optional base filesystem (read-only): paths not written or
+    deleted here are read from the base. Not safe for two writers of one path at a time
+    (OutputWriter serializes writes per path).
+    """
+
+    def __init__(self, base: BuildFS | None = None):
+        self.base = base
+        self.contents: dict[Path, bytes] = {}  # Files written here
+        self.mtimes: dict[Path, int] = {}  # Written file -> mtime_ns (copies keep their source's)
+        self.folders: set[Path] = set()  # Folders created here or holding written files
+        self.deleted: set[Path] = set()  # Base files deleted here
+        self._clock = itertools.count(time.time_ns())
+
+    def load(self, source: BuildFS, folder: Path):
+        """Copy every file under folder from source into memory (e.g. the sources of a build)."""
+        for path in source.files(folder):
+            self._store(path, source.read_bytes(path), source.stat(path)[1])
+
+    def changes(self, folder: Path) -> tuple[list[Path], list[Path]]:
+        """(written, deleted): files under folder written with new bytes here, and base files deleted. Sorted."""
+        return (sorted(path for path in self.contents if folder in path.parents),
+                sorted(path for path in self.deleted if folder in path.parents))
+
+    def _store(self, path: Path, data: bytes, mtime: int | None = None):
+        self.contents[path] = data
+        self.mtimes[path] = next(self._clock) if mtime is None else mtime
+        self.deleted.discard(path)
+        self.folders.update(path.parents)
+
+    def _in_base(self, path: Path) -> bool:
+        return self.base is not None and path not in self.deleted
+
+    def read_bytes(self, path: Path) -> bytes:
+        if path in self.contents:
+            return self.contents[path]
+        if not self._in_base(path):
+            raise FileNotFoundError(path)
+        return self.base.read_bytes(path)
+
+    def open(self, path: Path, mode: str = 'r') -> IO:
+        if 'w' in mode:
+            file = _MemoryFile(lambda data: self._store(path, data))
+            return file if 'b' in mode else io.TextIOWrapper(file, encoding='utf-8', newline='')
+        file = io.BytesIO(self.read_bytes(path))
+        return file if 'b' in mode else io.TextIOWrapper(file, encoding='utf-8')
+
+    def exists(self, path: Path) -> bool:
+        return (path in self.contents or path in self.folders
+                or (self._in_base(path) and self.base.exists(path)))
+
+    def is_file(self, path: Path) -> bool:
+        return path in self.contents or (self._in_base(path) and self.base.is_file(path))
+
+    def iterdir(self, folder: Path) -> list[Path]:
+        children = {path for path in [*self.contents, *self.folders] if path.parent == folder and path != folder}
+        if self.base is not None and self.base.exists(folder):
+            children.update(path for path in self.base.iterdir(folder) if path not in self.deleted)
+        if not children and not self.exists(folder):
+            raise FileNotFoundError(folder)
+        return sorted(children)
+
+    def files(self, folder: Path) -> list[Path]:
+        found = {path for path in self.contents if folder in path.parents}
+        if self.base is not None and self.base.exists(folder):
+            found.update(path for path in self.base.files(folder) if path not in self.deleted)
+        return sorted(found)
+
+    def stat(self, path: Path) -> tuple[int, int]:
+        if path in self.contents:
+            return len(self.contents[path]), self.mtimes[path]
+        if not self._in_base(path):
+            raise FileNotFoundError(path)
+        return self.base.stat(path)
+
+    def sha256(self, path: Path) -> str:
+        if path in self.contents or not self._in_base(path):
+            return super().sha256(path)
+        return self.base.sha256(path)
+
+    def write_bytes(self, path: Path, data: bytes) -> bool:
+        try:
+            if self.read_bytes(path) == data:
+                return False
+        except FileNotFoundError:
+            pass
+        self._store(path, data)
+        return True
+
+    def replace_if_changed(self, tmp: Path, path: Path) -> bool:
+        data = self.contents.pop(tmp)
+        del self.mtimes[tmp]
+        return self.write_bytes(path, data)
+
+    def copy(self, src: Path, dest: Path, link: bool = False) -> str:
+        self._store(dest, self.read_bytes(src), self.stat(src)[1])
+        return 'copied'
+
+    def unlink(self, path: Path, missing_ok: bool = False):
+        if not self.is_file(path):
+            if missing_ok:
+                return
+            raise FileNotFoundError(path)
+        self.contents.pop(path, None)
+        self.mtimes.pop(path, None)
+        if self.base is not None and self.base.is_file(path):
+            self.deleted.add(path)
+
+    def mkdir(self, folder: Path):
+        self.folders.update([folder, *folder.parents])
@@ -0,0 +1,98 @@
+"""
+Flowery.Uno Build I/O
+
+Overlaps the file I/O of generate_docs.py and generate_site.py with their CPU-bound
+conversions. read_ahead() reads the next inputs on worker threads while the caller
+converts the current one; OutputWriter hands finished outputs to worker threads while
+the caller renders the next one. This matters most where every small-file open costs
+milliseconds (network and CI filesystems).
+
+Both keep the build deterministic:
+    - read_ahead yields results in input order, and a failed read raises when the
+      caller reaches that input, exactly where a sequential loop would have failed.
+    - OutputWriter writes one path at a time in submission order, and drain() returns
+      the results in submission order and raises the error of the first failed write.
+    - At most a fixed number of items are in flight, so the memory held stays bounded.
+"""
+
+import os
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any
+
+
+# Worker threads for reads and writes (they wait on the disk, not the CPU)
+IO_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+# Inputs read before the caller gets to them
+READ_AHEAD = 2 * IO_WORKERS
+
+# Outputs queued for writing before submit() waits for the oldest
+WRITE_BEHIND = 4 * IO_WORKERS
+
+
+def read_ahead(read: Callable[[Any], Any], items: Iterable, depth: int = READ_AHEAD) -> Iterator:
+    """
+    map(read, items) with up to depth reads running ahead of the caller on worker threads.
+    Results come in input order; the error of a failed read is raised at its position.
+    """
+    items = iter(items)
+    pool = ThreadPoolExecutor(max_workers=min(IO_WORKERS, depth))
+    try:
+        pending = deque(pool.submit(read, item) for item in islice(items, depth))
+        while pending:
+            future = pending.popleft()
+            for item in islice(items, 1):
+                pending.append(pool.submit(read, item))
+            yield future.result()
+    finally:
+        # Also when the caller stops early or a read failed: drop the reads not started yet
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+class OutputWriter:
+    """
+    Runs output writes on worker threads. submit() queues a write under a key (the output
+    path); writes to the same key run one after the other, in submission order. drain()
+    waits for all queued writes and returns their results by key.
+    """
+
+    def __init__(self, depth: int = WRITE_BEHIND):
+        self.depth = depth
+        self.pool: ThreadPoolExecutor | None = None
+        self.pending: deque[tuple[Hashable, Future]] = deque()  # Submission order
+        self.finished: list[tuple[Hashable, Future]] = []  # Waited for once the queue was full
+        self.latest: dict[Hashable, Future] = {}  # Last write per key
+
+    def submit(self, key: Hashable, write: Callable[..., Any], *args):
+        """Queue write(*args) under key. Waits for the oldest queued write while depth writes are pending."""
+        previous = self.latest.get(key)
+        if previous is not None:
+            wait([previous])  # Two writes to one path must not overlap (they share a temp file)
+        while len(self.pending) >= self.depth:
+            oldest = self.pending.popleft()
+            wait([oldest[1]])
+            self.finished.append(oldest)
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(max_workers=IO_WORKERS)
+        future = self.pool.submit(write, *args)
+        self.pending.append((key, future))
+        self.latest[key] = future
+
+    def drain(self) -> dict[Hashable, Any]:
+        """
+        Wait for every queued write and return key -> result in submission order (the latest
+        result for a key written twice). Raises the error of the first write that failed.
+        """
+        done, self.finished = [*self.finished, *self.pending], []
+        self.pending.clear()
+        self.latest.clear()
+        if self.pool is not None:
+            self.pool.shutdown(wait=True)
+            self.pool = None
+        results = {}
+        for key, future in done:
+            results[key] = future.result()
+        return results
@@ -4,6 +4,8 @@ import argparse
 from pathlib import Path
 from typing import Set
 
+from repo_paths import repo_root
+
 
 def load_json_keys(file_path: Path) -> Set[str]:
     """Load a JSON file and return its keys as a set."""
@@ -30,20 +32,19 @@ def find_extra_keys(reference_keys: Set[str], target_keys: Set[str]) -> Set[str]
     return target_keys - reference_keys
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Check for missing translation keys.")
     parser.add_argument("lang_code", nargs='?', default='all', help="Language code (e.g. 'de') or 'all' (default) to check all files.")
     parser.add_argument("--localization-dir", help="Path to localization directory", default=None)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Determine localization directory
     if args.localization_dir:
         localization_dir = Path(args.localization_dir)
     else:
-        # Default: relative to this script's location
-        script_dir = Path(__file__).parent
-        localization_dir = script_dir.parent / "Flowery.Uno.Gallery" / "Localization"
+        # Default: the Gallery localization folder of this repository
+        localization_dir = repo_root() / "Flowery.Uno.Gallery.Core" / "Localization"
 
     if not localization_dir.exists():
         print(f"ERROR: Localization directory not found: {localization_dir}")
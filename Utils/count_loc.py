@@ -18,6 +18,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+from repo_paths import find_sln_root
+
 
 def _strip_xml_comments(text: str) -> str:
     out: list[str] = []
@@ -223,26 +225,13 @@ def _walk_files(repo_root: Path, debug: bool = False) -> list[Path]:
     return files
 
 
-def _find_sln_root(start: Path) -> Path | None:
-    """Walk upward to find a directory containing a .sln file."""
-    current = start
-    for _ in range(10):  # Limit search depth
-        if any(current.glob("*.sln")):
-            return current
-        parent = current.parent
-        if parent == current:
-            break
-        current = parent
-    return None
-
-
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Count total LoC (no comments) for *.cs and *.xaml.")
     parser.add_argument("path", nargs="?", default=".", help="Repo root (defaults to current directory).")
     parser.add_argument("--use-git", action="store_true", help="Use git ls-files instead of walking the filesystem.")
     parser.add_argument("-v", "--verbose", action="store_true", help="Print file count and repo root info.")
     parser.add_argument("--debug", action="store_true", help="Show skipped directories.")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     start = Path(args.path).resolve()
 
@@ -251,7 +240,7 @@ def main() -> int:
     if args.use_git:
         repo_root = _try_git_root(start)
     if repo_root is None:
-        repo_root = _find_sln_root(start) or start
+        repo_root = find_sln_root(start) or start
 
     if args.verbose:
         print(f"Repo root: {repo_root}", file=__import__('sys').stderr)
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Flowery.Uno Docs Query
+
+Retrieves the best-matching sections of the curated docs (llms-static/*.md) for
+a free-text query, ranked with BM25. Meant for tooling and AI assistants that
+need Flowery.Uno documentation without crawling the generated HTML.
+
+Usage:
+    python Utils/docs_query.py "glass blur"            # Top 5 sections
+    python Utils/docs_query.py "button variant" -n 10  # Top 10 sections
+    python Utils/docs_query.py "theme" --json          # Machine-readable output
+    python Utils/docs_query.py "theme" --rebuild       # Ignore the persisted index
+
+Library use:
+    from docs_query import DocsIndex
+    index = DocsIndex.load_or_build(curated_dir, index_path)
+    for hit in index.search("glass blur"):
+        print(hit.file, hit.anchor, hit.score)
+
+The index is persisted in .cache/docs_query/index.json. On each run only markdown
+files whose size or modification time changed are re-parsed.
+
+Anchors match the heading ids on the generated site pages, e.g.
+DaisyGlass.md#blur-settings -> docs/controls/DaisyGlass.html#blur-settings.
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from markdown_source import markdown_headings, strip_html_comments_outside_code
+from repo_paths import cache_dir, repo_root
+from site_search import tokenize
+
+
+# Bump when the persisted format or tokenization changes (forces a full rebuild)
+INDEX_VERSION = 2
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Term weight of heading text and of the document name, relative to body text
+HEADING_WEIGHT = 3
+DOC_NAME_WEIGHT = 2
+
+# Characters of section text kept for result previews
+PREVIEW_LENGTH = 200
+
+# Headings that start a new section (h1-h4, matching the site generator)
+MAX_SECTION_LEVEL = 4
+
+
+@dataclass
+class SectionHit:
+    """A ranked section returned by DocsIndex.search()."""
+    file: str
+    heading: str
+    anchor: str
+    line: int
+    score: float
+    preview: str
+
+
+class DocsIndex:
+    """Persisted BM25 index over the sections of the curated markdown docs."""
+
+    def __init__(self, curated_dir: Path, files: dict[str, dict] | None = None):
+        self.curated_dir = curated_dir
+        # file name -> {'mtime_ns', 'size', 'sections': [{heading, anchor, line, preview, length, tf}]}
+        self.files: dict[str, dict] = files or {}
+        self.reparsed = 0
+        self._postings: dict[str, list[tuple[int, int]]] = {}
+        self._sections: list[tuple[str, dict]] = []
+        self._avg_length = 0.0
+
+    @classmethod
+    def load_or_build(cls, curated_dir: Path, index_path: Path, rebuild: bool = False) -> 'DocsIndex':
+        """Load the persisted index, re-parse changed files and save it again if anything changed."""
+        files = {}
+        if index_path.exists() and not rebuild:
+            try:
+                data = json.loads(index_path.read_text(encoding='utf-8'))
+                if data.get('version') == INDEX_VERSION:
+                    files = data['files']
+            except (OSError, ValueError, KeyError):
+                files = {}  # Corrupt or unreadable index - rebuild from scratch
+
+        index = cls(curated_dir, files)
+        if index.refresh():
+            index.save(index_path)
+        index._build_postings()
+        return index
+
+    def refresh(self) -> bool:
+        """Re-parse new or modified markdown files and drop deleted ones. Returns True if anything changed."""
+        changed = False
+        current = {}
+        for md_file in sorted(self.curated_dir.glob("*.md")):
+            stat = md_file.stat()
+            current[md_file.name] = md_file
+            entry = self.files.get(md_file.name)
+            if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                continue
+            self.files[md_file.name] = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'sections': self._parse_sections(md_file),
+            }
+            self.reparsed += 1
+            changed = True
+
+        for name in [name for name in self.files if name not in current]:
+            del self.files[name]
+            changed = True
+        return changed
+
+    def save(self, index_path: Path):
+        """Write the index atomically (temp file + rename)."""
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = index_path.with_name(index_path.name + '.tmp')
+        data = {'version': INDEX_VERSION, 'files': self.files}
+        tmp.write_text(json.dumps(data, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+        tmp.replace(index_path)
+
+    @property
+    def section_count(self) -> int:
+        return len(self._sections)
+
+    def search(self, query: str, limit: int = 5) -> list[SectionHit]:
+        """Return the top sections for a query, best first."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self._sections:
+            return []
+
+        total = len(self._sections)
+        scores: dict[int, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for section_id, tf in postings:
+                length = self._sections[section_id][1]['length']
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * length / self._avg_length)
+                scores[section_id] = scores.get(section_id, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        hits = []
+        for section_id, score in ranked:
+            file_name, section = self._sections[section_id]
+            hits.append(SectionHit(
+                file=file_name,
+                heading=section['heading'],
+                anchor=section['anchor'],
+                line=section['line'],
+                score=round(score, 3),
+                preview=section['preview'],
+            ))
+        return hits
+
+    def _build_postings(self):
+        """Build the in-memory inverted index from the per-section term counts."""
+        self._sections = []
+        self._postings = {}
+        for file_name in sorted(self.files):
+            for section in self.files[file_name]['sections']:
+                section_id = len(self._sections)
+                self._sections.append((file_name, section))
+                for term, tf in section['tf'].items():
+                    self._postings.setdefault(term, []).append((section_id, tf))
+        if self._sections:
+            self._avg_length = sum(s['length'] for _, s in self._sections) / len(self._sections) or 1.0
+
+    def _parse_sections(self, md_file: Path) -> list[dict]:
+        """Split a markdown file into heading-delimited sections (code fences are not split)."""
+        content = strip_html_comments_outside_code(md_file.read_text(encoding='utf-8'))
+        doc_terms = tokenize(md_file.stem)
+
+        sections = []
+        lines = content.split('\n')
+        heading, anchor, start = md_file.stem, '', 0
+
+        def flush(end: int):
+            text = '\n'.join(lines[start:end]).strip()
+            if not text and not anchor:
+                return
+            tf: dict[str, int] = {}
+            for term in tokenize(text):
+                tf[term] = tf.get(term, 0) + 1
+            for term in tokenize(heading):
+                tf[term] = tf.get(term, 0) + HEADING_WEIGHT
+            for term in doc_terms:
+                tf[term] = tf.get(term, 0) + DOC_NAME_WEIGHT
+            preview = ' '.join(text.split())
+            if len(preview) > PREVIEW_LENGTH:
+                preview = preview[:PREVIEW_LENGTH - 3].rstrip() + '...'
+            sections.append({
+                'heading': heading,
+                'anchor': anchor,
+                'line': start,  # 1-based line of the heading (0 for text before the first heading)
+                'preview': preview,
+                'length': sum(tf.values()),
+                'tf': tf,
+            })
+
+        for line_index, _, text, heading_anchor in markdown_headings(lines, MAX_SECTION_LEVEL):
+            flush(line_index)
+            heading, anchor, start = text, heading_anchor, line_index + 1
+        flush(len(lines))
+        return sections
+
+
+def main(argv: list[str] | None = None):
+    root_dir = repo_root()
+
+    parser = argparse.ArgumentParser(description="Query the curated Flowery.Uno docs (BM25 over sections).")
+    parser.add_argument("query", help="Free-text query, e.g. \"glass blur\"")
+    parser.add_argument("-n", "--limit", type=int, default=5, help="Number of sections to return (default: 5)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the index from scratch")
+    parser.add_argument("--curated-dir", default=str(root_dir / "llms-static"), help="Markdown folder to index")
+    parser.add_argument("--index", default=str(cache_dir('docs_query', root_dir) / "index.json"),
+                        help="Path of the persisted index")
+    args = parser.parse_args(argv)
+
+    curated_dir = Path(args.curated_dir)
+    if not curated_dir.exists():
+        print(f"ERROR: Docs folder not found: {curated_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    start = time.perf_counter()
+    index = DocsIndex.load_or_build(curated_dir, Path(args.index), rebuild=args.rebuild)
+    loaded = time.perf_counter()
+    hits = index.search(args.query, limit=args.limit)
+    done = time.perf_counter()
+
+    print(f"Index: {len(index.files)} files, {index.section_count} sections "
+          f"({index.reparsed} re-parsed) in {(loaded - start) * 1000:.1f} ms; "
+          f"query {(done - loaded) * 1000:.2f} ms", file=sys.stderr)
+
+    if args.json:
+        print(json.dumps([asdict(hit) for hit in hits], indent=2, ensure_ascii=False))
+        return
+
+    if not hits:
+        print("No matching sections.")
+        return
+    for rank, hit in enumerate(hits, start=1):
+        location = f"{hit.file}#{hit.anchor}" if hit.anchor else hit.file
+        print(f"{rank}. {location}  (line {hit.line}, score {hit.score})")
+        print(f"   {hit.heading}")
+        if hit.preview:
+            print(f"   {hit.preview}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ Generates markdown documentation from curated llms-static/ files.
 
 Usage:
     python Utils/generate_docs.py
+    python -m Utils docs
 
 ================================================================================
 CODE REQUIREMENTS FOR PARSING
@@ -27,12 +28,13 @@ C# CONTROL FILES (Flowery.Uno/Controls/Daisy*.cs):
 
    public static readonly DependencyProperty NAMEProperty =
 
-3. Property XML documentation must immediately precede the StyledProperty:
+3. Property XML documentation must immediately precede the CLR wrapper (or the
+   DependencyProperty field); only attributes may sit in between:
 
    /// <summary>
    /// Gets or sets the button variant (Primary, Secondary, etc.).
    /// </summary>
-   public static readonly StyledProperty<DaisyButtonVariant> VariantProperty = ...
+   public DaisyButtonVariant Variant { get => ...; set => ...; }
 
 4. Enums must be defined at namespace level with public access:
 
@@ -73,10 +75,16 @@ Example supplementary file:
 ================================================================================
 """
 
+import argparse
+import bisect
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from build_fs import BuildFS, DiskFS
+from build_io import OutputWriter, read_ahead
+from repo_paths import repo_root
+
 
 # =============================================================================
 # Configuration Constants
@@ -91,6 +99,23 @@ MAX_DESCRIPTION_LENGTH = 80       # Property description in tables
 MAX_LLMS_DESC_LENGTH = 50         # Description in llms.txt overview
 MAX_PROPS_IN_OVERVIEW = 3         # Number of properties listed in overview
 
+# Parser patterns, compiled once (patterns built per property overflow the re module cache)
+REGISTRATION_PATTERN = re.compile(   # public static readonly DependencyProperty NameProperty = ...Register(
+    r'public\s+(?:new\s+)?static\s+(?:new\s+)?readonly\s+DependencyProperty\s+(\w+)Property\s*=\s*'
+    r'DependencyProperty\.Register\s*\(',
+    re.DOTALL
+)
+CLR_PROPERTY_PATTERN = re.compile(   # public Type Name { ... } or public Type Name => ...
+    r'public\s+(?:new\s+|override\s+|virtual\s+)*[\w<>?,.\[\] ]+?\s+(\w+)\s*(?:\{|=>)'
+)
+CALL_TOKEN_PATTERN = re.compile(     # String literal, unterminated quote, bracket or comma
+    r'"(?:\\.|[^"\\])*"|"|[()\[\]{},]'
+)
+TYPEOF_PATTERN = re.compile(r'typeof\((.+)\)')
+METADATA_PATTERN = re.compile(r'new\s+PropertyMetadata\s*\(')
+SUMMARY_PATTERN = re.compile(r'<summary>(.*?)</summary>', re.DOTALL)
+XML_TAG_PATTERN = re.compile(r'</?\w+[^>]*>')
+
 
 @dataclass
 class EnumInfo:
@@ -126,9 +151,10 @@ class ControlInfo:
 class CSharpParser:
     """Parses C# control files to extract metadata."""
 
-    def parse_file(self, filepath: Path) -> ControlInfo | None:
-        """Parse a C# control file and extract metadata."""
-        content = filepath.read_text(encoding='utf-8')
+    def parse_file(self, filepath: Path, content: str | None = None) -> ControlInfo | None:
+        """Parse a C# control file (or its already read content) and extract metadata."""
+        if content is None:
+            content = filepath.read_text(encoding='utf-8')
 
         # Get target class name from filename
         target_name = filepath.stem
@@ -152,28 +178,37 @@ class CSharpParser:
             enums=enums
         )
 
+    def parse_members(self, content: str) -> tuple[dict[str, list[PropertyInfo]], list[EnumInfo]]:
+        """
+        Dependency properties by owner class (the typeof() owner of the registration, so the
+        parts of a partial class can be merged) and enums of any C# file.
+        """
+        members: dict[str, list[PropertyInfo]] = {}
+        for owner, prop in self._extract_registrations(content):
+            members.setdefault(owner, []).append(prop)
+        return members, self._extract_enums(content)
+
     def _extract_enums(self, content: str) -> list[EnumInfo]:
-        """Extract all enum definitions from the file."""
+        """Extract all enum definitions from the file, with their summaries."""
         enums = []
         enum_pattern = re.compile(
-            r'public\s+enum\s+(\w+)\s*\{([^}]+)\}',
+            r'public\s+enum\s+(\w+)\s*(?::\s*\w+\s*)?\{([^}]*)\}',
             re.DOTALL
         )
 
         for match in enum_pattern.finditer(content):
             name = match.group(1)
-            values_block = match.group(2)
-            # Extract enum values (handle both simple and attributed enums)
+            # Drop comments and attributes, then one member per comma ("Value = 0" keeps "Value")
+            values_block = re.sub(r'//[^\n]*|/\*.*?\*/', '', match.group(2), flags=re.DOTALL)
+            values_block = re.sub(r'\[[^\]]*\]', '', values_block)
             values = []
-            for line in values_block.split('\n'):
-                line = line.strip().rstrip(',')
-                if line and not line.startswith('//') and not line.startswith('['):
-                    # Handle "Value = 0" pattern
-                    value = line.split('=')[0].strip()
-                    if value and value[0].isupper():
-                        values.append(value)
+            for member in values_block.split(','):
+                value = member.split('=')[0].strip()
+                if re.fullmatch(r'[A-Za-z_]\w*', value):
+                    values.append(value)
             if values:
-                enums.append(EnumInfo(name=name, values=values))
+                enums.append(EnumInfo(name=name, values=values,
+                                      description=self._doc_summary_before(content, match.start())))
 
         return enums
 
@@ -217,65 +252,105 @@ class CSharpParser:
         return class_name, base_class, description
 
     def _extract_properties(self, content: str) -> list[PropertyInfo]:
-        """Extract all StyledProperty definitions."""
+        """Extract all DependencyProperty definitions."""
+        return [prop for _, prop in self._extract_registrations(content)]
+
+    def _extract_registrations(self, content: str) -> list[tuple[str, PropertyInfo]]:
+        """(owner class, property) of every DependencyProperty.Register call, in source order."""
         properties = []
 
-        # Pattern for DependencyProperty.Register (Uno/WinUI style)
-        prop_pattern = re.compile(
-            r'public\s+static\s+readonly\s+DependencyProperty\s+(\w+)Property\s*=\s*'
-            r'DependencyProperty\.Register\s*\([^)]+\)',
-            re.DOTALL
-        )
+        # Start of every CLR property declaration by name, collected in one pass over the file
+        wrappers: dict[str, list[int]] = {}
+        for wrapper_match in CLR_PROPERTY_PATTERN.finditer(content):
+            wrappers.setdefault(wrapper_match.group(1), []).append(wrapper_match.start())
 
-        for match in prop_pattern.finditer(content):
+        for match in REGISTRATION_PATTERN.finditer(content):
             prop_name = match.group(1)
-            block = match.group(0)
-
-            # Get property type from the register call
-            type_match = re.search(r'typeof\(([^)]+)\)', block)
-            prop_type = type_match.group(1) if type_match else "object"
-
-            # Get default value
-            default = self._extract_default(block, prop_type)
-
-            # Look for summary comment before property
-            prop_start = match.start()
-            before_prop = content[max(0, prop_start - 500):prop_start]
-
-            description = ""
-            summary_pattern = re.compile(
-                r'///\s*<summary>\s*(.*?)\s*///\s*</summary>',
-                re.DOTALL
-            )
-
-            # Find the last summary in the search area
-            for summary_match in summary_pattern.finditer(before_prop):
-                description = self._clean_summary(summary_match.group(1))
-
-            properties.append(PropertyInfo(
+            # Register(name, typeof(Type), typeof(Owner), new PropertyMetadata(default, ...))
+            args = self._call_arguments(content, match.end())
+            type_match = TYPEOF_PATTERN.fullmatch(args[1]) if len(args) > 1 else None
+            prop_type = type_match.group(1).strip() if type_match else "object"
+            owner_match = re.fullmatch(r'typeof\((\w+)\)', args[2]) if len(args) > 2 else None
+            owner = owner_match.group(1) if owner_match else ""
+
+            default = self._extract_default(args[3] if len(args) > 3 else "", prop_type)
+
+            # The summary sits above the CLR wrapper (public Type Name { get; set; }) or above the field
+            # (the first declaration of that name after the registration)
+            starts = wrappers.get(prop_name, [])
+            index = bisect.bisect_left(starts, match.end())
+            description = self._doc_summary_before(content, starts[index]) if index < len(starts) else ""
+            if not description:
+                description = self._doc_summary_before(content, match.start())
+
+            properties.append((owner, PropertyInfo(
                 name=prop_name,
                 prop_type=prop_type,
                 default=default,
                 description=description
-            ))
+            )))
 
         return properties
 
-    def _extract_default(self, block: str, prop_type: str) -> str:
-        """Extract default value from property registration block."""
-        # Look for PropertyMetadata with default value
-        default_patterns = [
-            r'new\s+PropertyMetadata\s*\(\s*([^,)]+)',  # PropertyMetadata(default, ...)
-            r'defaultValue:\s*([^,)]+)',  # Named parameter
-        ]
-
-        for pattern in default_patterns:
-            match = re.search(pattern, block)
-            if match:
-                return self._clean_default(match.group(1).strip(), prop_type)
+    def _call_arguments(self, content: str, start: int) -> list[str]:
+        """Top-level arguments of the call whose '(' ends just before start (nested calls and strings kept whole)."""
+        args = []
+        depth = 0
+        current = start
+        for token in CALL_TOKEN_PATTERN.finditer(content, start):
+            char = token.group()
+            if char == '"':
+                break  # Unterminated string
+            elif char in '([{':
+                depth += 1
+            elif char in ')]}':
+                if depth == 0:
+                    args.append(content[current:token.start()])
+                    break
+                depth -= 1
+            elif char == ',' and depth == 0:
+                args.append(content[current:token.start()])
+                current = token.end()
+        return [' '.join(arg.split()) for arg in args]
+
+    def _extract_default(self, metadata: str, prop_type: str) -> str:
+        """Extract the default value from the PropertyMetadata argument of a registration."""
+        match = METADATA_PATTERN.match(metadata)
+        if match:
+            args = self._call_arguments(metadata, match.end())
+            if args:
+                return self._clean_default(args[0], prop_type)
+        match = re.search(r'defaultValue:\s*([^,)]+)', metadata)  # Named parameter
+        if match:
+            return self._clean_default(match.group(1).strip(), prop_type)
 
         return "-"
 
+    def _doc_summary_before(self, content: str, pos: int) -> str:
+        """
+        The <summary> of the XML doc comment directly above the line at pos (attribute lines
+        may sit in between), as plain text. '' if the line has no doc comment.
+        """
+        doc: list[str] = []
+        end = content.rfind('\n', 0, pos)
+        while end > 0:
+            start = content.rfind('\n', 0, end) + 1
+            line = content[start:end].strip()
+            if line.startswith('///'):
+                doc.append(line[3:])
+            elif doc or not line.startswith('['):
+                break
+            end = start - 1
+        match = SUMMARY_PATTERN.search('\n'.join(reversed(doc)))
+        if not match:
+            return ""
+        text = match.group(1)
+        if '<' in text:
+            text = re.sub(r'<(?:see|seealso)\s+\w+="(?:\w:)?([^"]+)"\s*/>', lambda m: m.group(1).split('.')[-1], text)
+            text = re.sub(r'<paramref\s+name="([^"]+)"\s*/>', r'\1', text)
+            text = XML_TAG_PATTERN.sub('', text)
+        return self._clean_summary(text)
+
     def _clean_summary(self, text: str) -> str:
         """Clean XML documentation text."""
         # Remove /// prefixes and extra whitespace
@@ -300,10 +375,17 @@ class CSharpParser:
         if 'Color.FromArgb' in default:
             return "Color(semitransparent)"
         if 'Colors.' in default:
-            return default.replace('Colors.', '')
-        # Enum defaults
-        if '.' in default:
-            return default.split('.')[-1]
+            return re.sub(r'^(?:[\w.]*\.)?Colors\.', '', default)
+        # Localized strings: the fallback text
+        localized = re.fullmatch(r'\w+\.GetString\w*\(\s*"[^"]*",\s*("[^"]*")\s*\)', default)
+        if localized:
+            return localized.group(1)
+        if default == 'string.Empty':
+            return '""'
+        # Enum defaults (DaisySize.Medium -> Medium); other members keep their type (TimeSpan.Zero)
+        enum_match = re.fullmatch(r'([\w.]+)\.(\w+)', default)
+        if enum_match and enum_match.group(1).split('.')[-1] == prop_type.rstrip('?'):
+            return enum_match.group(2)
         return default
 
 
@@ -314,17 +396,22 @@ class CSharpParser:
 class MarkdownGenerator:
     """Generates markdown documentation files."""
 
-    def __init__(self, extras_dir: Path | None = None):
-        """Initialize with optional supplementary docs directory."""
+    def __init__(self, extras_dir: Path | None = None, fs: BuildFS | None = None):
+        """Initialize with optional supplementary docs directory, read through fs (default: the disk)."""
         self.extras_dir = extras_dir
+        self.fs = fs or DiskFS()
+        # .png names in extras_dir/images, and those named Control(Description).png by control name.
+        # Listed on first use, once for all controls (a lookup per control grows with the folder).
+        self.image_names: set[str] | None = None
+        self.described_images: dict[str, list[str]] = {}
 
     def _load_extra(self, control_name: str) -> str:
         """Load supplementary documentation for a control if it exists."""
         if not self.extras_dir:
             return ""
         extra_file = self.extras_dir / f"{control_name}.md"
-        if extra_file.exists():
-            content = extra_file.read_text(encoding='utf-8')
+        if self.fs.exists(extra_file):
+            content = self.fs.read_text(extra_file)
             # Remove HTML comments ONLY outside code blocks (metadata comments)
             content = self._strip_html_comments_outside_code(content)
             # Demote "# Overview" to "## Overview" since we add "# ControlName" header
@@ -380,36 +467,42 @@ class MarkdownGenerator:
         if not self.extras_dir:
             return []
 
-        images_dir = self.extras_dir / "images"
-        if not images_dir.exists():
-            return []
+        if self.image_names is None:
+            self._list_images()
 
         found_images = []
 
         # Check for single image (exact match)
-        single_image = images_dir / f"{control_name}.png"
-        if single_image.exists():
+        if f"{control_name}.png" in self.image_names:
             found_images.append(f"images/{control_name}.png")
 
         # Check for chunked images (_a, _b, _c, etc.)
         for suffix in 'abcdefghij':
-            chunk_image = images_dir / f"{control_name}_{suffix}.png"
-            if chunk_image.exists():
+            if f"{control_name}_{suffix}.png" in self.image_names:
                 found_images.append(f"images/{control_name}_{suffix}.png")
 
         # Check for descriptive suffix images: ControlName(Description).png
         # e.g., DaisyGlass(BitmapCaptureMode).png or Mockup(Window).png
         short_name = control_name.replace('Daisy', '')  # "Mockup" from "DaisyMockup"
-        for img_file in sorted(images_dir.glob("*.png")):
-            fname = img_file.name
-            # Match patterns like "Mockup(something).png" or "DaisyMockup(something).png"
-            if (fname.startswith(f"{short_name}(") or fname.startswith(f"{control_name}(")) and fname.endswith(").png"):
-                rel_path = f"images/{fname}"
-                if rel_path not in found_images:
-                    found_images.append(rel_path)
+        described = self.described_images.get(short_name, []) + self.described_images.get(control_name, [])
+        for fname in sorted(described):
+            rel_path = f"images/{fname}"
+            if rel_path not in found_images:
+                found_images.append(rel_path)
 
         return found_images
 
+    def _list_images(self):
+        """List extras_dir/images once (image_names and described_images)."""
+        described: dict[str, list[str]] = {}
+        names = [path.name for path in self.fs.glob(self.extras_dir / "images", "*.png")]
+        for fname in names:
+            # "Mockup(something).png" or "DaisyMockup(something).png" -> "Mockup" / "DaisyMockup"
+            if '(' in fname and fname.endswith(").png"):
+                described.setdefault(fname.split('(', 1)[0], []).append(fname)
+        self.described_images = described
+        self.image_names = set(names)  # Set last: a read-ahead thread that sees it also sees described_images
+
     def generate_control_doc(self, control: ControlInfo) -> str:
         """Generate markdown documentation for a control."""
         lines = []
@@ -564,14 +657,17 @@ class MarkdownGenerator:
 class DocumentationGenerator:
     """Main documentation generator that orchestrates parsing and output."""
 
-    def __init__(self, root_dir: Path):
+    def __init__(self, root_dir: Path, fs: BuildFS | None = None):
         self.root_dir = root_dir
+        self.fs = fs or DiskFS()  # Sources are read and docs written through it (MemoryFS: in memory)
         self.controls_dir = root_dir / "Flowery.Uno" / "Controls"
         self.output_dir = root_dir / "llms"
         self.supplementary_dir = root_dir / "llms-static"
 
         self.csharp_parser = CSharpParser()
-        self.md_generator = MarkdownGenerator(extras_dir=self.supplementary_dir)
+        self.md_generator = MarkdownGenerator(extras_dir=self.supplementary_dir, fs=self.fs)
+        self.writer = OutputWriter()  # Writes the docs on worker threads while the next ones are generated
+        self.outputs: dict[Path, str] = {}  # Written doc path -> content, for a site build in the same process
 
     def generate(self):
         """Generate all documentation."""
@@ -580,9 +676,8 @@ class DocumentationGenerator:
         print("Mode: CURATED (llms-static/)")
 
         # Create output directories
-        self.output_dir.mkdir(exist_ok=True)
-        (self.output_dir / "controls").mkdir(exist_ok=True)
-        (self.output_dir / "categories").mkdir(exist_ok=True)
+        for folder in ("controls", "categories"):
+            self.fs.mkdir(self.output_dir / folder)
 
         # Parse all controls
         print("\n[1/3] Parsing C# control files...")
@@ -592,22 +687,26 @@ class DocumentationGenerator:
         # Generate per-control docs
         print("\n[2/3] Generating control documentation...")
         extras_count = 0
-        for control in controls:
-            doc = self.md_generator.generate_control_doc(control)
+        # Docs are assembled on the read-ahead threads: that is mostly looking up the curated
+        # doc and the images of each control
+        for control, doc in zip(controls, read_ahead(self.md_generator.generate_control_doc, controls)):
             output_path = self.output_dir / "controls" / f"{control.name}.md"
-            output_path.write_text(doc, encoding='utf-8')
+            self.writer.submit(output_path, self.fs.write_text, output_path, doc)
+            self.outputs[output_path] = doc
             # Check if supplementary docs were merged
-            if self.supplementary_dir.exists():
+            if self.fs.exists(self.supplementary_dir):
                 extra_file = self.supplementary_dir / f"{control.name}.md"
-                if extra_file.exists():
+                if self.fs.exists(extra_file):
                     extras_count += 1
+        self.writer.drain()
         print(f"      Generated {len(controls)} control docs")
         print(f"      Used {extras_count} curated docs from llms-static/")
 
         # Generate master index
         print("\n[3/3] Generating index documentation...")
         master_doc = self.md_generator.generate_master_index(controls)
-        (self.output_dir / "llms.txt").write_text(master_doc, encoding='utf-8')
+        self.fs.write_text(self.output_dir / "llms.txt", master_doc)
+        self.outputs[self.output_dir / "llms.txt"] = master_doc
 
         print("\n" + "=" * 40)
         print("Documentation generated successfully!")
@@ -616,25 +715,24 @@ class DocumentationGenerator:
     def _parse_all_controls(self) -> list[ControlInfo]:
         """Parse all C# control files, including those in subfolders."""
         controls = []
-        # Search recursively in Controls folder and all subfolders
-        for filepath in self.controls_dir.glob("**/Daisy*.cs"):
-            if "Converter" in filepath.name:
-                continue
-            control = self.csharp_parser.parse_file(filepath)
+        # Search recursively in Controls folder and all subfolders (read ahead while parsing)
+        paths = [filepath for filepath in self.fs.glob(self.controls_dir, "**/Daisy*.cs") if "Converter" not in filepath.name]
+        for filepath, content in zip(paths, read_ahead(self.fs.read_text, paths)):
+            control = self.csharp_parser.parse_file(filepath, content)
             if control:
                 controls.append(control)
         return controls
 
 
-def main():
-    """Main entry point."""
+def main(argv: list[str] | None = None) -> DocumentationGenerator:
+    """Main entry point. Returns the generator (python -m Utils all hands its outputs to the site build)."""
+    parser = argparse.ArgumentParser(description="Generate llms/ from the C# controls and the curated docs.")
+    parser.parse_args(argv)
     print("Running Flowery.Uno Documentation Generator...")
 
-    script_dir = Path(__file__).parent
-    root_dir = script_dir.parent
-
-    generator = DocumentationGenerator(root_dir)
+    generator = DocumentationGenerator(repo_root())
     generator.generate()
+    return generator
 
 
 if __name__ == "__main__":
@@ -7,6 +7,10 @@ Converts markdown documentation into a static HTML website for GitHub Pages.
 Usage:
     python Utils/generate_site.py                # Use curated llms-static/ only (default)
     python Utils/generate_site.py --use-generated # Use llms/ (auto-generated) docs
+    python Utils/generate_site.py --link          # Hardlink images instead of copying
+    python Utils/generate_site.py --prune-images  # Skip images no page references
+    python Utils/generate_site.py --diff-against deployed-manifest.json  # List files a deploy must upload
+    python Utils/generate_site.py --check         # Build in memory, list the outputs that differ from docs/
 
 Input (markdown):
     Default mode (curated):
@@ -22,7 +26,9 @@ Output (HTML):
     docs/index.html          - Main landing page
     docs/controls/*.html     - Per-control pages
     docs/categories/*.html   - Category pages
-    docs/style.css           - Stylesheet
+    docs/assets/             - Stylesheet and scripts, with content hashes in their names
+    docs/asset-manifest.json - Logical asset/image name -> fingerprinted output path
+    docs/build-manifest.json - Every output path -> sha256, for deploy diffs
     docs/llms.txt            - Machine-readable docs for AI assistants
 
 GitHub Pages Setup:
@@ -34,49 +40,294 @@ GitHub Pages Setup:
 """
 
 import argparse
+import gzip
+import hashlib
+import io
+import itertools
+import json
 import re
 import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from build_fs import BuildFS, DiskFS, MemoryFS, write_if_changed
+from build_io import IO_WORKERS, OutputWriter, read_ahead
+from markdown_source import markdown_headings, slugify_heading, strip_html_comments_outside_code, unique_anchor
+from repo_paths import cache_dir, repo_root
+from site_api import ApiReference
+from site_css import CRITICAL_CONTENT_CHARS, SiteStylesheet, markup_tokens
+from site_html import HtmlPartCounter, PageBudgets, StreamMinifier, load_budgets, minify_html
+from site_search import SearchIndexBuilder
 
-def strip_html_comments_outside_code(content: str) -> str:
+try:
+    from PIL import Image  # Optional: only needed for responsive image variants
+except ImportError:
+    Image = None
+
+try:
+    import brotli  # Optional: .br files are only written when available
+except ImportError:
+    brotli = None
+
+
+# Image file types copied from llms-static/ to docs/images/
+IMAGE_EXTENSIONS = ('.gif', '.png', '.jpg', '.jpeg', '.webp', '.svg')
+
+# Matches image references (src/href/srcset) in generated pages, e.g. "../images/DaisyButton.png"
+IMAGE_REF_PATTERN = re.compile(r'images/([^"\'\s,?#<>]+)')
+
+# Indexed images a page embeds with <img src> (not links or srcset candidates), for page weights
+EMBEDDED_IMAGE_PATTERN = re.compile(r'<img\b[^>]*?\bsrc=["\'](?:\.\./)*images/([^"\']+)["\']')
+
+# Rough token estimate for the llms-full.txt offset index (bytes per token)
+BYTES_PER_TOKEN = 4
+
+LLMS_FULL_HEADER = (
+    "# Flowery.Uno Full Documentation\n\n"
+    "All curated Flowery.Uno docs in one file. See llms.txt for the overview and\n"
+    "llms-full.index.json for the byte range of each doc and section.\n\n"
+).encode('utf-8')
+
+# Widths of downscaled image variants offered through srcset (only those narrower than the source)
+RESPONSIVE_WIDTHS = (480, 800)
+
+# Raster formats that can be downscaled into responsive variants
+RESPONSIVE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# Display size hint for srcset: .doc-image is capped at 800px, full width on mobile
+RESPONSIVE_SIZES = '(max-width: 768px) 100vw, 800px'
+
+# Animated formats transcoded to animated WebP (Pillow) and muted looping MP4 (ffmpeg, if installed)
+ANIMATION_EXTENSIONS = ('.gif',)
+ANIMATED_WEBP_QUALITY = 80
+VIDEO_CRF = 28  # x264 quality: lower is better and larger
+
+# Lossless PNG encoders in order of preference, used when installed: command with {src} and {dest}.
+# Without any of them PNGs are re-deflated with zlib (recompress_png).
+PNG_ENCODERS = {
+    'oxipng': ['oxipng', '--quiet', '-o', '4', '--strip', 'safe', '--out', '{dest}', '{src}'],
+    'optipng': ['optipng', '-quiet', '-o2', '-strip', 'all', '-out', '{dest}', '{src}'],
+}
+
+# PNG chunks kept by recompress_png: image data, transparency, color management and APNG frames.
+# Everything else (tEXt/zTXt/iTXt, tIME, eXIf, pHYs, ...) is metadata browsers do not need.
+PNG_KEEP_CHUNKS = {b'IHDR', b'PLTE', b'tRNS', b'IDAT', b'IEND', b'cHRM', b'gAMA', b'iCCP', b'sBIT', b'sRGB',
+                   b'cICP', b'acTL', b'fcTL', b'fdAT'}
+
+# Text outputs that get precompressed .gz/.br siblings (for hosts serving precompressed files)
+COMPRESS_EXTENSIONS = ('.html', '.css', '.js', '.txt', '.md', '.json', '.svg')
+
+# Shared scripts: logical name -> template next to this script. Written to docs/assets/ with a
+# content hash in the file name (e.g. assets/shell.1a2b3c4d.js), like the stylesheets split
+# from site_template.css (site_css.py).
+ASSET_TEMPLATES = {
+    'content.js': 'site_content.js',
+    'shell.js': 'site_shell.js',
+    'search.js': 'site_search.js',
+    'nav.js': 'site_nav.js',
+}
+
+# Render-blocking link to a context stylesheet, replaced by critical CSS and an async load
+STYLESHEET_LINK_PATTERN = re.compile(r'<link rel="stylesheet" href="((?:\.\./)*assets/(shell|content|page)\.[0-9a-f]+\.css)">')
+
+# <link rel="prefetch|preload"> tags of a page (for the resource hint report; not the async stylesheet)
+RESOURCE_HINT_PATTERN = re.compile(r'<link rel="(prefetch|preload)"(?![^>]*as="style")[^>]*?\bhref="([^"]+)"')
+
+# Hex digits of the content hash used in fingerprinted file names
+FINGERPRINT_LENGTH = 8
+
+# Smaller files are not worth compressing (gzip overhead, one TCP packet anyway)
+COMPRESS_MIN_SIZE = 1024
+
+# Streaming build: markup above the fold is held in memory up to this size while the critical CSS
+# of a page is worked out, and spooled to a temp file beyond it (pages with very long sidebars)
+PAGE_SPOOL_SIZE = 1 << 20
+
+# Images up to this size are precached by the service worker; larger screenshots are cached on first use
+PRECACHE_MAX_IMAGE_SIZE = 50 * 1024
+
+# Site layouts (--shell): every page carries the sidebar and navigates in place (site_nav.js),
+# or index.html holds the sidebar and shows the pages in an iframe
+SHELL_MODES = ('pages', 'iframe')
+
+
+def split_duplicates(items: list[tuple[str, dict]]) -> tuple[list[tuple[str, dict]], list[tuple[str, dict]]]:
     """
-    Remove HTML comments (<!-- ... -->) but preserve them inside code blocks.
-    Code blocks are delimited by ``` markers.
+    Split (name, indexed image) pairs into the first pair per content hash and the rest. Cache entries
+    are keyed by hash, so only the first ones may be built concurrently.
     """
-    result = []
-    in_code_block = False
-    lines = content.split('\n')
-
-    for line in lines:
-        # Check for code block delimiter
-        if line.strip().startswith('```'):
-            in_code_block = not in_code_block
-            result.append(line)
-            continue
-
-        if in_code_block:
-            # Inside code block - preserve everything including comments
-            result.append(line)
-        else:
-            # Outside code block - strip HTML comments
-            cleaned = re.sub(r'<!--.*?-->', '', line)
-            # Only add non-empty lines (or preserve intentional blank lines)
-            if cleaned.strip() or not line.strip():
-                result.append(cleaned)
+    seen: set[str] = set()
+    unique, duplicates = [], []
+    for item in items:
+        (duplicates if item[1]['hash'] in seen else unique).append(item)
+        seen.add(item[1]['hash'])
+    return unique, duplicates
+
+
+def fingerprinted_name(name: str, digest: str) -> str:
+    """Insert a content hash before the extension: DaisyButton.png -> DaisyButton.1a2b3c4d.png."""
+    stem, dot, ext = name.rpartition('.')
+    if not dot:
+        return f"{name}.{digest[:FINGERPRINT_LENGTH]}"
+    return f"{stem}.{digest[:FINGERPRINT_LENGTH]}.{ext}"
+
+
+def compress_data(data: bytes) -> dict[str, bytes]:
+    """
+    Deterministic precompressed copies of a file's content by suffix: '.gz', and '.br' when brotli is available.
+    Runs in a worker process.
+    """
+    outputs = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        outputs['.br'] = brotli.compress(data, quality=11)
+    return outputs
+
+
+def write_compressed(fs: BuildFS, path: Path, outputs: dict[str, bytes]) -> tuple[int, int | None]:
+    """Write the compressed copies of a file (compress_data) next to it. Returns their sizes (br is None without brotli)."""
+    for suffix, compressed in outputs.items():
+        fs.write_bytes(path.with_name(path.name + suffix), compressed)
+    return len(outputs['.gz']), len(outputs['.br']) if '.br' in outputs else None
+
+
+def compress_file(path: Path) -> tuple[int, int | None]:
+    """Write path.gz (and path.br) next to a file on disk, atomically. Runs in a worker process."""
+    return write_compressed(DiskFS(), path, compress_data(path.read_bytes()))
+
 
-    return '\n'.join(result)
+def png_encoder() -> str:
+    """Name of the best installed PNG encoder (see PNG_ENCODERS), or 'zlib'."""
+    return next((name for name in PNG_ENCODERS if shutil.which(name)), 'zlib')
+
+
+def recompress_png(data: bytes) -> bytes:
+    """
+    Re-deflate the image data of a PNG at the highest zlib settings and drop metadata chunks.
+    Pixels and scanline filters are unchanged; the original data is kept if it is smaller.
+    """
+    chunks: list[tuple[bytes, bytes]] = []
+    idat: list[bytes] = []
+    pos = 8
+    while pos < len(data):
+        length, kind = struct.unpack('>I4s', data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if kind == b'IDAT':
+            if not idat:
+                chunks.append((kind, b''))  # Placeholder for the merged image data
+            idat.append(body)
+        elif kind in PNG_KEEP_CHUNKS:
+            chunks.append((kind, body))
+
+    original = b''.join(idat)
+    raw = zlib.decompress(original)
+    candidates = [original]
+    for strategy in (zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED):
+        compressor = zlib.compressobj(9, zlib.DEFLATED, 15, 9, strategy)
+        candidates.append(compressor.compress(raw) + compressor.flush())
+    image_data = min(candidates, key=len)
+
+    out = [data[:8]]
+    for kind, body in chunks:
+        if kind == b'IDAT':
+            body = image_data
+        out.append(struct.pack('>I4s', len(body), kind) + body
+                   + struct.pack('>I', zlib.crc32(kind + body) & 0xffffffff))
+    return b''.join(out)
+
+
+def optimize_png(src: Path, dest: Path, encoder: str) -> int:
+    """
+    Losslessly recompress a PNG into dest with an encoder from PNG_ENCODERS (or 'zlib'), without metadata.
+    Runs in a worker process. Returns the size of dest.
+    """
+    if encoder == 'zlib':
+        write_if_changed(dest, recompress_png(src.read_bytes()))
+    else:
+        tmp = dest.with_name(dest.name + '.tmp')
+        tmp.unlink(missing_ok=True)
+        command = [arg.format(src=src, dest=tmp) for arg in PNG_ENCODERS[encoder]]
+        subprocess.run(command, check=True, capture_output=True)
+        tmp.replace(dest)
+    return dest.stat().st_size
+
+
+def read_image_size(data: bytes) -> tuple[int, int] | None:
+    """
+    Read (width, height) from the header of PNG, GIF, JPEG or WebP file content.
+    Returns None for other formats (e.g. SVG) or unreadable headers.
+    """
+    if data.startswith(b'\x89PNG\r\n\x1a\n') and data[12:16] == b'IHDR':
+        return struct.unpack('>II', data[16:24])
+    if data[:6] in (b'GIF87a', b'GIF89a'):
+        return struct.unpack('<HH', data[6:10])
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        chunk = data[12:16]
+        if chunk == b'VP8 ':
+            width, height = struct.unpack('<HH', data[26:30])
+            return width & 0x3FFF, height & 0x3FFF
+        if chunk == b'VP8L':
+            bits = int.from_bytes(data[21:25], 'little')
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        if chunk == b'VP8X':
+            return int.from_bytes(data[24:27], 'little') + 1, int.from_bytes(data[27:30], 'little') + 1
+        return None
+    if data[:2] == b'\xff\xd8':
+        # Walk JPEG segments until a start-of-frame marker
+        pos = 2
+        while pos + 9 <= len(data) and data[pos] == 0xFF:
+            marker = data[pos + 1]
+            length = struct.unpack('>H', data[pos + 2:pos + 4])[0]
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack('>HH', data[pos + 5:pos + 9])
+                return width, height
+            pos += 2 + length
+    return None
+
+
+def read_lines(fs: BuildFS, path: Path) -> Iterator[str]:
+    """The lines of a text file without line breaks, like read_text().split('\\n'), one at a time."""
+    with fs.open(path) as f:
+        line = ''
+        for line in f:
+            yield line.removesuffix('\n')
+        if not line or line.endswith('\n'):
+            yield ''
+
+
+def join_lines(lines: Iterable[str]) -> Iterator[str]:
+    """'\\n'.join(lines), piece by piece."""
+    for i, line in enumerate(lines):
+        yield '\n' + line if i else line
+
+
+def first_description_line(md_content: str) -> str | None:
+    """First line of plain text (not a heading, table, list item or HTML), used as a short description."""
+    for line in md_content.split('\n'):
+        line = line.strip()
+        if line and not line.startswith('#') and not line.startswith('|') and not line.startswith('-') and not line.startswith('<'):
+            return line
+    return None
 
 
 class MarkdownToHtml:
     """Simple markdown to HTML converter."""
 
-    def convert(self, markdown: str, depth: int = 1) -> str:
+    def convert(self, markdown: str, depth: int = 1, anchors: dict[str, int] | None = None) -> str:
         """Convert markdown to HTML.
         
         Args:
             markdown: Markdown content to convert
             depth: Page depth (0 = root/docs/, 1 = docs/controls/ or docs/categories/)
+            anchors: Heading anchors already used on the page (convert_blocks shares them across blocks)
         """
         html = markdown
         path_prefix = '../' * depth  # '' for depth=0, '../' for depth=1
@@ -121,11 +372,14 @@ class MarkdownToHtml:
         # Horizontal rules (---, ***, ___)
         html = re.sub(r'^[\s]*[-*_]{3,}[\s]*$', r'<hr>', html, flags=re.MULTILINE)
 
-        # Headers (process from most to least specific to avoid partial matches)
-        html = re.sub(r'^#### (.+)$', r'<h4>\1</h4>', html, flags=re.MULTILINE)
-        html = re.sub(r'^### (.+)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-        html = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-        html = re.sub(r'^# (.+)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
+        # Headers (h1-h4) with GitHub-style anchors, so sections can be linked directly
+        used_anchors = {} if anchors is None else anchors
+        def convert_heading(m):
+            level = len(m.group(1))
+            text = m.group(2)
+            anchor = unique_anchor(slugify_heading(text), used_anchors)
+            return f'<h{level} id="{anchor}">{text}</h{level}>'
+        html = re.sub(r'^(#{1,4}) (.+)$', convert_heading, html, flags=re.MULTILINE)
 
         # Bold and italic
         html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
@@ -174,6 +428,26 @@ class MarkdownToHtml:
 
         return html
 
+    def convert_blocks(self, lines: Iterable[str], depth: int = 1) -> Iterator[str]:
+        """
+        Convert markdown lines (without line breaks) block by block, for the streaming build.
+        A block ends at a blank line outside code fences, so every regex pass of convert() only
+        copies one block. Heading anchors stay unique across blocks. The joined chunks differ
+        from convert() at most in the whitespace between blocks.
+        """
+        anchors: dict[str, int] = {}
+        block: list[str] = []
+        in_code_block = False
+        for line in lines:
+            if block and not in_code_block and not line.strip() and block[-1].strip():
+                yield self.convert('\n'.join(block) + '\n', depth, anchors)
+                block = []
+            if line.strip().startswith('```'):
+                in_code_block = not in_code_block
+            block.append(line)
+        if block:
+            yield self.convert('\n'.join(block), depth, anchors)
+
     def _escape_html(self, text: str) -> str:
         """Escape HTML entities in code blocks."""
         return (text
@@ -258,6 +532,36 @@ class MarkdownToHtml:
         return '\n'.join(html)
 
 
+@dataclass
+class SiteModel:
+    """
+    In-memory model of the site, built in one scan so that every input file is read once.
+    All generator stages read docs, descriptions, categories and navigation from here.
+    """
+    # name, file, html_name, is_helper, markdown (comments stripped), description (or None)
+    controls: list[dict] = field(default_factory=list)
+    # name, file, html_name, markdown
+    guides: list[dict] = field(default_factory=list)
+    # name, file, html_name, markdown, controls (names listed in the category)
+    categories: list[dict] = field(default_factory=list)
+    # Control name -> category entry
+    control_category: dict[str, dict] = field(default_factory=dict)
+    # Control name -> {'prev': name | None, 'next': name | None} (main controls, alphabetical)
+    nav: dict[str, dict] = field(default_factory=dict)
+    # Control name -> image paths ('images/X.png') found by naming convention in llms-static/images/
+    control_images: dict[str, list[str]] = field(default_factory=dict)
+    # Template file name (site_template.css, site_*.js) -> content
+    templates: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def main_controls(self) -> list[dict]:
+        return [c for c in self.controls if not c['is_helper']]
+
+    @property
+    def helper_controls(self) -> list[dict]:
+        return [c for c in self.controls if c['is_helper']]
+
+
 class SiteGenerator:
     """Generates static HTML site from markdown docs."""
 
@@ -283,6 +587,10 @@ class SiteGenerator:
     # Standalone guide files (not control docs) to include in the sidebar
     GUIDE_FILES = ['MigrationExample.md', 'DesignTokens.md', 'Effects.md', 'SizingAndScaling.md', 'UnifiedIconApi.md', 'LocalizeExtensionBase.md', 'styling-resources.md']
 
+    # Shared templates next to this script, read once per build
+    TEMPLATE_FILES = ('site_template.css', 'site_content.js', 'site_shell.js', 'site_search.js', 'site_nav.js',
+                      'site_sw.js')
+
     # Helper/internal classes shown in a separate 'Helpers' section
     HELPER_CONTROL_NAMES = {
         'DaisyAccessibility',      # Accessibility utilities
@@ -301,17 +609,51 @@ class SiteGenerator:
         'neumorphic',              # Neumorphic (Soft UI) effects
     }
 
-    def __init__(self, docs_dir: Path, output_dir: Path, curated_dir: Path | None = None):
+    def __init__(self, docs_dir: Path, output_dir: Path, curated_dir: Path | None = None,
+                 link_images: bool = False, prune_images: bool = False, cache_dir: Path | None = None,
+                 compress: bool = True, diff_against: Path | None = None, shell_mode: str = 'pages',
+                 transcode: bool = True, optimize_images: bool = True, minify: bool = True,
+                 budgets: dict[str, dict[str, int]] | None = None, strict_budgets: bool = False,
+                 streaming: bool = False, generated_docs: dict[Path, str] | None = None, fs: BuildFS | None = None,
+                 source_dir: Path | None = None):
         self.docs_dir = docs_dir
         self.output_dir = output_dir
         self.curated_dir = curated_dir  # llms-static/ for curated-only mode
+        self.cache_dir = cache_dir or output_dir.parent / ".cache" / "site"  # Build cache (image variants)
+        self.link_images = link_images  # Hardlink images instead of copying (local previews)
+        self.prune_images = prune_images  # Leave images no page references out of docs/images/
+        self.compress = compress  # Write .gz/.br next to text outputs
+        self.diff_against = diff_against  # Manifest of a deployed build to report changes against
+        self.shell_mode = shell_mode  # 'pages' (sidebar on every page) or 'iframe' (index.html shell)
+        self.transcode = transcode  # Offer animated GIFs as WebP/MP4
+        self.optimize_images = optimize_images  # Recompress PNGs losslessly while indexing images
+        self.minify = minify  # Minify HTML pages
+        self.budgets = PageBudgets(budgets or load_budgets(None))  # Page weights against per-type budgets
+        self.strict_budgets = strict_budgets  # Fail the build when a page exceeds its budget
+        self.streaming = streaming  # Hold one doc at a time and write pages, llms.txt and sidebars piece by piece
+        # Docs generate_docs.py wrote in this process (python -m Utils all): path -> content, read from memory
+        self.generated_docs = generated_docs or {}
+        self.fs = fs or DiskFS()  # Every input and output goes through it (MemoryFS: build in memory)
+        self.source_dir = source_dir or docs_dir.parent / "Flowery.Uno"  # C# sources of the generated API sections
+        self.api = ApiReference()  # Properties and enums parsed from source_dir (site_api.py)
         self.converter = MarkdownToHtml()
-        self.controls: list[dict] = []
-        self.categories: list[dict] = []
+        self.search = SearchIndexBuilder()
+        self.model = SiteModel()
         self.use_curated_only = curated_dir is not None
-
-    def generate(self):
-        """Generate the complete static site."""
+        self.images: dict[str, dict] = {}  # Output image name -> source file, hash, size, variants
+        # Logical name ('content.css', 'images/DaisyButton.png') -> fingerprinted output path
+        self.asset_names: dict[str, str] = {}
+        self.referenced_images: set[str] = set()  # Image names referenced by written pages
+        self.written: dict[str, bool] = {}  # Output path -> True if its bytes changed this build
+        self.writer = OutputWriter()  # Writes outputs on worker threads until _flush_writes()
+        self.resource_hints: dict[str, list[tuple[str, str]]] = {}  # Page -> [(rel, href), ...] written
+        self._hashes: dict[Path, tuple[int, int, str]] = {}  # Output file -> (mtime_ns, size, sha256)
+        self.css: SiteStylesheet | None = None  # Parsed site_template.css
+        self.stylesheets: dict[str, str] = {}  # 'content.css', 'shell.css' or 'page.css' -> minified CSS
+        self.critical_sizes: dict[str, int] = {}  # Page -> bytes of inlined critical CSS
+
+    def generate(self) -> bool:
+        """Generate the complete static site. Returns False if a page exceeds its budget with strict_budgets."""
         print("Flowery.Uno Site Generator")
         print("=" * 40)
         if self.use_curated_only:
@@ -320,257 +662,1573 @@ class SiteGenerator:
             print("Mode: GENERATED (llms/)")
 
         # Create output directories
-        self.output_dir.mkdir(exist_ok=True)
-        (self.output_dir / "controls").mkdir(exist_ok=True)
-        (self.output_dir / "categories").mkdir(exist_ok=True)
-        (self.output_dir / "images").mkdir(exist_ok=True)
+        for folder in ("controls", "categories", "images"):
+            self.fs.mkdir(self.output_dir / folder)
+
+        self.load()
+
+        # Copy standalone guides from llms-static/ to docs/
+        print("\n[4/13] Copying guides...")
+        self._copy_guides()
+
+        # Write the stylesheet and scripts under fingerprinted names, plus the asset manifest
+        print("\n[5/13] Writing assets...")
+        self._write_assets()
+
+        # Generate HTML pages
+        print("\n[6/13] Generating HTML pages...")
+        self._generate_shell()
+        self._generate_home()
+        self._generate_control_pages()
+        self._generate_category_pages()
+        self._report_resource_hints()
+        self._report_stylesheets()
+
+        # Stream all docs into llms-full.txt plus per-page markdown and the offset index
+        print("\n[7/13] Writing llms-full.txt...")
+        self._write_llms_full()
+
+        # Build the client-side search index from the rendered pages
+        print("\n[8/13] Building search index...")
+        self._write_search_index()
 
-        # Collect all controls
-        print("\n[1/5] Scanning control docs...")
+        # Copy images from llms-static/ to docs/ (after pages, so references are known)
+        print("\n[9/13] Copying images...")
+        self._copy_images()
+
+        # Page weights (HTML + shipped images) against the per-type budgets
+        print("\n[10/13] Checking page budgets...")
+        within_budgets = self._check_budgets()
+
+        # Service worker with the precache manifest of this build's outputs
+        print("\n[11/13] Writing service worker...")
+        self._write_service_worker(self._hash_outputs())
+
+        # Precompress text outputs for static hosts and CDNs
+        print("\n[12/13] Precompressing text files...")
+        if self.compress:
+            self._compress_outputs()
+        else:
+            print("      Skipped (--no-compress)")
+
+        # Hash every output for deploy diffs
+        print("\n[13/13] Writing build manifest...")
+        self._write_build_manifest()
+
+        print("\n" + "=" * 40)
+        print("Site generated successfully!")
+        if not self.fs.on_disk:
+            print(f"Output: {self.output_dir} (in memory, nothing written)")
+            return within_budgets
+        print(f"Output: {self.output_dir}")
+        print(f"Open:   {self.output_dir / 'index.html'}")
+        return within_budgets
+
+    def load(self):
+        """Stages 1-3: read all inputs into the site model and index images. Nothing is written to the output."""
+        # Collect all controls and guides (each file is read once into the site model)
+        print("\n[1/13] Scanning control docs...")
+        self._scan_controls()
+        self._scan_guides()
+        self._load_templates()
+        print(f"      Found {len(self.model.controls)} controls, {len(self.model.guides)} guides")
+        self._load_api()
+
+        # Collect categories (always from llms/categories/) and build the navigation graph
+        print("\n[2/13] Scanning category docs...")
+        if self._scan_categories():
+            print(f"      Found {len(self.model.categories)} categories")
+        else:
+            print("      No categories folder found (run generate_docs.py first)")
+        self._build_navigation()
+
+        # Index images (hashes, dimensions, responsive variants, recompressed PNGs) before rendering pages
+        print("\n[3/13] Indexing images...")
+        self._index_images()
+        self._fingerprint_assets()
+
+    def outputs(self) -> dict[str, bytes]:
+        """
+        Content of the files this build generated (pages, docs, assets, search index, manifests; not
+        images) by output path, read back through the build filesystem, changed or not.
+        """
+        self._flush_writes()
+        return {rel_path: self.fs.read_bytes(self.output_dir / rel_path) for rel_path in self.written}
+
+    def doc_pages(self) -> dict[str, tuple[str, dict, Callable[[dict], tuple[str, str]]]]:
+        """
+        Searchable doc pages (guides, controls, categories): output path -> (title, model entry, renderer).
+        A renderer returns (content HTML, full page) for its entry.
+        """
+        pages = {}
+        for guide in self.model.guides:
+            pages[guide['html_name']] = (guide['name'], guide, self._render_guide)
+        for ctrl in self.model.controls:
+            pages[f"controls/{ctrl['html_name']}"] = (ctrl['name'], ctrl, self._render_control)
+        for cat in self.model.categories:
+            pages[f"categories/{cat['html_name']}"] = (cat['name'], cat, self._render_category)
+        return pages
+
+    def render(self, rel_path: str) -> str | None:
+        """
+        Render one text output (HTML page, stylesheet, llms.txt, llms-full.txt and its index, doc
+        markdown or asset-manifest.json) from the site model, as a full build would write it.
+        Returns None for unknown paths.
+        """
+        for name, template in ASSET_TEMPLATES.items():
+            if rel_path == self.asset_names.get(name):
+                return self.model.templates[template]
+        for name, css in self.stylesheets.items():
+            if rel_path == self.asset_names.get(name):
+                return css
+        if rel_path == "llms.txt":
+            return self._llms_txt()
+        if rel_path in ("llms-full.txt", "llms-full.index.json"):
+            full, index = self._llms_full()
+            return full if rel_path == "llms-full.txt" else index
+        if rel_path == "asset-manifest.json":
+            return self._asset_manifest()
+        if rel_path == "index.html":
+            return self._fingerprint_refs(self._finish_page(self._render_shell()))
+        if rel_path == "home.html":
+            return self._fingerprint_refs(self._finish_page(self._render_home(self._llms_txt())))
+        page = self.doc_pages().get(rel_path[:-3] + ".html" if rel_path.endswith(".md") else rel_path)
+        if not page or (rel_path.endswith(".md") and rel_path.startswith("categories/")):
+            return None
+        title, entry, render = page
+        if rel_path.endswith(".md"):
+            md_content = self._control_markdown(entry) if rel_path.startswith("controls/") else self._doc_markdown(entry)
+            return self._fingerprint_refs(self._with_title(md_content, title).strip() + '\n\n')
+        return self._fingerprint_refs(self._finish_page(render(entry)[1]))
+
+    def render_paths(self) -> list[str]:
+        """Every output path render() returns content for."""
+        paths = [self.asset_names[name] for name in [*ASSET_TEMPLATES, *self.stylesheets]]
+        paths += ["llms.txt", "llms-full.txt", "llms-full.index.json", "asset-manifest.json", "index.html", "home.html"]
+        for rel_path in self.doc_pages():
+            paths.append(rel_path)
+            if not rel_path.startswith("categories/"):
+                paths.append(rel_path[:-len(".html")] + ".md")
+        return paths
+
+    def generate_only(self, target: str) -> bool:
+        """
+        Re-render one control, guide or category page and its images into an existing output folder.
+        Only the metadata the page needs is loaded (doc names for prev/next, categories for the
+        breadcrumbs, the image listing); the page's own doc and images are the only files read.
+        Returns False if there is no such page, or if it exceeds its budget with strict_budgets.
+        """
+        start = time.perf_counter()
+        self.prune_images = False  # Images of the other pages are not known here
+
+        self._scan_controls(read=False)
+        self._scan_guides(read=False)
+        self._scan_categories()
+        self._build_navigation()
+        self._load_templates()
+        self._load_api()
+        self._fingerprint_assets()
+        if self.curated_dir:
+            self._map_control_images(self._collect_image_sources())
+
+        rel_path = self._find_page(target)
+        if rel_path is None:
+            print(f"Error: no control, guide or category named '{target}'")
+            return False
+        title, entry, render = self.doc_pages()[rel_path]
+        if entry['markdown'] is None:
+            entry['markdown'] = strip_html_comments_outside_code(self._read_input(entry['file']))
+        loaded = time.perf_counter()
+
+        page = render(entry)[1]
+        referenced = set(IMAGE_REF_PATTERN.findall(page))
+        if referenced:
+            self._index_images(only=referenced)
+            self._fingerprint_assets()
+        # Other pages may still reference the previous assets, so none are removed
+        self._write_assets(full=False)
+        self.fs.mkdir((self.output_dir / rel_path).parent)
+        self._write_page(rel_path, page)
+        self._refresh_compressed(self.output_dir / rel_path)
+        rendered = time.perf_counter()
+
+        if self.images:
+            self.fs.mkdir(self.output_dir / "images")
+            self._copy_images(full=False)
+        touched = [*self.written, *(f"{rel_path}{suffix}" for suffix in ('.gz', '.br')),
+                   *(self.asset_names[f"images/{name}"] for name in self.images),
+                   *(self.asset_names[f"images/{out_name}"] for image in self.images.values()
+                     for out_name, _ in self.derived_files(image))]
+        files = self._update_build_manifest(touched)
+        if files is not None:
+            # The page's revision changed: a new service worker, so browsers drop the cached page
+            self._write_service_worker(files)
+            self._refresh_compressed(self.output_dir / "sw.js")
+            self._update_build_manifest(["sw.js", "sw.js.gz", "sw.js.br"])
+        self._flush_writes()
+        done = time.perf_counter()
+
+        print(f"Rebuilt {rel_path} in {(done - start) * 1000:.1f} ms "
+              f"(metadata {(loaded - start) * 1000:.1f} ms, render {(rendered - loaded) * 1000:.1f} ms, "
+              f"images {(done - rendered) * 1000:.1f} ms)")
+        return self._check_budgets()
+
+    def _find_page(self, target: str) -> str | None:
+        """Output path of the page for a control, guide or category name (case-insensitive, 'Daisy' and '.html' optional)."""
+        wanted = target.lower().removesuffix('.html').removesuffix('.md').split('/')[-1]
+        for rel_path, (title, entry, _) in self.doc_pages().items():
+            stem = entry['file'].stem.lower()
+            if wanted in (stem, title.lower()) or (stem.startswith('daisy') and wanted == stem[len('daisy'):]):
+                return rel_path
+        return None
+
+    def reload_file(self, path: Path) -> list[str] | None:
+        """
+        Re-read one changed input into the site model (used by the dev server).
+        Returns the output pages it affects ('*' = every page), or None if the change
+        needs a full load() (added or removed files, categories, images).
+        """
+        if path.parent == Path(__file__).parent and path.name in self.model.templates:
+            self.model.templates[path.name] = path.read_text(encoding='utf-8')
+            self._fingerprint_assets()
+            # Shell scripts only affect the iframe shell (index.html); everything else is on every page
+            shell_only = self.shell_mode == 'iframe' and path.name in ('site_shell.js', 'site_search.js')
+            return ["index.html"] if shell_only else ["*"]
+        if path.suffix != '.md' or not self.fs.exists(path):
+            return None
+        for ctrl in self.model.controls:
+            if ctrl['file'] == path:
+                entry = self._control_entry(path, ctrl['is_helper'], self.fs.read_text(path))
+                pages = [f"controls/{ctrl['html_name']}"]
+                if entry['description'] != ctrl['description']:
+                    pages.append("home.html")  # llms.txt overview table
+                    if self.shell_mode == 'pages':
+                        pages.append("index.html")  # Also the home page
+                ctrl.update(entry)
+                return pages
+        for guide in self.model.guides:
+            if guide['file'] == path:
+                guide['markdown'] = strip_html_comments_outside_code(self.fs.read_text(path))
+                return [guide['html_name']]
+        return None
+
+    def _control_entry(self, md_file: Path, is_helper: bool, text: str | None) -> dict:
+        """
+        Site model entry of one control doc, from its file content (markdown and description stay
+        None without it). The streaming build keeps only the description; the markdown is read
+        again when it is needed.
+        """
+        md_content = strip_html_comments_outside_code(text) if text is not None else None
+        return {
+            'name': md_file.stem,
+            'file': md_file,
+            'html_name': f"{md_file.stem}.html",
+            'is_helper': is_helper,
+            'markdown': None if self.streaming else md_content,
+            'description': first_description_line(md_content) if md_content is not None else None,
+        }
+
+    def _scan_controls(self, read: bool = True):
+        """
+        Collect control docs into the site model, sorted alphabetically by name (read=False: names only).
+        The files are read ahead on worker threads while earlier ones are processed.
+        """
+        found: list[tuple[Path, bool]] = []  # (doc file, is helper)
         seen_controls = set()
 
         if self.use_curated_only:
             # First, read curated docs from llms-static/
-            for md_file in sorted(self.curated_dir.glob("Daisy*.md")):
-                name = md_file.stem
-                self.controls.append({
-                    'name': name,
-                    'file': md_file,
-                    'html_name': f"{name}.html",
-                    'is_helper': name in self.HELPER_CONTROL_NAMES
-                })
-                seen_controls.add(name)
+            for md_file in self.fs.glob(self.curated_dir, "Daisy*.md"):
+                found.append((md_file, md_file.stem in self.HELPER_CONTROL_NAMES))
+                seen_controls.add(md_file.stem)
 
             # Also include non-Daisy helper files (e.g., HslColor.md)
-            for helper_name in self.HELPER_CONTROL_NAMES:
+            for helper_name in sorted(self.HELPER_CONTROL_NAMES):
                 if helper_name not in seen_controls:
                     helper_file = self.curated_dir / f"{helper_name}.md"
-                    if helper_file.exists():
-                        self.controls.append({
-                            'name': helper_name,
-                            'file': helper_file,
-                            'html_name': f"{helper_name}.html",
-                            'is_helper': True
-                        })
+                    if self.fs.exists(helper_file):
+                        found.append((helper_file, True))
                         seen_controls.add(helper_name)
 
             # Then, also include auto-generated docs from llms/controls/ for controls
             # that don't have curated docs (e.g., weather controls, custom controls)
             controls_dir = self.docs_dir / "controls"
-            if controls_dir.exists():
-                for md_file in sorted(controls_dir.glob("*.md")):
+            if self.fs.exists(controls_dir):
+                for md_file in self.fs.glob(controls_dir, "*.md"):
                     name = md_file.stem
                     if name.startswith("Daisy") and name not in seen_controls:
-                        entry = {
-                            'name': name,
-                            'file': md_file,
-                            'html_name': f"{name}.html",
-                            'is_helper': name in self.HELPER_CONTROL_NAMES
-                        }
-                        self.controls.append(entry)
+                        found.append((md_file, name in self.HELPER_CONTROL_NAMES))
                         seen_controls.add(name)
         else:
             # Read from llms/controls/
             controls_dir = self.docs_dir / "controls"
-            for md_file in sorted(controls_dir.glob("*.md")):
-                name = md_file.stem
-                if name.startswith("Daisy"):
-                    self.controls.append({
-                        'name': name,
-                        'file': md_file,
-                        'html_name': f"{name}.html",
-                        'is_helper': name in self.HELPER_CONTROL_NAMES
-                    })
+            for md_file in self.fs.glob(controls_dir, "*.md"):
+                if md_file.stem.startswith("Daisy"):
+                    found.append((md_file, md_file.stem in self.HELPER_CONTROL_NAMES))
+
+        texts = read_ahead(self._read_input, [md_file for md_file, _ in found]) if read else itertools.repeat(None)
+        controls = self.model.controls
+        for (md_file, is_helper), text in zip(found, texts):
+            controls.append(self._control_entry(md_file, is_helper, text))
 
         # Sort all controls alphabetically by name
-        self.controls.sort(key=lambda c: c['name'])
-        print(f"      Found {len(self.controls)} controls")
+        controls.sort(key=lambda c: c['name'])
 
-        # Collect categories (always from llms/categories/)
-        print("\n[2/5] Scanning category docs...")
+    def _scan_guides(self, read: bool = True):
+        """Collect the standalone guides (GUIDE_FILES) that exist in llms-static/ (read=False: names only)."""
+        if not self.curated_dir:
+            return
+        guide_files = [self.curated_dir / name for name in self.GUIDE_FILES if self.fs.exists(self.curated_dir / name)]
+        read = read and not self.streaming
+        texts = read_ahead(self._read_input, guide_files) if read else itertools.repeat(None)
+        for guide_file, text in zip(guide_files, texts):
+            self.model.guides.append({
+                'name': guide_file.stem,
+                'file': guide_file,
+                'html_name': f"{guide_file.stem}.html",
+                'markdown': strip_html_comments_outside_code(text) if text is not None else None,
+            })
+
+    def _scan_categories(self) -> bool:
+        """Collect category docs and map controls to categories. Returns False if there is no categories folder."""
         categories_dir = self.docs_dir / "categories"
-        if categories_dir.exists():
-            for md_file in sorted(categories_dir.glob("*.md")):
-                self.categories.append({
-                    'name': md_file.stem.replace('-', ' ').title(),
-                    'file': md_file,
-                    'html_name': f"{md_file.stem}.html"
-                })
-            print(f"      Found {len(self.categories)} categories")
-        else:
-            print("      No categories folder found (run generate_docs.py first)")
+        if not self.fs.exists(categories_dir):
+            return False
+        md_files = self.fs.glob(categories_dir, "*.md")
+        for md_file, md_content in zip(md_files, read_ahead(self._read_input, md_files)):
+            # Extract control names from list items
+            # - **[DaisyButton](../controls/DaisyButton.html)**
+            category = {
+                'name': md_file.stem.replace('-', ' ').title(),
+                'file': md_file,
+                'html_name': f"{md_file.stem}.html",
+                'markdown': md_content,
+                'controls': re.findall(r'\*\*\[?(Daisy\w+)', md_content),
+            }
+            self.model.categories.append(category)
+            for ctrl_name in category['controls']:
+                self.model.control_category[ctrl_name] = category
+        return True
+
+    def _doc_markdown(self, entry: dict) -> str:
+        """Comment-stripped markdown of a control or guide: from the site model, or read again when streaming."""
+        if entry['markdown'] is not None:
+            return entry['markdown']
+        return strip_html_comments_outside_code(self._read_input(entry['file']))
+
+    def _control_markdown(self, ctrl: dict) -> str:
+        """A control doc with the generated Properties and Enums sections it lacks appended (site_api.py)."""
+        md_content = self._doc_markdown(ctrl)
+        sections = self.api.sections(ctrl['name'], md_content)
+        return f"{md_content.rstrip()}\n\n{sections}" if sections else md_content
+
+    def _load_api(self):
+        """Parse the C# sources into the API reference (cached per file by content hash in api.json)."""
+        if not self.fs.exists(self.source_dir):
+            print(f"      No C# sources in {self.source_dir} - no generated API sections")
+            return
+        self.api = ApiReference.load(self.fs, self.source_dir, self.cache_dir / "api.json")
+        print(f"      API reference: {len(self.api.properties)} classes, {len(self.api.enums)} enums "
+              f"({self.api.parsed} source file(s) parsed, {self.api.files - self.api.parsed} cached)")
 
-        # Copy images from llms-static/ to docs/
-        print("\n[3/6] Copying images...")
-        self._copy_images()
+    def _read_input(self, path: Path) -> str:
+        """A doc from the docs generated in this process, or from the build filesystem."""
+        text = self.generated_docs.get(path)
+        return self.fs.read_text(path) if text is None else text
 
-        # Copy standalone guides from llms-static/ to docs/
-        print("\n[4/6] Copying guides...")
-        self._copy_guides()
+    def _read_ahead_docs(self, entries: list[dict]) -> Iterator[dict]:
+        """
+        The control or guide entries in order. In the streaming build their docs are read ahead on
+        worker threads, and each is held in its entry only until the caller moves on to the next.
+        """
+        if not self.streaming:
+            yield from entries
+            return
+        for entry, text in zip(entries, read_ahead(self._read_input, [entry['file'] for entry in entries])):
+            entry['markdown'] = strip_html_comments_outside_code(text)
+            try:
+                yield entry
+            finally:
+                entry['markdown'] = None
+
+    def _convert(self, markdown: str, depth: int = 1) -> str:
+        """Convert a doc to HTML: whole, or block by block in the streaming build."""
+        if self.streaming:
+            return ''.join(self.converter.convert_blocks(markdown.split('\n'), depth))
+        return self.converter.convert(markdown, depth)
+
+    def _build_navigation(self):
+        """Prev/next links between main controls in alphabetical order (linear, one pass)."""
+        names = [c['name'] for c in self.model.main_controls]  # Already sorted by name
+        for i, name in enumerate(names):
+            self.model.nav[name] = {
+                'prev': names[i - 1] if i > 0 else None,
+                'next': names[i + 1] if i < len(names) - 1 else None,
+            }
+
+    def _load_templates(self):
+        """Read the stylesheet and script templates once."""
+        script_dir = Path(__file__).parent
+        for name in self.TEMPLATE_FILES:
+            self.model.templates[name] = (script_dir / name).read_text(encoding='utf-8')
+
+    def _map_control_images(self, sources: dict[str, list[Path]]):
+        """
+        Assign images in llms-static/images/ to controls by naming convention (one pass over the names,
+        nothing is read):
+        - DaisyMockup.png (exact match)
+        - DaisyMockup_a.png, _b.png (chunked with letter suffix)
+        - Mockup(Description).png or DaisyMockup(Description).png (parenthesized description)
+        """
+        by_name = {c['name']: c['name'] for c in self.model.controls}
+        by_short_name: dict[str, list[str]] = {}
+        for ctrl in self.model.controls:
+            by_short_name.setdefault(ctrl['name'].replace('Daisy', ''), []).append(ctrl['name'])
 
-        # Generate CSS
-        print("\n[5/6] Generating stylesheet...")
-        self._write_css()
+        images_dir = self.curated_dir / "images"
+        image_names = [name for name, paths in sources.items() if paths[-1].parent == images_dir]
+
+        exact: dict[str, str] = {}
+        chunks: dict[str, dict[str, str]] = {}
+        described: dict[str, list[str]] = {}
+        for fname in sorted(image_names):
+            if not fname.endswith('.png'):
+                continue
+            stem = fname[:-4]
+            if stem in by_name:
+                exact[stem] = fname
+            if len(stem) > 2 and stem[-2] == '_' and stem[-1] in 'abcdefghij' and stem[:-2] in by_name:
+                chunks.setdefault(stem[:-2], {})[stem[-1]] = fname
+            if '(' in stem and stem.endswith(')'):
+                prefix = stem[:stem.index('(')]
+                owners = set(by_short_name.get(prefix, []))
+                if prefix in by_name:
+                    owners.add(prefix)
+                for owner in owners:
+                    described.setdefault(owner, []).append(fname)
+
+        for ctrl in self.model.controls:
+            name = ctrl['name']
+            found = [exact[name]] if name in exact else []
+            found += [chunks[name][suffix] for suffix in sorted(chunks.get(name, {}))]
+            found += [f for f in described.get(name, []) if f not in found]
+            if found:
+                self.model.control_images[name] = [f"images/{f}" for f in found]
 
-        # Generate HTML pages
-        print("\n[6/6] Generating HTML pages...")
-        self._generate_shell()
-        self._generate_home()
-        self._generate_control_pages()
-        self._generate_category_pages()
+    def _index_images(self, only: set[str] | None = None):
+        """
+        Index images from llms-static/ and llms-static/images/ by output name (or just the names in `only`).
+        Each file is hashed once and its dimensions are read from the header.
+        Downscaled variants are then built or reused from the cache (by source hash), PNGs are
+        recompressed and the shipped files hashed (see _hash_shipped_images).
+        Duplicate content and name collisions are reported.
+        """
+        if not self.curated_dir:
+            return
 
-        print("\n" + "=" * 40)
-        print("Site generated successfully!")
-        print(f"Output: {self.output_dir}")
-        print(f"Open:   {self.output_dir / 'index.html'}")
+        sources = self._collect_image_sources()
+        self._map_control_images(sources)
+        if only is not None:
+            sources = {name: paths for name, paths in sources.items() if name in only}
+        if not sources:
+            print("      No images found")
+            return
 
-    def _copy_images(self):
-        """Copy image files from llms-static/ and llms-static/images/ to docs/images/."""
-        if not self.curated_dir:
+        # Each image is read once: hash and header dimensions come from the same bytes
+        def read_image(path: Path) -> tuple[str, tuple[int, int] | None]:
+            data = self.fs.read_bytes(path)
+            return hashlib.sha256(data).hexdigest(), read_image_size(data)
+
+        all_files = sorted({path for paths in sources.values() for path in paths})
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as pool:
+            scanned = dict(zip(all_files, pool.map(read_image, all_files)))
+        hashes = {path: digest for path, (digest, _) in scanned.items()}
+
+        # Same name in llms-static/ and llms-static/images/: the images/ file wins
+        for name, paths in sources.items():
+            if len(paths) > 1:
+                winner = paths[-1]
+                losers = ', '.join(str(p.relative_to(self.curated_dir)) for p in paths[:-1])
+                if all(hashes[p] == hashes[winner] for p in paths):
+                    print(f"      Duplicate: {name} exists in several folders with identical content ({losers})")
+                else:
+                    print(f"      WARNING: Name collision for {name}: "
+                          f"{winner.relative_to(self.curated_dir)} overrides {losers}")
+
+        for name, paths in sources.items():
+            size = scanned[paths[-1]][1]
+            self.images[name] = {
+                'file': paths[-1],
+                'hash': hashes[paths[-1]],
+                'width': size[0] if size else None,
+                'height': size[1] if size else None,
+                'variants': [],  # (width, output name, cached file)
+                'animations': [],  # (MIME type, output name, cached file), best first
+                'shipped': paths[-1],  # File copied to the output (the recompressed PNG if smaller)
+                'digests': {},  # Output name -> sha256 of the shipped file (its name and variants)
+            }
+
+        # Different names with identical content
+        by_hash: dict[str, list[str]] = {}
+        for name, image in self.images.items():
+            by_hash.setdefault(image['hash'], []).append(name)
+        for names in by_hash.values():
+            if len(names) > 1:
+                print(f"      Duplicate content: {', '.join(names)}")
+
+        sized = sum(1 for image in self.images.values() if image['width'])
+        print(f"      Indexed {len(self.images)} image(s), {sized} with intrinsic dimensions")
+
+        if Image is None:
+            print("      Pillow not installed - skipping responsive variants (pip install Pillow)")
+        else:
+            # Images with the same content share cache entries: build them once, then the copies hit the cache
+            unique, duplicates = split_duplicates(sorted(self.images.items()))
+            with ThreadPoolExecutor(max_workers=IO_WORKERS) as pool:
+                built = sum(pool.map(self._build_variants, unique))
+            built += sum(map(self._build_variants, duplicates))
+            total = sum(len(image['variants']) for image in self.images.values())
+            print(f"      {total} responsive variant(s): {built} built, {total - built} cached")
+
+            if self.transcode:
+                self._transcode_animations()
+
+        self._hash_shipped_images()
+
+    def _hash_shipped_images(self):
+        """
+        Choose the file each indexed image ships (its recompressed PNG when that is smaller) and
+        hash every shipped file, variants and animations included. Output names are fingerprinted
+        with these digests, so a file's name changes whenever the bytes it serves do.
+        """
+        optimized = self._optimize_pngs(sorted(self.images)) if self.optimize_images else {}
+        derived = [(image, out_name, cached) for image in self.images.values()
+                   for out_name, cached in self.derived_files(image)]
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as pool:
+            derived_hashes = list(pool.map(self.fs.sha256, [cached for _, _, cached in derived]))
+        for name, image in self.images.items():
+            image['shipped'], digest = optimized.get(name, (image['file'], image['hash']))
+            image['digests'] = {name: digest}
+        for (image, out_name, _), digest in zip(derived, derived_hashes):
+            image['digests'][out_name] = digest
+
+    def _build_variants(self, item: tuple[str, dict]) -> int:
+        """Create downscaled variants for one image in the cache. Returns the number newly built."""
+        name, image = item
+        src = image['file']
+        if src.suffix.lower() not in RESPONSIVE_EXTENSIONS or not image['width']:
+            return 0
+
+        variants_dir = self.cache_dir / "variants"
+        self.fs.mkdir(variants_dir)
+        built = 0
+        for width in RESPONSIVE_WIDTHS:
+            if width >= image['width']:
+                continue
+            cached = variants_dir / f"{image['hash'][:16]}-{width}{src.suffix.lower()}"
+            if not self.fs.exists(cached):
+                height = max(1, round(image['height'] * width / image['width']))
+                is_png = src.suffix.lower() == '.png'
+                with Image.open(io.BytesIO(self.fs.read_bytes(src))) as img:
+                    if img.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+                        img = img.convert('RGBA' if is_png else 'RGB')
+                    resized = img.resize((width, height), Image.LANCZOS)
+                # Written atomically, so an interrupted build never leaves a truncated cache entry
+                buffer = io.BytesIO()
+                resized.save(buffer, format='PNG' if is_png else 'JPEG', optimize=True)
+                self.fs.write_bytes(cached, buffer.getvalue())
+                built += 1
+            image['variants'].append((width, f"{Path(name).stem}-{width}w{src.suffix}", cached))
+        return built
+
+    def _transcode_animations(self):
+        """Transcode animated GIFs (cached by source hash) and report the size before and after."""
+        animated = sorted((name, image) for name, image in self.images.items()
+                          if image['file'].suffix.lower() in ANIMATION_EXTENSIONS)
+        if not animated:
+            return
+        if not self.fs.on_disk:
+            print("      In-memory build - animated GIFs get WebP only (no MP4 unless cached)")
+        elif shutil.which('ffmpeg') is None:
+            print("      ffmpeg not found - animated GIFs get WebP only (no MP4)")
+        unique, duplicates = split_duplicates(animated)
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as pool:
+            built = sum(pool.map(self._transcode_animation, unique))
+        built += sum(map(self._transcode_animation, duplicates))
+
+        for name, image in animated:
+            if not image['animations']:
+                continue
+            size = self.fs.size(image['file'])
+            outputs = ', '.join(f"{out_name.rsplit('.', 1)[1]} {self.fs.size(cached) / 1024:.0f} KB"
+                                for _, out_name, cached in image['animations'])
+            print(f"      {name}: {size / 1024:.0f} KB -> {outputs}")
+        total = sum(len(image['animations']) for _, image in animated)
+        print(f"      {total} transcoded animation(s): {built} built, {total - built} cached")
+
+    def _transcode_animation(self, item: tuple[str, dict]) -> int:
+        """
+        Create an MP4 (if ffmpeg is installed) and an animated WebP for one animated GIF in the cache.
+        Outputs not smaller than the GIF are not used. Returns the number newly built.
+        """
+        name, image = item
+        src = image['file']
+        data = self.fs.read_bytes(src)
+        with Image.open(io.BytesIO(data)) as img:
+            if not getattr(img, 'is_animated', False):
+                return 0
+
+        cache_dir = self.cache_dir / "animations"
+        self.fs.mkdir(cache_dir)
+        stem, key = Path(name).stem, image['hash'][:16]
+        built = 0
+
+        video = cache_dir / f"{key}.mp4"
+        # ffmpeg reads and writes real files
+        if not self.fs.exists(video) and self.fs.on_disk and shutil.which('ffmpeg'):
+            tmp = video.with_name(video.name + '.tmp')
+            result = subprocess.run(
+                ['ffmpeg', '-v', 'error', '-y', '-i', str(src), '-an', '-c:v', 'libx264', '-preset', 'slow',
+                 '-crf', str(VIDEO_CRF), '-pix_fmt', 'yuv420p', '-vf', 'scale=trunc(iw/2)*2:trunc(ih/2)*2',
+                 '-movflags', '+faststart', '-f', 'mp4', str(tmp)],
+                capture_output=True, text=True)
+            if result.returncode == 0:
+                tmp.replace(video)
+                built += 1
+            else:
+                tmp.unlink(missing_ok=True)
+                print(f"      WARNING: ffmpeg failed for {name}: {result.stderr.strip()[:200]}")
+
+        webp = cache_dir / f"{key}.webp"
+        if not self.fs.exists(webp):
+            with Image.open(io.BytesIO(data)) as img:
+                # GIF frame delays vary; WebP takes them as a per-frame list
+                durations = []
+                for frame in range(img.n_frames):
+                    img.seek(frame)
+                    durations.append(img.info.get('duration', 100))
+                # Lossless wins for flat UI recordings, lossy for gradients and photos: keep the smaller
+                encoded = []
+                for options in ({'lossless': True}, {'quality': ANIMATED_WEBP_QUALITY}):
+                    img.seek(0)
+                    buffer = io.BytesIO()
+                    img.save(buffer, format='WEBP', save_all=True, duration=durations,
+                             loop=img.info.get('loop', 0), method=4, **options)
+                    encoded.append(buffer.getvalue())
+            self.fs.write_bytes(webp, min(encoded, key=len))
+            built += 1
+
+        for mime, cached in (('video/mp4', video), ('image/webp', webp)):
+            if self.fs.exists(cached) and self.fs.size(cached) < len(data):
+                image['animations'].append((mime, f"{stem}.{cached.suffix[1:]}", cached))
+        return built
+
+    def _decorate_images(self, page: str) -> str:
+        """
+        Add intrinsic width/height, srcset variants and lazy loading to <img> tags
+        pointing at indexed images. The first image on a page loads eagerly.
+        Transcoded GIFs become a looping <video> (or a <picture> with WebP), with the GIF as fallback.
+        """
+        return self._image_decorator()(page)
+
+    def _image_decorator(self) -> Callable[[str], str]:
+        """_decorate_images for one page decorated piece by piece (pieces must not split tags)."""
+        if not self.images:
+            return lambda page: page
+
+        seen_first = False
+
+        def decorate(m: re.Match) -> str:
+            nonlocal seen_first
+            tag = m.group(0)
+            src = re.search(r'src=["\']((?:\.\./)*images/)([^"\']+)["\']', tag)
+            image = self.images.get(src.group(2)) if src else None
+            if image is None:
+                return tag
+
+            attrs = []
+            if image['width'] and ' width=' not in tag:
+                attrs.append(f'width="{image["width"]}" height="{image["height"]}"')
+            if image['variants'] and ' srcset=' not in tag:
+                attrs.append(f'srcset="{self._srcset(src.group(1), src.group(2))}" sizes="{RESPONSIVE_SIZES}"')
+            if seen_first and ' loading=' not in tag:
+                attrs.append('loading="lazy" decoding="async"')
+            seen_first = True
+
+            if attrs:
+                end = -2 if tag.endswith('/>') else -1
+                tag = f"{tag[:end].rstrip()} {' '.join(attrs)}{tag[end:]}"
+            if image['animations']:
+                return self._animation_markup(tag, src.group(1), image)
+            return tag
+
+        def decorate_preload(m: re.Match) -> str:
+            # Preloads must request the same candidate the <img> will pick
+            image = self.images.get(m.group(3))
+            if image is not None and image['animations']:
+                return ''  # The GIF is only a fallback
+            if image is None or not image['variants']:
+                return m.group(0)
+            return (f'{m.group(1)}<link rel="preload" as="image" href="{m.group(2)}{m.group(3)}" '
+                    f'imagesrcset="{self._srcset(m.group(2), m.group(3))}" imagesizes="{RESPONSIVE_SIZES}">')
+
+        def decorate_page(page: str) -> str:
+            page = re.sub(r'(\n[ \t]*)<link rel="preload" as="image" href="((?:\.\./)*images/)([^"]+)">',
+                          decorate_preload, page)
+            return re.sub(r'<img\b[^>]*>', decorate, page)
+
+        return decorate_page
+
+    @staticmethod
+    def derived_files(image: dict) -> list[tuple[str, Path]]:
+        """(output name, cached file) of the files built from an indexed image: variants and animations."""
+        return ([(out_name, cached) for _, out_name, cached in image['variants']]
+                + [(out_name, cached) for _, out_name, cached in image['animations']])
+
+    @staticmethod
+    def _animation_markup(img_tag: str, prefix: str, image: dict) -> str:
+        """Wrap the <img> of a transcoded GIF: <video> when there is an MP4, else <picture> with WebP."""
+        sources = {mime: f"{prefix}{out_name}" for mime, out_name, _ in image['animations']}
+        if 'video/mp4' in sources:
+            attrs = ' '.join(re.findall(r'\b(?:class|width|height)="[^"]*"', img_tag))
+            alt = re.search(r'\balt="([^"]*)"', img_tag)
+            label = f' aria-label="{alt.group(1)}"' if alt else ''
+            return (f'<video {attrs} autoplay loop muted playsinline{label}>'
+                    f'<source src="{sources["video/mp4"]}" type="video/mp4">{img_tag}</video>')
+        return f'<picture><source srcset="{sources["image/webp"]}" type="image/webp">{img_tag}</picture>'
+
+    def _srcset(self, prefix: str, name: str) -> str:
+        """srcset candidates of an indexed image: its responsive variants and the original."""
+        image = self.images[name]
+        candidates = [f"{prefix}{variant} {width}w" for width, variant, _ in image['variants']]
+        candidates.append(f"{prefix}{name} {image['width']}w")
+        return ", ".join(candidates)
+
+    def _copy_images(self, full: bool = True):
+        """
+        Copy the shipped files of indexed images and their variants to docs/images/ under their
+        fingerprinted names (PNGs as recompressed while indexing). Destinations whose content already matches are left untouched, and files are
+        copied (or hardlinked with --link) concurrently. Images no page references
+        are reported and, with --prune-images, left out. A full build removes all other files.
+        """
+        if not self.images:
             return
 
-        image_extensions = ['*.gif', '*.png', '*.jpg', '*.jpeg', '*.webp', '*.svg']
-        copied = 0
+        selected = {name: (image['shipped'], image['digests'][name]) for name, image in self.images.items()}
 
-        # Copy ALL images from llms-static/ root to docs/images/
-        for ext in image_extensions:
-            for img_file in self.curated_dir.glob(ext):
-                dest = self.output_dir / "images" / img_file.name
-                shutil.copy2(img_file, dest)
-                copied += 1
+        unreferenced = sorted(name for name in selected if name not in self.referenced_images)
+        if unreferenced:
+            action = "left out" if self.prune_images else "copied anyway"
+            print(f"      {len(unreferenced)} unreferenced image(s) ({action}): {', '.join(unreferenced)}")
+            if self.prune_images:
+                for name in unreferenced:
+                    del selected[name]
 
-        # Copy images from llms-static/images/ to docs/images/
-        images_subdir = self.curated_dir / "images"
-        if images_subdir.exists():
-            for ext in image_extensions:
-                for img_file in images_subdir.glob(ext):
-                    dest = self.output_dir / "images" / img_file.name
-                    shutil.copy2(img_file, dest)
-                    copied += 1
+        for name, image in self.images.items():
+            if name in selected:
+                for out_name, cached in self.derived_files(image):
+                    selected[out_name] = (cached, image['digests'][out_name])
 
-        print(f"      Copied {copied} image(s)")
+        # Output files are fingerprinted; outdated versions (and left-out images) are removed
+        images_dir = self.output_dir / "images"
+        out_names = {self.asset_names[f"images/{name}"].split('/', 1)[1]: name for name in selected}
+        if full:
+            for stale in self.fs.iterdir(images_dir):
+                if self.fs.is_file(stale) and stale.name.removesuffix('.gz').removesuffix('.br') not in out_names:
+                    self.fs.unlink(stale)
+
+        def sync(item: tuple[str, tuple[Path, str]]) -> str:
+            name, (src, src_hash) = item
+            return self._sync_image(src, self.output_dir / self.asset_names[f"images/{name}"], src_hash)
+
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as pool:
+            results = list(pool.map(sync, sorted(selected.items())))
+
+        summary = ', '.join(f"{results.count(r)} {r}" for r in ('copied', 'linked', 'unchanged') if r in results)
+        print(f"      {len(results)} image(s): {summary}")
+
+    def _optimize_pngs(self, names: list[str]) -> dict[str, tuple[Path, str]]:
+        """
+        Losslessly recompress indexed PNGs with the best available encoder, in a process pool.
+        Results are remembered by source hash and encoder in .cache/site/png/, so each image is
+        optimized once. Prints the savings and writes them to .cache/site/image-optimization.json.
+        Returns (optimized file, its sha256) by image name for the PNGs that got smaller.
+        """
+        pngs = [name for name in names if self.images[name]['file'].suffix.lower() == '.png']
+        if not pngs:
+            return {}
+        encoder = png_encoder() if self.fs.on_disk else 'zlib'  # External encoders need real files
+        cache_dir = self.cache_dir / "png"
+        self.fs.mkdir(cache_dir)
+        results_path = cache_dir / "results.json"
+        try:
+            results = json.loads(self.fs.read_text(results_path))
+        except (OSError, ValueError):
+            results = {}  # Cache key -> [optimized size, sha256 of the optimized file or None]
+
+        def cached(name: str) -> Path:
+            return cache_dir / f"{self.images[name]['hash'][:16]}.{encoder}.png"
+
+        def key(name: str) -> str:
+            return f"{self.images[name]['hash']}:{encoder}"
+
+        todo = [name for name, _ in split_duplicates([(name, self.images[name]) for name in pngs])[0]
+                if key(name) not in results or (results[key(name)][1] and not self.fs.exists(cached(name)))]
+        if todo:
+            sources = [self.images[name]['file'] for name in todo]
+            with ProcessPoolExecutor() as pool:
+                if self.fs.on_disk:
+                    sizes = list(pool.map(optimize_png, sources, [cached(name) for name in todo],
+                                          [encoder] * len(todo)))
+                else:
+                    # Worker processes cannot open files in memory: they get and return the bytes
+                    sizes = []
+                    for name, data in zip(todo, pool.map(recompress_png, map(self.fs.read_bytes, sources))):
+                        self.fs.write_bytes(cached(name), data)
+                        sizes.append(len(data))
+            for name, src, size in zip(todo, sources, sizes):
+                if size < self.fs.size(src):
+                    results[key(name)] = [size, self.fs.sha256(cached(name))]
+                else:
+                    results[key(name)] = [size, None]  # No gain: remember it and ship the original
+                    self.fs.unlink(cached(name))
+            self.fs.write_bytes(results_path, json.dumps(results, indent=1, sort_keys=True).encode('utf-8'))
+
+        optimized, report = {}, {}
+        before = after = 0
+        for name in pngs:
+            size = self.fs.size(self.images[name]['file'])
+            new_size, digest = results[key(name)]
+            if digest:
+                optimized[name] = (cached(name), digest)
+            else:
+                new_size = size
+            before, after = before + size, after + new_size
+            report[name] = {'before': size, 'after': new_size}
+            if new_size < size:
+                print(f"      {name}: {size / 1024:.1f} KB -> {new_size / 1024:.1f} KB "
+                      f"(-{(size - new_size) / size:.0%})")
+
+        report_path = self.cache_dir / "image-optimization.json"
+        report = {'encoder': encoder, 'before': before, 'after': after, 'images': report}
+        self.fs.write_bytes(report_path, (json.dumps(report, indent=2) + '\n').encode('utf-8'))
+        print(f"      {len(pngs)} PNG(s) recompressed with {encoder} "
+              f"({len(todo)} new, {len(pngs) - len(todo)} cached): {before / 1024:.0f} KB -> {after / 1024:.0f} KB, saved {(before - after) / 1024:.0f} KB "
+              f"({(before - after) / max(before, 1):.1%})")
+        if encoder == 'zlib':
+            print("      oxipng/optipng not found - used zlib (install oxipng for better compression)")
+        return optimized
+
+    def _collect_image_sources(self) -> dict[str, list[Path]]:
+        """Map each output image name to its source files, in copy order (llms-static/ then images/)."""
+        sources: dict[str, list[Path]] = {}
+        for folder in (self.curated_dir, self.curated_dir / "images"):
+            if not self.fs.exists(folder):
+                continue
+            for img_file in self.fs.iterdir(folder):
+                if img_file.suffix.lower() in IMAGE_EXTENSIONS and self.fs.is_file(img_file):
+                    sources.setdefault(img_file.name, []).append(img_file)
+        return sources
+
+    def _sync_image(self, src: Path, dest: Path, src_hash: str) -> str:
+        """Copy or hardlink src to dest unless dest already has the same content."""
+        if self.fs.exists(dest):
+            if self.fs.same_file(src, dest):
+                if self.link_images:
+                    return 'unchanged'
+            elif not self.link_images:
+                (src_size, src_mtime), (dest_size, dest_mtime) = self.fs.stat(src), self.fs.stat(dest)
+                if src_size == dest_size and (src_mtime == dest_mtime or self.fs.sha256(dest) == src_hash):
+                    return 'unchanged'
+        return self.fs.copy(src, dest, link=self.link_images)
 
     def _copy_guides(self):
-        """Copy standalone guide markdown files from llms-static/ to docs/ and convert to HTML."""
-        if not self.curated_dir:
+        """Convert the standalone guides from llms-static/ to HTML pages in docs/."""
+        for guide in self._read_ahead_docs(self.model.guides):
+            html_content, parts = self._guide_parts(guide)
+            self.search.add_page(guide['html_name'], guide['name'], html_content)
+            self._write_page_parts(guide['html_name'], parts)
+
+        if self.model.guides:
+            print(f"      Copied {len(self.model.guides)} guide(s)")
+
+    def _render_guide(self, guide: dict) -> tuple[str, str]:
+        """Render a guide. Returns (content HTML, full page)."""
+        html_content, parts = self._guide_parts(guide)
+        return html_content, ''.join(parts)
+
+    def _guide_parts(self, guide: dict) -> tuple[str, Iterator[str]]:
+        """Render a guide. Returns (content HTML, pieces of the full page)."""
+        html_content = self._convert(self._doc_markdown(guide), depth=0)
+
+        # Add breadcrumb navigation
+        breadcrumbs = '<div class="breadcrumbs"><a href="home.html">Home</a></div>'
+        final_content = breadcrumbs + html_content
+
+        return html_content, self._page_parts(guide['name'], [final_content], depth=0)
+
+    def _write_llms_full(self):
+        """
+        Stream every published doc (controls, then guides) into llms-full.txt and write each
+        doc's markdown next to its .html page. llms-full.index.json records the byte range and
+        an approximate token count of each doc and section, so clients can range-request parts.
+        Only one document is held in memory at a time.
+        """
+        entries = []
+        full_path = self.output_dir / "llms-full.txt"
+        tmp = full_path.with_name(full_path.name + '.tmp')
+        with self.fs.open(tmp, 'wb') as full:
+            full.write(LLMS_FULL_HEADER)
+            for name, kind, base, md_content in self._llms_full_docs():
+                data = md_content.encode('utf-8')
+                self._write_output(f"{base}.md", data)
+                entries.append(self._llms_full_entry(name, kind, base, md_content, full.tell()))
+                full.write(data)
+            total = full.tell()
+        self.writer.submit("llms-full.txt", self.fs.replace_if_changed, tmp, full_path)
+
+        index = self._llms_full_index(entries, total)
+        self._write_output("llms-full.index.json", index)
+
+        print(f"      Wrote {len(entries)} doc(s), {total / 1024:.0f} KB (~{-(-total // BYTES_PER_TOKEN):,} tokens), "
+              f"{sum(len(e['sections']) for e in entries)} indexed section(s)")
+
+    def _llms_full(self) -> tuple[str, str]:
+        """llms-full.txt and llms-full.index.json in memory, as _write_llms_full writes them."""
+        parts = [LLMS_FULL_HEADER]
+        entries = []
+        offset = len(LLMS_FULL_HEADER)
+        for name, kind, base, md_content in self._llms_full_docs():
+            data = md_content.encode('utf-8')
+            entries.append(self._llms_full_entry(name, kind, base, md_content, offset))
+            parts.append(data)
+            offset += len(data)
+        return b''.join(parts).decode('utf-8'), self._llms_full_index(entries, offset)
+
+    def _llms_full_docs(self) -> Iterator[tuple[str, str, str, str]]:
+        """(name, kind, output path without extension, published markdown) of each doc in llms-full.txt."""
+        docs = [(ctrl, 'control', f"controls/{ctrl['name']}") for ctrl in self.model.controls]
+        docs += [(guide, 'guide', guide['name']) for guide in self.model.guides]
+        for doc, (_, kind, base) in zip(self._read_ahead_docs([doc for doc, _, _ in docs]), docs):
+            name = doc['name']
+            markdown = self._control_markdown(doc) if kind == 'control' else self._doc_markdown(doc)
+            yield name, kind, base, self._fingerprint_refs(self._with_title(markdown, name).strip() + '\n\n')
+
+    def _llms_full_entry(self, name: str, kind: str, base: str, md_content: str, offset: int) -> dict:
+        """The llms-full.index.json entry of one doc written at offset."""
+        length = len(md_content.encode('utf-8'))
+        return {
+            'name': name,
+            'kind': kind,
+            'md': f"{base}.md",
+            'html': f"{base}.html",
+            'offset': offset,
+            'length': length,
+            'tokens': -(-length // BYTES_PER_TOKEN),
+            'sections': self._section_ranges(md_content, offset),
+        }
+
+    @staticmethod
+    def _llms_full_index(entries: list[dict], total: int) -> str:
+        """llms-full.index.json for the doc entries of an llms-full.txt of total bytes."""
+        index = {
+            'file': 'llms-full.txt',
+            'length': total,
+            'tokens': -(-total // BYTES_PER_TOKEN),
+            'offsets': 'Byte offsets into llms-full.txt; subtract the doc offset for its own .md file. '
+                       'A section spans its subsections. Tokens are estimated at 4 bytes per token.',
+            'docs': entries,
+        }
+        return json.dumps(index, indent=1, ensure_ascii=False)
+
+    def _section_ranges(self, md_content: str, doc_offset: int) -> list[dict]:
+        """Byte range and token estimate per heading. A section ends at the next heading of the same or a higher level."""
+        lines = md_content.split('\n')
+        line_offsets = [doc_offset]
+        for line in lines:
+            line_offsets.append(line_offsets[-1] + len(line.encode('utf-8')) + 1)
+        doc_end = doc_offset + len(md_content.encode('utf-8'))
+
+        headings = list(markdown_headings(lines))
+        sections = []
+        for i, (line_index, level, text, anchor) in enumerate(headings):
+            end = doc_end
+            for next_index, next_level, _, _ in headings[i + 1:]:
+                if next_level <= level:
+                    end = line_offsets[next_index]
+                    break
+            start = line_offsets[line_index]
+            sections.append({
+                'heading': text,
+                'anchor': anchor,
+                'level': level,
+                'offset': start,
+                'length': end - start,
+                'tokens': -(-(end - start) // BYTES_PER_TOKEN),
+            })
+        return sections
+
+    def _with_title(self, md_content: str, name: str) -> str:
+        """Make the doc start with '# <name>': demote a leading '# Overview' or add a missing H1."""
+        stripped_content = md_content.strip()
+        if stripped_content.startswith('# Overview'):
+            # Replace the first occurrence
+            return md_content.replace('# Overview', f'# {name}\n\n## Overview', 1)
+        if not stripped_content.startswith('# '):
+            # If no H1 at all, add one
+            return f"# {name}\n\n{md_content}"
+        return md_content
+
+    def _compress_outputs(self):
+        """
+        Write .gz (and .br with the brotli module) next to every text output above COMPRESS_MIN_SIZE,
+        in a process pool. Files whose bytes are unchanged since the last build (by hash, recorded in
+        the cache) keep their existing compressed siblings. Prints the size reduction per file type.
+        """
+        self._flush_writes()
+        suffixes = ('.gz', '.br') if brotli is not None else ('.gz',)
+        manifest_path = self.cache_dir / "compressed.json"
+        try:
+            previous = json.loads(self.fs.read_text(manifest_path))
+        except (OSError, ValueError):
+            previous = {}
+
+        # build-manifest.json is written after this stage and describes the files themselves
+        sources = [path for path in self.fs.files(self.output_dir)
+                   if path.suffix in COMPRESS_EXTENSIONS and path.name != "build-manifest.json"
+                   and self.fs.size(path) >= COMPRESS_MIN_SIZE]
+        manifest, todo = {}, []
+        for path in sources:
+            rel_path = path.relative_to(self.output_dir).as_posix()
+            digest = self._output_hash(path)
+            entry = previous.get(rel_path)
+            if (entry and entry['hash'] == digest
+                    and all(self.fs.exists(path.with_name(path.name + suffix)) for suffix in suffixes)):
+                manifest[rel_path] = entry
+            else:
+                manifest[rel_path] = {'hash': digest}
+                todo.append(path)
+
+        if todo:
+            with ProcessPoolExecutor() as pool:
+                if self.fs.on_disk:
+                    sizes = pool.map(compress_file, todo, chunksize=8)
+                else:
+                    # Worker processes cannot open files in memory: they get and return the bytes
+                    compressed = pool.map(compress_data, map(self.fs.read_bytes, todo), chunksize=8)
+                    sizes = (write_compressed(self.fs, path, outputs) for path, outputs in zip(todo, compressed))
+                for path, (gz_size, br_size) in zip(todo, sizes):
+                    rel_path = path.relative_to(self.output_dir).as_posix()
+                    manifest[rel_path].update(gz=gz_size, br=br_size)
+
+        # Compressed siblings of files that are gone or now below the threshold
+        stale = 0
+        for suffix in ('.gz', '.br'):
+            for compressed in self.fs.glob(self.output_dir, f"**/*{suffix}"):
+                rel_path = compressed.relative_to(self.output_dir).as_posix()[:-len(suffix)]
+                if rel_path not in manifest or (suffix == '.br' and brotli is None):
+                    self.fs.unlink(compressed)
+                    stale += 1
+
+        self.fs.mkdir(manifest_path.parent)
+        self.fs.write_bytes(manifest_path, json.dumps(manifest, indent=1, sort_keys=True).encode('utf-8'))
+
+        print(f"      {len(sources)} file(s): {len(todo)} compressed, {len(sources) - len(todo)} unchanged"
+              + (f", {stale} stale removed" if stale else ""))
+        if brotli is None:
+            print("      brotli not installed - writing .gz only (pip install brotli)")
+
+        totals: dict[str, list[int]] = {}  # extension -> [files, original, gz, br]
+        for path in sources:
+            entry = manifest[path.relative_to(self.output_dir).as_posix()]
+            total = totals.setdefault(path.suffix, [0, 0, 0, 0])
+            total[0] += 1
+            total[1] += self.fs.size(path)
+            total[2] += entry['gz']
+            total[3] += entry['br'] or 0
+        for ext, (count, original, gz_size, br_size) in sorted(totals.items(), key=lambda item: -item[1][1]):
+            line = f"      {ext:6} {count:4} file(s) {original / 1024:8.1f} KB -> gz {gz_size / 1024:7.1f} KB (-{100 - 100 * gz_size / original:.0f}%)"
+            if brotli is not None:
+                line += f", br {br_size / 1024:7.1f} KB (-{100 - 100 * br_size / original:.0f}%)"
+            print(line)
+
+    def _refresh_compressed(self, path: Path):
+        """Recompress one rewritten output in-process, or drop its stale .gz/.br siblings."""
+        self._flush_writes()
+        for suffix in ('.gz', '.br'):
+            self.fs.unlink(path.with_name(path.name + suffix), missing_ok=True)
+        if self.compress and self.fs.size(path) >= COMPRESS_MIN_SIZE:
+            write_compressed(self.fs, path, compress_data(self.fs.read_bytes(path)))
+
+    def _write_build_manifest(self):
+        """
+        Write build-manifest.json (every output path -> sha256, sorted) and report what changed
+        since the previous build and, with --diff-against, against a deployed build's manifest.
+        """
+        manifest_path = self.output_dir / "build-manifest.json"
+        previous = self._load_manifest(manifest_path)
+
+        files = self._hash_outputs()
+        self._write_output("build-manifest.json", json.dumps({'files': files}, indent=1, sort_keys=True))
+        self._flush_writes()
+
+        rewritten = sum(self.written.values())
+        print(f"      {len(files)} output file(s) hashed; {rewritten} written, "
+              f"{len(self.written) - rewritten} generated file(s) unchanged (not rewritten)")
+        if previous is not None:
+            print(f"      Since last build: {self._diff_summary(previous, files)}")
+        if self.diff_against:
+            deployed = self._load_manifest(self.diff_against)
+            if deployed is None:
+                print(f"      WARNING: cannot read manifest {self.diff_against}")
+            else:
+                self._print_diff(deployed, files)
+
+    def _hash_outputs(self) -> dict[str, str]:
+        """
+        sha256 of every output file except the build manifest, by output path (sorted).
+        Hashes are memoized by size and mtime, so later stages only hash files written since.
+        """
+        self._flush_writes()
+        manifest_path = self.output_dir / "build-manifest.json"
+        paths = [path for path in self.fs.files(self.output_dir)
+                 if path != manifest_path and not path.name.endswith('.tmp')]
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as pool:
+            hashes = list(pool.map(self._output_hash, paths))
+        return {path.relative_to(self.output_dir).as_posix(): value for path, value in zip(paths, hashes)}
+
+    def _output_hash(self, path: Path) -> str:
+        """sha256 of an output file, memoized by size and mtime."""
+        size, mtime = self.fs.stat(path)
+        memo = self._hashes.get(path)
+        if memo and memo[:2] == (mtime, size):
+            return memo[2]
+        digest = self.fs.sha256(path)
+        self._hashes[path] = (mtime, size, digest)
+        return digest
+
+    def _write_service_worker(self, files: dict[str, str]):
+        """
+        Write sw.js: site_sw.js with the precache manifest of this build's outputs prepended
+        (output path -> revision, plus the paths fetched on install). The manifest version is
+        the hash of that content, so any changed output installs a new worker.
+        """
+        files = {rel_path: digest[:FINGERPRINT_LENGTH] for rel_path, digest in files.items()
+                 if rel_path != "sw.js" and not rel_path.endswith(('.gz', '.br'))}
+        precache = [rel_path for rel_path in files if self._precached(rel_path)]
+        content = {'files': files, 'precache': precache}
+        version = hashlib.sha256(json.dumps(content, sort_keys=True).encode('utf-8')).hexdigest()[:FINGERPRINT_LENGTH]
+        manifest = json.dumps({'version': version, **content}, separators=(',', ':'))
+        script = (f"// Generated by generate_site.py from the build outputs - do not edit\n"
+                  f"const PRECACHE_MANIFEST = {manifest};\n\n{self.model.templates['site_sw.js']}")
+        self._write_output("sw.js", script)
+
+        sizes = [self.fs.size(self.output_dir / rel_path) for rel_path in precache]
+        print(f"      Manifest {version}: {len(files)} output(s), {len(precache)} precached "
+              f"({sum(sizes) / 1024:.0f} KB), the rest cached on first use")
+
+    def _precached(self, rel_path: str) -> bool:
+        """Whether the service worker fetches an output on install (shells, assets, small images)."""
+        if rel_path in ("index.html", "home.html") or rel_path.startswith("assets/"):
+            return True
+        return (rel_path.startswith("images/")
+                and self.fs.size(self.output_dir / rel_path) <= PRECACHE_MAX_IMAGE_SIZE)
+
+    def _update_build_manifest(self, rel_paths: list[str]) -> dict[str, str] | None:
+        """Refresh the manifest entries of files rewritten by a partial (--only) build."""
+        self._flush_writes()
+        manifest_path = self.output_dir / "build-manifest.json"
+        previous = self._load_manifest(manifest_path)
+        if previous is None:
+            return None
+        for rel_path in rel_paths:
+            path = self.output_dir / rel_path
+            if self.fs.exists(path):
+                previous[rel_path] = self.fs.sha256(path)
+            else:
+                previous.pop(rel_path, None)
+        self._write_output("build-manifest.json", json.dumps({'files': previous}, indent=1, sort_keys=True))
+        return previous
+
+    def _load_manifest(self, path: Path) -> dict[str, str] | None:
+        try:
+            return json.loads(self.fs.read_text(path))['files']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @staticmethod
+    def _diff_manifests(old: dict[str, str], new: dict[str, str]) -> tuple[list[str], list[str], list[str]]:
+        added = sorted(new.keys() - old.keys())
+        removed = sorted(old.keys() - new.keys())
+        changed = sorted(path for path in new.keys() & old.keys() if new[path] != old[path])
+        return added, changed, removed
+
+    def _diff_summary(self, old: dict[str, str], new: dict[str, str]) -> str:
+        added, changed, removed = self._diff_manifests(old, new)
+        return f"{len(added)} added, {len(changed)} changed, {len(removed)} removed"
+
+    def _print_diff(self, deployed: dict[str, str], files: dict[str, str]):
+        """List the files a deploy has to upload (added, changed) and delete (removed)."""
+        added, changed, removed = self._diff_manifests(deployed, files)
+        print(f"      Against {self.diff_against}: {self._diff_summary(deployed, files)}")
+        for label, paths in (('added', added), ('changed', changed), ('removed', removed)):
+            for path in paths:
+                print(f"        {label:8} {path}")
+
+    def _write_search_index(self):
+        """Write the sharded search index (docs/search/) and report its size and query latency."""
+        search_dir = self.output_dir / "search"
+        self.fs.mkdir(search_dir)
+        files = self.search.render()
+        for stale in self.fs.glob(search_dir, "shard-*.js"):
+            if stale.name not in files:
+                self.fs.unlink(stale)
+        sizes = {}
+        for name, content in files.items():
+            data = content.encode('utf-8')
+            self._write_output(f"search/{name}", data)
+            sizes[name] = len(data)
+        sample_queries = [ctrl['name'].replace('Daisy', '') for ctrl in self.model.controls[::10]]
+        sample_queries += ['glass blur', 'theme', 'variant primary', 'size']
+        self._flush_writes()  # The sample queries read the written shards
+        self.search.report(search_dir, sizes, sample_queries, self.fs.read_text)
+
+    def _fingerprint_assets(self):
+        """
+        Name every shared asset and image by content hash, so the site can be served with
+        immutable, year-long cache headers (new content = new URL).
+        Images, variants and animations are named by the hash of the bytes shipped (after PNG
+        recompression), never by their source hash: that only keys the caches they are built from.
+        """
+        self._build_stylesheets()
+        names = {}
+        contents = {**{name: self.model.templates[template] for name, template in ASSET_TEMPLATES.items()},
+                    **self.stylesheets}
+        for name, content in contents.items():
+            digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+            names[name] = f"assets/{fingerprinted_name(name, digest)}"
+        for image in self.images.values():
+            for out_name, digest in image['digests'].items():
+                names[f"images/{out_name}"] = f"images/{fingerprinted_name(out_name, digest)}"
+        self.asset_names = names
+
+    def _build_stylesheets(self):
+        """Split site_template.css into the minified stylesheets the current layout links."""
+        self.css = SiteStylesheet(self.model.templates['site_template.css'], self._render_sidebar())
+        contexts = ('page',) if self.shell_mode == 'pages' else ('shell', 'content')
+        self.stylesheets = {f"{context}.css": self.css.stylesheet(context) for context in contexts}
+
+    def _inline_critical_css(self, page: str, tokens: set[str] | None = None) -> str:
+        """
+        Inline the rules the page needs above the fold and load its stylesheet asynchronously
+        (preload + onload, with a <noscript> fallback), so the first paint waits for no CSS request.
+        tokens are those of the markup above the fold when page is only the start of the page.
+        """
+        m = STYLESHEET_LINK_PATTERN.search(page)
+        if not m or self.css is None:
+            return page
+        href, context = m.group(1), m.group(2)
+        critical = self.css.critical(page, context) if tokens is None else self.css.critical_for(tokens, context)
+        links = (f'<style>{critical}</style>\n'
+                 f'    <link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+                 f'    <noscript><link rel="stylesheet" href="{href}"></noscript>')
+        return page[:m.start()] + links + page[m.end():]
+
+    def _report_stylesheets(self):
+        """Print stylesheet sizes against the template and the critical CSS inlined per page."""
+        source = self.css.source_size
+        sheets = ', '.join(f"{name} {len(css.encode('utf-8')) / 1024:.1f} KB "
+                           f"(gzip {len(gzip.compress(css.encode('utf-8'), 9, mtime=0)) / 1024:.1f} KB)"
+                           for name, css in self.stylesheets.items())
+        print(f"      Stylesheets: site_template.css {source / 1024:.1f} KB "
+              f"(gzip {len(gzip.compress(self.model.templates['site_template.css'].encode('utf-8'), 9, mtime=0)) / 1024:.1f} KB)"
+              f" -> {sheets}")
+        if self.critical_sizes:
+            sizes = list(self.critical_sizes.values())
+            average = sum(sizes) / len(sizes)
+            print(f"      Critical CSS inlined on {len(sizes)} page(s): avg {average / 1024:.1f} KB, "
+                  f"max {max(sizes) / 1024:.1f} KB; the first paint no longer waits for a "
+                  f"{source / 1024:.1f} KB stylesheet request ({source - average:,.0f} bytes less CSS before first paint)")
+
+    def _fingerprint_refs(self, text: str) -> str:
+        """Point image references ('images/X.png', '../images/X.png') at the fingerprinted files."""
+        if not self.asset_names:
+            return text
+
+        def rename(m: re.Match) -> str:
+            ref, tail = m.group(0), ''
+            # In markdown the closing ')' of ![alt](images/X.png) is matched too (names may contain parentheses)
+            while ref not in self.asset_names and ref.endswith(')'):
+                ref, tail = ref[:-1], ')' + tail
+            return self.asset_names.get(ref, ref) + tail
+
+        return IMAGE_REF_PATTERN.sub(rename, text)
+
+    def _write_assets(self, full: bool = True):
+        """
+        Write the stylesheets and scripts to docs/assets/ under their fingerprinted names.
+        A full build also removes outdated assets and writes asset-manifest.json.
+        """
+        assets_dir = self.output_dir / "assets"
+        self.fs.mkdir(assets_dir)
+        written = set()
+        contents = {**{name: self.model.templates[template] for name, template in ASSET_TEMPLATES.items()},
+                    **self.stylesheets}
+        for name, content in contents.items():
+            self._write_output(self.asset_names[name], content)
+            written.add(Path(self.asset_names[name]).name)
+        if not full:
             return
 
-        # List of standalone guide files to copy (not control docs)
-        copied = 0
-
-        for guide_name in self.GUIDE_FILES:
-            guide_file = self.curated_dir / guide_name
-            if guide_file.exists():
-                # Read and convert to HTML
-                md_content = guide_file.read_text(encoding='utf-8')
-                md_content = strip_html_comments_outside_code(md_content)
-                html_content = self.converter.convert(md_content, depth=0)
-
-                # Add breadcrumb navigation
-                breadcrumbs = '<div class="breadcrumbs"><a href="home.html">Home</a></div>'
-                final_content = breadcrumbs + html_content
-
-                # Generate HTML page
-                html_name = guide_name.replace('.md', '.html')
-                page = self._page_template(guide_name.replace('.md', ''), final_content, depth=0)
-                (self.output_dir / html_name).write_text(page, encoding='utf-8')
-                copied += 1
-
-        if copied > 0:
-            print(f"      Copied {copied} guide(s)")
-
-    def _write_css(self):
-        """Write the stylesheet (read from external template file)."""
-        css_template = Path(__file__).parent / "site_template.css"
-        css = css_template.read_text(encoding='utf-8')
-        (self.output_dir / "style.css").write_text(css, encoding='utf-8')
-
-    def _page_template(self, title: str, content: str, depth: int = 0) -> str:
-        """Generate HTML page for content (loaded in iframe)."""
+        self._flush_writes()  # Temp files of queued writes are not stale
+        stale = [path for path in self.fs.iterdir(assets_dir)
+                 if self.fs.is_file(path) and path.name.removesuffix('.gz').removesuffix('.br') not in written]
+        for path in stale:
+            self.fs.unlink(path)
+        self._write_output("asset-manifest.json", self._asset_manifest())
+        print(f"      {len(contents)} asset(s), {len(self.asset_names)} fingerprinted name(s)"
+              + (f", {len(stale)} outdated removed" if stale else ""))
+
+    def _asset_manifest(self) -> str:
+        """asset-manifest.json: logical asset and image names -> fingerprinted paths."""
+        manifest = {
+            'note': 'Logical name -> fingerprinted path. Files under assets/ and images/ never change '
+                    'content under the same name and can be cached as immutable.',
+            'assets': dict(sorted(self.asset_names.items())),
+        }
+        return json.dumps(manifest, indent=1)
+
+    def _write_output(self, rel_path: str, content: str | bytes):
+        """Queue one output file to be written atomically, left untouched if the bytes are identical."""
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        self.writer.submit(rel_path, self.fs.write_bytes, self.output_dir / rel_path, data)
+
+    def _flush_writes(self):
+        """
+        Wait for the queued output writes and record which files changed. Called before outputs
+        are read back; raises the error of the first failed write, in write order.
+        """
+        self.written.update(self.writer.drain())
+
+    def _write_page(self, rel_path: str, page: str):
+        """Write a generated HTML page and record its images, resource hints, critical CSS size and weight."""
+        page = self._finish_page(page)
+        self.referenced_images.update(IMAGE_REF_PATTERN.findall(page))
+        self.budgets.add_page(rel_path, page, EMBEDDED_IMAGE_PATTERN.findall(page))
+        critical = re.search(r'<style>(.*?)</style>', page, flags=re.DOTALL)
+        if critical:
+            self.critical_sizes[rel_path] = len(critical.group(1).encode('utf-8'))
+        page = self._fingerprint_refs(page)
+        hints = RESOURCE_HINT_PATTERN.findall(page)
+        if hints:
+            self.resource_hints[rel_path] = hints
+        self._write_output(rel_path, page)
+
+    def _finish_page(self, page: str) -> str:
+        """Image attributes and critical CSS, which both depend on the final markup, then minification."""
+        page = self._inline_critical_css(self._decorate_images(page))
+        return minify_html(page) if self.minify else page
+
+    def _write_parts(self, rel_path: str, parts: Iterable[str]):
+        """Write a text output piece by piece through a temp file (like _write_output, never held whole)."""
+        path = self.output_dir / rel_path
+        tmp = path.with_name(path.name + '.tmp')
+        with self.fs.open(tmp, 'w') as out:
+            for part in parts:
+                out.write(part)
+        self.writer.submit(rel_path, self.fs.replace_if_changed, tmp, path)
+
+    def _write_page_parts(self, rel_path: str, parts: Iterable[str]):
+        """Write a page given in pieces: streamed in the streaming build, else joined for _write_page."""
+        if self.streaming:
+            self._stream_page(rel_path, parts)
+        else:
+            self._write_page(rel_path, ''.join(parts))
+
+    def _stream_page(self, rel_path: str, parts: Iterable[str]):
+        """
+        _write_page for a page in pieces (which must not split tags), without holding it whole.
+        The critical CSS goes into the first piece (<head>) but depends on the markup down to the
+        fold, so the pieces up to the fold are spooled while their tokens are collected. The rest
+        is decorated, minified, measured and written as it comes.
+        """
+        decorate = self._image_decorator()
+        pieces = (decorate(part) for part in parts)
+        head = next(pieces, '')
+
+        tokens: set[str] = set()
+        fold: int | None = None  # Offset of the end of the markup above the fold, once known
+        offset = 0
+
+        def above_fold(piece: str) -> bool:
+            """Collect the tokens of a piece up to the fold. Returns False once the fold is passed."""
+            nonlocal fold, offset
+            if fold is None:
+                start = piece.find('class="content-body"')
+                if start != -1:
+                    fold = offset + start + CRITICAL_CONTENT_CHARS
+            tokens.update(markup_tokens(piece if fold is None else piece[:max(fold - offset, 0)]))
+            offset += len(piece)
+            return fold is None or offset < fold
+
+        minifier = StreamMinifier() if self.minify else None
+        counter = HtmlPartCounter()
+        images: list[str] = []
+        hints: list[tuple[str, str]] = []
+        path = self.output_dir / rel_path
+        tmp = path.with_name(path.name + '.tmp')
+
+        with self.fs.open(tmp, 'w') as out, \
+                tempfile.SpooledTemporaryFile(PAGE_SPOOL_SIZE, mode='w+', encoding='utf-8', newline='') as spool:
+
+            def emit(text: str):
+                counter.feed(text)
+                self.referenced_images.update(IMAGE_REF_PATTERN.findall(text))
+                images.extend(EMBEDDED_IMAGE_PATTERN.findall(text))
+                text = self._fingerprint_refs(text)
+                hints.extend(RESOURCE_HINT_PATTERN.findall(text))
+                out.write(text)
+
+            if above_fold(head):
+                for piece in pieces:
+                    spool.write(piece)
+                    if not above_fold(piece):
+                        break
+            head = self._inline_critical_css(head, tokens)
+            critical = re.search(r'<style>(.*?)</style>', head, flags=re.DOTALL)
+            if critical:
+                self.critical_sizes[rel_path] = len(critical.group(1).encode('utf-8'))
+
+            finish = minifier.feed if minifier is not None else (lambda text: text)
+            emit(finish(head))
+            spool.seek(0)
+            for piece in spool:
+                emit(finish(piece))
+            for piece in pieces:
+                emit(finish(piece))
+            if minifier is not None:
+                emit(minifier.flush())
+
+        self.budgets.add_sizes(rel_path, counter.sizes(), images)
+        if hints:
+            self.resource_hints[rel_path] = hints
+        self.writer.submit(rel_path, self.fs.replace_if_changed, tmp, path)
+
+    def _resource_hints(self, ctrl: dict, html_content: str) -> list[str]:
+        """
+        <link> hints for a control page: prefetch the likely next navigations (prev/next
+        controls, the category page) and preload the first image, which is above the fold.
+        """
+        links = []
+        nav = self.model.nav.get(ctrl['name'], {})
+        for name in (nav.get('prev'), nav.get('next')):
+            if name:
+                links.append(f'<link rel="prefetch" href="{name}.html">')
+        category = self.model.control_category.get(ctrl['name'])
+        if category:
+            links.append(f'<link rel="prefetch" href="../categories/{category["html_name"]}">')
+        # srcset variants are added by _decorate_images, once the image is indexed
+        lead_image = re.search(r'<img\b[^>]*\bsrc="((?:\.\./)*images/[^"]+)"', html_content)
+        if lead_image:
+            links.append(f'<link rel="preload" as="image" href="{lead_image.group(1)}">')
+        return links
+
+    def _check_budgets(self) -> bool:
+        """
+        Report the heaviest pages and the pages over their budget (see site_html.py).
+        Returns False if a page is over budget and budgets are strict.
+        """
+        def image_size(name: str) -> tuple[str, int]:
+            image = self.images.get(name)
+            if image is None:
+                return name, 0  # Not an indexed image (missing file)
+            shipped = image['animations'][0][1] if image['animations'] else name
+            path = self.output_dir / self.asset_names[f"images/{shipped}"]
+            return shipped, self.fs.size(path) if self.fs.exists(path) else self.fs.size(image['file'])
+
+        over = self.budgets.check(image_size)
+        for message in over:
+            print(f"      {'ERROR' if self.strict_budgets else 'WARNING'}: over budget: {message}")
+        if not over:
+            print("      All pages within budget")
+        return not (over and self.strict_budgets)
+
+    def _report_resource_hints(self):
+        """Print a summary of the resource hints and write the per-page list to the build cache."""
+        counts: dict[str, int] = {}
+        for hints in self.resource_hints.values():
+            for rel, _ in hints:
+                counts[rel] = counts.get(rel, 0) + 1
+        report = {page: [{'rel': rel, 'href': href} for rel, href in hints]
+                  for page, hints in sorted(self.resource_hints.items())}
+        report_path = self.cache_dir / "resource-hints.json"
+        self.fs.mkdir(report_path.parent)
+        self.fs.write_bytes(report_path, (json.dumps(report, indent=2) + '\n').encode('utf-8'))
+        summary = ', '.join(f"{count} {rel}" for rel, count in sorted(counts.items()))
+        print(f"      Resource hints on {len(report)} page(s): {summary or 'none'} (list: {report_path})")
+
+    def _page_template(self, title: str, content: str, depth: int = 0, hints: list[str] | None = None) -> str:
+        """Generate HTML page for content (with the sidebar, or loaded in the shell's iframe)."""
+        return ''.join(self._page_parts(title, [content], depth, hints))
+
+    def _page_parts(self, title: str, content: Iterable[str], depth: int = 0,
+                    hints: list[str] | None = None) -> Iterator[str]:
+        """_page_template piece by piece: <head>, the sidebar one item at a time, the content pieces, the end."""
         css_prefix = "../" * depth
-        content_js = (Path(__file__).parent / "site_content.js").read_text(encoding='utf-8')
-        return f'''<!DOCTYPE html>
+        hint_links = ''.join(f'\n    {link}' for link in hints or [])
+        stylesheet = 'page.css' if self.shell_mode == 'pages' else 'content.css'
+        yield f'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title}</title>
-    <link rel="stylesheet" href="{css_prefix}style.css">
+    <link rel="stylesheet" href="{css_prefix}{self.asset_names[stylesheet]}">{hint_links}
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/github-dark.min.css">
     <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js"></script>
     <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/xml.min.js"></script>
     <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/csharp.min.js"></script>
 </head>
-<body class="content-body">
-    {content}
-    <script>
-{content_js}
-    </script>
+'''
+        if self.shell_mode == 'pages':
+            yield f'''<body data-root="{css_prefix}">
+    <div class="shell">
+        '''
+            yield from self._sidebar_parts(css_prefix, in_shell=False)
+            yield '''        <main class="viewer viewer-page">
+            <div class="content-body">
+    '''
+            yield from content
+            yield f'''
+            </div>
+        </main>
+    </div>
+
+    <script src="{css_prefix}{self.asset_names['shell.js']}"></script>
+    <script src="{css_prefix}{self.asset_names['search.js']}"></script>
+    <script src="{css_prefix}{self.asset_names['nav.js']}"></script>
+</body>
+</html>'''
+        else:
+            yield '''<body class="content-body">
+    '''
+            yield from content
+            yield f'''
+    <script src="{css_prefix}{self.asset_names['content.js']}"></script>
 </body>
 </html>'''
 
     def _generate_shell(self):
         """Generate the main app shell (index.html) with sidebar and iframe."""
-        shell_js = (Path(__file__).parent / "site_shell.js").read_text(encoding='utf-8')
-
-        sidebar_items = []
-
-        # Home link
-        sidebar_items.append('<li><a href="home.html" target="viewer" class="active">Home</a></li>')
-
-        # Guides section
-        existing_guides = [g for g in self.GUIDE_FILES if (self.curated_dir / g).exists()] if self.curated_dir else []
-        if existing_guides:
-            sidebar_items.append('<li><h2>Guides</h2></li>')
-            for guide in existing_guides:
-                guide_name = guide.replace('.md', '')
-                # Convert camelCase to spaced title (MigrationExample -> Migration Example)
-                display_name = ''.join(' ' + c if c.isupper() else c for c in guide_name).strip()
-                # Add custom badge for Effects (exclusive content)
-                badge = '<sup class="custom-badge">✦</sup>' if guide_name == 'Effects' else ''
-                sidebar_items.append(f'<li><a href="{guide_name}.html" target="viewer">{display_name}{badge}</a></li>')
-
-        # Categories
-        if self.categories:
-            sidebar_items.append('<li><h2>Categories</h2></li>')
-            for cat in self.categories:
-                sidebar_items.append(f'<li><a href="categories/{cat["html_name"]}" target="viewer">{cat["name"]}</a></li>')
-
-        # Controls (main controls only, not helpers)
-        sidebar_items.append('<li><h2>Controls</h2></li>')
-        main_controls = [c for c in self.controls if not c.get('is_helper', False)]
-        helper_controls = [c for c in self.controls if c.get('is_helper', False)]
-
-        for ctrl in main_controls:
-            display_name = ctrl['name'].replace('Daisy', '')
-            is_custom = display_name.startswith(self.CUSTOM_CONTROL_PREFIXES)
-            badge = '<sup class="custom-badge">✦</sup>' if is_custom else ''
-            sidebar_items.append(f'<li><a href="controls/{ctrl["html_name"]}" target="viewer">{display_name}{badge}</a></li>')
-
-        # Helpers section (if any)
-        if helper_controls:
-            sidebar_items.append('<li><h2 class="helpers-header">Helpers</h2></li>')
-            # Sort helpers alphabetically by display name
-            helper_controls_sorted = sorted(helper_controls, key=lambda c: c['name'].replace('Daisy', ''))
-            for ctrl in helper_controls_sorted:
-                display_name = ctrl['name'].replace('Daisy', '')
-                is_custom = display_name.startswith(self.CUSTOM_CONTROL_PREFIXES)
-                badge = '<sup class="custom-badge">✦</sup>' if is_custom else ''
-                sidebar_items.append(f'<li><a href="controls/{ctrl["html_name"]}" target="viewer">{display_name}{badge}</a></li>')
+        self._write_page_parts("index.html", self._shell_parts())
 
-        sidebar_html = '\n'.join(sidebar_items)
+    def _render_sidebar(self, prefix: str = "", in_shell: bool = True) -> str:
+        """Render the menu toggle, overlay and sidebar (links open in the shell's iframe if in_shell)."""
+        return ''.join(self._sidebar_parts(prefix, in_shell))
 
-        html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Flowery.Uno Documentation</title>
-    <link rel="stylesheet" href="style.css">
-</head>
-<body>
-    <div class="shell">
-        <div class="overlay"></div>
+    def _sidebar_parts(self, prefix: str = "", in_shell: bool = True) -> Iterator[str]:
+        """_render_sidebar piece by piece, one navigation item at a time."""
+        yield '''<div class="overlay"></div>
         <button class="menu-toggle" aria-label="Toggle Menu">
             <svg viewBox="0 0 24 24" width="24" height="24" stroke="currentColor" stroke-width="2" fill="none" stroke-linecap="round" stroke-linejoin="round">
                 <line x1="3" y1="12" x2="21" y2="12"></line>
@@ -609,44 +2267,144 @@ class SiteGenerator:
                 </button>
             </h1>
             <p class="subtitle">Beautiful Uno Platform Components</p>
-            <ul>
-                {sidebar_html}
+            <input type="search" class="sidebar-search" placeholder="Search docs..." aria-label="Search documentation" autocomplete="off">
+            <ul class="search-results" hidden></ul>
+            <ul class="sidebar-nav">
+                '''
+        yield from join_lines(self._sidebar_items(prefix, in_shell))
+        yield '''
             </ul>
         </nav>
-        <iframe name="viewer" class="viewer" src="home.html"></iframe>
+'''
+
+    def _sidebar_items(self, prefix: str, in_shell: bool) -> Iterator[str]:
+        """The <li> items of the sidebar navigation: home, guides, categories, controls and helpers."""
+        target = ' target="viewer"' if in_shell else ''
+        active = ' class="active"' if in_shell else ''
+
+        # Home link (marked active by the scripts on pre-rendered pages)
+        yield f'<li><a href="{prefix}home.html"{target}{active}>Home</a></li>'
+
+        # Guides section
+        if self.model.guides:
+            yield '<li><h2>Guides</h2></li>'
+            for guide in self.model.guides:
+                guide_name = guide['name']
+                # Convert camelCase to spaced title (MigrationExample -> Migration Example)
+                display_name = ''.join(' ' + c if c.isupper() else c for c in guide_name).strip()
+                # Add custom badge for Effects (exclusive content)
+                badge = '<sup class="custom-badge">✦</sup>' if guide_name == 'Effects' else ''
+                yield f'<li><a href="{prefix}{guide_name}.html"{target}>{display_name}{badge}</a></li>'
+
+        # Categories
+        if self.model.categories:
+            yield '<li><h2>Categories</h2></li>'
+            for cat in self.model.categories:
+                yield f'<li><a href="{prefix}categories/{cat["html_name"]}"{target}>{cat["name"]}</a></li>'
+
+        # Controls (main controls only, not helpers)
+        yield '<li><h2>Controls</h2></li>'
+        main_controls = self.model.main_controls
+        helper_controls = self.model.helper_controls
+
+        for ctrl in main_controls:
+            display_name = ctrl['name'].replace('Daisy', '')
+            is_custom = display_name.startswith(self.CUSTOM_CONTROL_PREFIXES)
+            badge = '<sup class="custom-badge">✦</sup>' if is_custom else ''
+            yield f'<li><a href="{prefix}controls/{ctrl["html_name"]}"{target}>{display_name}{badge}</a></li>'
+
+        # Helpers section (if any)
+        if helper_controls:
+            yield '<li><h2 class="helpers-header">Helpers</h2></li>'
+            # Sort helpers alphabetically by display name
+            helper_controls_sorted = sorted(helper_controls, key=lambda c: c['name'].replace('Daisy', ''))
+            for ctrl in helper_controls_sorted:
+                display_name = ctrl['name'].replace('Daisy', '')
+                is_custom = display_name.startswith(self.CUSTOM_CONTROL_PREFIXES)
+                badge = '<sup class="custom-badge">✦</sup>' if is_custom else ''
+                yield f'<li><a href="{prefix}controls/{ctrl["html_name"]}"{target}>{display_name}{badge}</a></li>'
+
+    def _render_shell(self) -> str:
+        """Render the main app shell (index.html); the home page itself in the 'pages' shell mode."""
+        return ''.join(self._shell_parts())
+
+    def _shell_parts(self) -> Iterator[str]:
+        """_render_shell piece by piece."""
+        if self.shell_mode == 'pages':
+            yield from self._home_parts("Flowery.Uno Documentation")
+            return
+
+        yield f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Flowery.Uno Documentation</title>
+    <link rel="stylesheet" href="{self.asset_names['shell.css']}">
+</head>
+<body>
+    <div class="shell">
+        '''
+        yield from self._sidebar_parts()
+        yield f'''        <iframe name="viewer" class="viewer" src="home.html"></iframe>
     </div>
 
-    <script>
-{shell_js}
-    </script>
+    <script src="{self.asset_names['shell.js']}"></script>
+    <script src="{self.asset_names['search.js']}"></script>
 </body>
 </html>'''
-        (self.output_dir / "index.html").write_text(html, encoding='utf-8')
 
     def _generate_home(self):
-        """Generate the home content page (home.html)."""
-        # Generate llms.txt for AI assistants (combine all curated docs)
-        if self.use_curated_only:
-            llms_content = self._generate_llms_txt_from_curated()
-        else:
-            llms_content = (self.docs_dir / "llms.txt").read_text(encoding='utf-8')
+        """Generate the home content page (home.html) and llms.txt."""
+        if self.streaming:
+            # Both are written from the llms.txt lines as they are generated
+            self._write_parts("llms.txt", join_lines(self._llms_txt_lines()))
+            self._stream_page("home.html", self._home_parts())
+            return
+
+        llms_content = self._llms_txt()
 
         # Write llms.txt to output directory for AI assistants
-        (self.output_dir / "llms.txt").write_text(llms_content, encoding='utf-8')
+        self._write_output("llms.txt", llms_content)
+
+        self._write_page("home.html", self._render_home(llms_content))
+
+    def _llms_txt(self) -> str:
+        """llms.txt for AI assistants (combined from curated docs, or the generated llms/llms.txt)."""
+        return '\n'.join(self._llms_txt_lines())
+
+    def _llms_txt_lines(self) -> Iterator[str]:
+        """The lines of llms.txt (without line breaks), one at a time."""
+        if self.use_curated_only:
+            return self._curated_llms_txt_lines()
+        return read_lines(self.fs, self.docs_dir / "llms.txt")
 
-        # Convert to HTML
-        html_content = self.converter.convert(llms_content)
+    def _render_home(self, llms_content: str, title: str = "Documentation") -> str:
+        """Render the home page from the llms.txt content."""
+        return self._page_template(title, ''.join(self._home_content([self.converter.convert(llms_content)])), depth=0)
 
+    def _home_parts(self, title: str = "Documentation") -> Iterator[str]:
+        """_render_home piece by piece: llms.txt converted block by block while its lines are generated."""
+        html = self.converter.convert_blocks(self._llms_txt_lines(), depth=1)
+        return self._page_parts(title, self._home_content(html), depth=0)
+
+    def _home_content(self, html: Iterable[str]) -> Iterator[str]:
+        """The home page content around the converted llms.txt (given in pieces that do not split tags)."""
         # Insert LLM documentation link after Quick Start section
         llm_link_html = '''<div class="llm-link">
     <h2>For AI Assistants</h2>
     <p>📄 <a href="llms.txt"><strong>llms.txt</strong></a> - Machine-readable documentation in plain markdown format, optimized for LLMs and AI code assistants.</p>
+    <p>📚 <a href="llms-full.txt"><strong>llms-full.txt</strong></a> - Every doc in one file, with a <a href="llms-full.index.json">byte-range index</a> per control and section. Each page is also available as raw markdown (e.g. <a href="controls/DaisyButton.md">controls/DaisyButton.md</a>).</p>
 </div>
 '''
         # Insert after Quick Start (after the first </pre> which closes the code block)
-        if '</pre>' in html_content:
-            insert_pos = html_content.find('</pre>') + len('</pre>')
-            html_content = html_content[:insert_pos] + '\n' + llm_link_html + html_content[insert_pos:]
+        inserted = False
+        for html_content in html:
+            if not inserted and '</pre>' in html_content:
+                insert_pos = html_content.find('</pre>') + len('</pre>')
+                html_content = html_content[:insert_pos] + '\n' + llm_link_html + html_content[insert_pos:]
+                inserted = True
+            yield html_content
 
         # Add footer with project links
         footer_html = '''
@@ -674,187 +2432,71 @@ class SiteGenerator:
     </div>
 </footer>
 '''
-
-        full_content = html_content + footer_html
-        page = self._page_template("Documentation", full_content, depth=0)
-        (self.output_dir / "home.html").write_text(page, encoding='utf-8')
-
-    def _generate_llms_txt_from_curated(self) -> str:
-        """Generate a master llms.txt from curated docs."""
-        lines = []
-        lines.append("# Flowery.Uno Component Library")
-        lines.append("")
-        lines.append("Flowery.Uno is an Uno Platform / WinUI component library inspired by DaisyUI.")
-        lines.append("It provides styled controls for building modern cross-platform applications.")
-        lines.append("")
-        lines.append("## Quick Start")
-        lines.append("")
-        lines.append("Add the namespace to your XAML:")
-        lines.append("```xml")
-        lines.append('xmlns:daisy="using:Flowery.Controls"')
-        lines.append("```")
-        lines.append("")
+        yield footer_html
+
+    def _curated_llms_txt_lines(self) -> Iterator[str]:
+        """Generate a master llms.txt from curated docs, one line at a time."""
+        yield "# Flowery.Uno Component Library"
+        yield ""
+        yield "Flowery.Uno is an Uno Platform / WinUI component library inspired by DaisyUI."
+        yield "It provides styled controls for building modern cross-platform applications."
+        yield ""
+        yield "## Quick Start"
+        yield ""
+        yield "Add the namespace to your XAML:"
+        yield "```xml"
+        yield 'xmlns:daisy="using:Flowery.Controls"'
+        yield "```"
+        yield ""
 
         # Controls Overview (main controls only)
-        lines.append("## Controls Overview")
-        lines.append("")
-        lines.append("| Control | Description |")
-        lines.append("|---------|-------------|")
+        yield "## Controls Overview"
+        yield ""
+        yield "| Control | Description |"
+        yield "|---------|-------------|"
 
-        main_controls = [c for c in self.controls if not c.get('is_helper', False)]
-        helper_controls = [c for c in self.controls if c.get('is_helper', False)]
+        main_controls = self.model.main_controls
+        helper_controls = self.model.helper_controls
 
-        for ctrl in sorted(main_controls, key=lambda c: c['name']):
+        for ctrl in main_controls:
             name = ctrl['name']
             display_name = name.replace('Daisy', '')
             is_custom = display_name.startswith(self.CUSTOM_CONTROL_PREFIXES)
             badge = ' <sup class="custom-badge">✦</sup>' if is_custom else ''
-            # Try to extract description from the markdown file
-            desc = f"{display_name} control"
-            try:
-                content = ctrl['file'].read_text(encoding='utf-8')
-                # Look for first paragraph after "# Overview" or first non-header line
-                content_clean = strip_html_comments_outside_code(content)
-                # Find first meaningful paragraph
-                for line in content_clean.split('\n'):
-                    line = line.strip()
-                    if line and not line.startswith('#') and not line.startswith('|') and not line.startswith('-') and not line.startswith('<'):
-                        desc = line
-                        break
-            except Exception:
-                pass
-            lines.append(f"| [{name}](controls/{name}.html){badge} | {desc} |")
+            # First meaningful line of the doc (from the site model), or a generic fallback
+            desc = ctrl['description'] or f"{display_name} control"
+            yield f"| [{name}](controls/{name}.html){badge} | {desc} |"
 
         # Helpers section
         if helper_controls:
-            lines.append("")
-            lines.append("### Helper Classes")
-            lines.append("")
-            lines.append("| Class | Description |")
-            lines.append("|-------|-------------|")
-            for ctrl in sorted(helper_controls, key=lambda c: c['name']):
+            yield ""
+            yield "### Helper Classes"
+            yield ""
+            yield "| Class | Description |"
+            yield "|-------|-------------|"
+            for ctrl in helper_controls:
                 name = ctrl['name']
                 display_name = name.replace('Daisy', '')
                 is_custom = display_name.startswith(self.CUSTOM_CONTROL_PREFIXES)
                 badge = ' <sup class="custom-badge">✦</sup>' if is_custom else ''
-                desc = f"{display_name} helper"
-                try:
-                    content = ctrl['file'].read_text(encoding='utf-8')
-                    content_clean = strip_html_comments_outside_code(content)
-                    for line in content_clean.split('\n'):
-                        line = line.strip()
-                        if line and not line.startswith('#') and not line.startswith('|') and not line.startswith('-') and not line.startswith('<'):
-                            desc = line
-                            break
-                except Exception:
-                    pass
-                lines.append(f"| [{name}](controls/{name}.html){badge} | {desc} |")
-
-        lines.append("")
-        lines.append("## Common Patterns")
-        lines.append("")
-        lines.append("### Shared Enums")
-        lines.append("")
-        lines.append("**DaisyColor** - Theme colors used across many controls:")
-        lines.append("```")
-        lines.append("Default, Primary, Secondary, Accent, Neutral, Info, Success, Warning, Error")
-        lines.append("```")
-        lines.append("")
-        lines.append("**DaisySize** - Size variants:")
-        lines.append("```")
-        lines.append("ExtraSmall, Small, Medium (default), Large, ExtraLarge")
-        lines.append("```")
-        lines.append("")
-        lines.append("**DaisyPlacement** - Position options:")
-        lines.append("```")
-        lines.append("Top, Bottom, Start, End")
-        lines.append("```")
-        lines.append("")
-        lines.append("### Control-Specific Enums")
-        lines.append("")
-        lines.append("**Input Controls:**")
-        lines.append("- **DaisyInputVariant**: 'Bordered', 'Ghost', 'Filled', 'Primary', 'Secondary', 'Accent', 'Info', 'Success', 'Warning', 'Error'")
-        lines.append("- **DaisySelectVariant**: 'Bordered', 'Ghost', 'Filled', 'Primary', 'Secondary', 'Accent', ...'")
-        lines.append("- **DaisyCheckBoxVariant**: 'Default', 'Primary', 'Secondary', 'Accent', 'Neutral', 'Success', 'Warning', 'Info', 'Error'")
-        lines.append("- **DaisyRadioVariant**: 'Default', 'Primary', 'Secondary', 'Accent', 'Success', 'Warning', 'Info', 'Error'")
-        lines.append("- **DaisyToggleVariant**: 'Default', 'Primary', 'Secondary', 'Accent', 'Success', 'Warning', 'Info', 'Error'")
-        lines.append("- **DaisyRangeVariant**: 'Default', 'Primary', 'Secondary', 'Accent', 'Success', 'Warning', 'Info', 'Error'")
-        lines.append("- **DaisyLabelPosition**: 'None', 'Top', 'Floating', 'Inset'")
-        lines.append("- **DaisyNumberBase**: 'Decimal', 'Hexadecimal', 'Binary', 'Octal', 'ColorHex', 'IPAddress'")
-        lines.append("- **DaisyHexCase**: 'Upper', 'Lower'")
-        lines.append("- **RatingPrecision**: 'Full', 'Half', 'Precise'")
-        lines.append("")
-        lines.append("**Display Controls:**")
-        lines.append("- **DaisyBadgeVariant**: 'Default', 'Neutral', 'Primary', 'Secondary', 'Accent', 'Ghost', 'Info', 'Success', 'Warning', 'Error'")
-        lines.append("- **DaisyAlertVariant**: 'Info', 'Success', 'Warning', 'Error'")
-        lines.append("- **DaisyProgressVariant**: 'Default', 'Primary', 'Secondary', 'Accent', 'Info', 'Success', 'Warning', 'Error'")
-        lines.append("- **DaisyCardVariant**: 'Normal', 'Compact', 'Side'")
-        lines.append("- **DaisyStatVariant**: 'Default', 'Primary', 'Secondary', 'Accent', 'Info', 'Success', 'Warning', 'Error'")
-        lines.append("- **DaisyAvatarShape**: 'Square', 'Rounded', 'Circle'")
-        lines.append("- **DaisyStatus**: 'None', 'Online', 'Offline'")
-        lines.append("- **DaisyMaskVariant**: 'Squircle', 'Heart', 'Hexagon', 'Circle', 'Square', 'Diamond', 'Triangle'")
-        lines.append("- **DaisyMockupVariant**: 'Phone', 'Code', 'Window', 'Browser'")
-        lines.append("- **DaisyLoadingVariant**: 'Spinner', 'Dots', 'Ring', 'Ball', 'Bars', 'Infinity', 'Orbit', 'Snake', 'Pulse', 'Wave', 'Bounce', 'Matrix', 'Hourglass', 'Heartbeat', 'CursorBlink', ...")
-        lines.append("- **DaisyStatusIndicatorVariant**: 'Default', 'Ping', 'Bounce', 'Pulse', 'Blink', 'Ripple', 'Heartbeat', 'Spin', 'Wave', 'Glow', 'Radar', 'Sonar', 'Beacon', ...")
-        lines.append("- **CountdownClockUnit**: 'Seconds', 'Minutes', 'Hours', 'Days'")
-        lines.append("- **WeatherCondition**: 'Sunny', 'PartlyCloudy', 'Cloudy', 'Rain', 'Snow', 'Thunderstorm', ...")
-        lines.append("")
-        lines.append("**Navigation & Layout:**")
-        lines.append("- **DaisyTabVariant**: 'Bordered', 'Lifted', 'Boxed'")
-        lines.append("- **DaisyStepColor**: 'Default', 'Primary', 'Secondary', 'Accent', 'Info', 'Success', 'Warning', 'Error'")
-        lines.append("- **TimelineItemPosition**: 'Start', 'End', 'Alternate'")
-        lines.append("- **DaisyDividerColor**: 'Default', 'Neutral', 'Primary', 'Secondary', 'Accent', 'Success', 'Warning', 'Info', 'Error'")
-        lines.append("- **DaisyDividerPlacement**: 'Default', 'Start', 'End'")
-        lines.append("- **DaisyPopoverPlacement**: 'Top', 'Bottom', 'Left', 'Right', 'TopStart', 'TopEnd', 'BottomStart', 'BottomEnd'")
-        lines.append("- **DaisyStackNavigation**: 'None', 'Arrows', 'Dots', 'Both'")
-        lines.append("- **FabLayout**: 'Horizontal', 'Vertical'")
-        lines.append("- **DockSize**: 'Small', 'Medium', 'Large'")
-        lines.append("")
-        lines.append("**Theme Controls:**")
-        lines.append("- **ThemeControllerMode**: 'Toggle', 'Checkbox', 'Swap', 'ToggleWithText', 'ToggleWithIcons'")
-        lines.append("- **ThemeRadioMode**: 'Radio', 'Button'")
-        lines.append("- **SwapEffect**: 'None', 'Rotate', 'Flip'")
-        lines.append("")
-        lines.append("**Date/Time:**")
-        lines.append("- **DateSelectionMode**: 'Single', 'Range', 'Multiple'")
-        lines.append("- **DateDisableStrategy**: 'None', 'Weekends', 'Weekdays', 'Past', 'Future', 'Custom'")
-        lines.append("- **DateElementDisplay**: 'DayNumber', 'DayName', 'MonthName', 'Full'")
-        lines.append("- **DateItemLayout**: 'Vertical', 'Horizontal'")
-        lines.append("- **DateTimelineHeaderType**: 'None', 'Day', 'Week', 'Month'")
-        lines.append("")
-        lines.append("**Toast Positioning:**")
-        lines.append("- **ToastHorizontalPosition**: 'Start', 'Center', 'End'")
-        lines.append("- **ToastVerticalPosition**: 'Top', 'Bottom'")
-        lines.append("")
-        lines.append("**Effects & Behaviors:**")
-        lines.append("- **ScrambleMode**: 'Characters', 'Words', 'Lines'")
-        lines.append("- **RevealStyle**: 'Fade', 'Slide', 'Scale', 'Typewriter'")
-        lines.append("- **RevealMode**: 'OnLoad', 'OnScroll', 'Manual'")
-        lines.append("- **RevealDirection**: 'Up', 'Down', 'Left', 'Right'")
-        lines.append("- **FollowerShape**: 'Circle', 'Square', 'Ring'")
-        lines.append("")
-        lines.append("**Button Styling:**")
-        lines.append("- **DaisyButtonStyle**: 'Default', 'Outline', 'Dash', 'Soft'")
-        lines.append("- **DaisyButtonShape**: 'Default', 'Wide', 'Block', 'Square', 'Circle'")
-        lines.append("")
-        lines.append("**Color Picker:**")
-        lines.append("- **ColorSliderChannel**: 'Red', 'Green', 'Blue', 'Alpha', 'Hue', 'Saturation', 'Lightness'")
-        lines.append("")
-        lines.append("**Sizing:**")
-        lines.append("- **ResponsiveFontTier**: 'Primary', 'Secondary', 'Tertiary', 'Header'")
-        lines.append("")
-        lines.append("### Theming")
-        lines.append("")
-        lines.append("Use `DaisyThemeManager` to switch themes:")
-        lines.append("```csharp")
-        lines.append('DaisyThemeManager.ApplyTheme("dracula");')
-        lines.append("```")
-        lines.append("")
-        lines.append("**Light themes:** acid, autumn, bumblebee, cmyk, corporate, cupcake, emerald, fantasy, garden, lemonade, light, lofi, nord, pastel, retro, valentine, winter, wireframe")
-        lines.append("")
-        lines.append("**Dark themes:** aqua, black, business, coffee, cyberpunk, dark, dim, dracula, forest, halloween, luxury, night, smooth, sunset, synthwave")
-        lines.append("")
-        return '\n'.join(lines)
+                desc = ctrl['description'] or f"{display_name} helper"
+                yield f"| [{name}](controls/{name}.html){badge} | {desc} |"
+
+        yield ""
+        yield "## Common Patterns"
+        yield ""
+        yield from self.api.llms_enum_lines()
+        yield "### Theming"
+        yield ""
+        yield "Use `DaisyThemeManager` to switch themes:"
+        yield "```csharp"
+        yield 'DaisyThemeManager.ApplyTheme("dracula");'
+        yield "```"
+        yield ""
+        yield "**Light themes:** acid, autumn, bumblebee, cmyk, corporate, cupcake, emerald, fantasy, garden, lemonade, light, lofi, nord, pastel, retro, valentine, winter, wireframe"
+        yield ""
+        yield "**Dark themes:** aqua, black, business, coffee, cyberpunk, dark, dim, dracula, forest, halloween, luxury, night, smooth, sunset, synthwave"
+        yield ""
 
     def _create_tabbed_gallery(self, control_name: str, images: list[str]) -> str:
         """
@@ -892,43 +2534,10 @@ class SiteGenerator:
 
     def _find_control_images(self, control_name: str) -> list[str]:
         """
-        Find images for a control in llms-static/images/.
+        Images for a control in llms-static/images/ (see _map_control_images for the naming patterns).
         Returns list of relative image paths for markdown insertion.
-        Handles multiple naming patterns:
-        - DaisyMockup.png (exact match)
-        - DaisyMockup_a.png, _b.png (chunked with letter suffix)
-        - Mockup(Description).png (short name with parenthesized description)
         """
-        if not self.curated_dir:
-            return []
-
-        images_dir = self.curated_dir / "images"
-        if not images_dir.exists():
-            return []
-
-        found_images = []
-
-        # Check for single image (exact match)
-        single_image = images_dir / f"{control_name}.png"
-        if single_image.exists():
-            found_images.append(f"images/{control_name}.png")
-
-        # Check for chunked images (_a, _b, _c, etc.)
-        for suffix in 'abcdefghij':
-            chunk_image = images_dir / f"{control_name}_{suffix}.png"
-            if chunk_image.exists():
-                found_images.append(f"images/{control_name}_{suffix}.png")
-
-        # Check for descriptive suffix images: ControlName(Description).png
-        # e.g., DaisyMockup(Window).png or Mockup(Window).png
-        short_name = control_name.replace('Daisy', '')  # "Mockup" from "DaisyMockup"
-        for img_file in sorted(images_dir.glob("*.png")):
-            fname = img_file.name
-            # Match patterns like "Mockup(something).png" or "DaisyMockup(something).png"
-            if (fname.startswith(f"{short_name}(") or fname.startswith(f"{control_name}(")) and fname.endswith(").png"):
-                rel_path = f"images/{fname}"
-                if rel_path not in found_images:
-                    found_images.append(rel_path)
+        found_images = self.model.control_images.get(control_name, [])
 
         # Debug output
         if found_images:
@@ -938,161 +2547,135 @@ class SiteGenerator:
 
     def _generate_control_pages(self):
         """Generate HTML pages for each control."""
-        # Separate main controls from helpers for navigation
-        main_controls = [c for c in self.controls if not c.get('is_helper', False)]
+        for ctrl in self._read_ahead_docs(self.model.controls):
+            html_content, parts = self._control_parts(ctrl)
+            self.search.add_page(f"controls/{ctrl['html_name']}", ctrl['name'], html_content)
+            self._write_page_parts(f"controls/{ctrl['html_name']}", parts)
+
+    def _render_control(self, ctrl: dict) -> tuple[str, str]:
+        """Render a control page. Returns (content HTML, full page)."""
+        html_content, parts = self._control_parts(ctrl)
+        return html_content, ''.join(parts)
+
+    def _control_parts(self, ctrl: dict) -> tuple[str, Iterator[str]]:
+        """Render a control page. Returns (content HTML, pieces of the full page)."""
+        # Comment-stripped markdown from the site model (read again in the streaming build),
+        # with the generated API sections the doc lacks
+        md_content = self._control_markdown(ctrl)
+
+        # Insert images if no image reference exists in the content
+        # (curated docs from llms-static/ don't have images from llms-static/images/ added)
+        # Check for markdown syntax ![...](images/...) OR HTML <img src="images/..." or "../images/...">
+        images = self._find_control_images(ctrl['name'])
+        has_image_folder_ref = bool(
+            re.search(r'!\[[^\]]*\]\(\.{0,2}/?images/', md_content) or
+            re.search(r'<img[^>]+src=["\']\.{0,2}/?images/', md_content)
+        )
+        if images and not has_image_folder_ref:
+            # Build image content - use tabbed gallery for multiple images
+            if len(images) == 1:
+                image_md = f"\n![{ctrl['name']}]({images[0]})\n"
+            else:
+                # Create tabbed gallery HTML for multiple images
+                image_md = self._create_tabbed_gallery(ctrl['name'], images)
+
+            # Find insertion point after first heading (# or ##)
+            # Try "## Overview" first, then "# Overview", then any first heading
+            overview_h2 = re.search(r'(## Overview[^\n]*\n)', md_content)
+            overview_h1 = re.search(r'(# Overview[^\n]*\n)', md_content)
+            any_heading = re.search(r'(^#+ [^\n]+\n)', md_content, re.MULTILINE)
+
+            if overview_h2:
+                insert_pos = overview_h2.end()
+                md_content = md_content[:insert_pos] + image_md + md_content[insert_pos:]
+                print(f"      Inserted {'tabbed gallery' if len(images) > 1 else 'image'} after ## Overview for {ctrl['name']}")
+            elif overview_h1:
+                insert_pos = overview_h1.end()
+                md_content = md_content[:insert_pos] + image_md + md_content[insert_pos:]
+                print(f"      Inserted {'tabbed gallery' if len(images) > 1 else 'image'} after # Overview for {ctrl['name']}")
+            elif any_heading:
+                # Insert after first heading, then after the following paragraph
+                heading_end = any_heading.end()
+                rest = md_content[heading_end:]
+                para_end = rest.find('\n\n')
+                if para_end > 0:
+                    insert_pos = heading_end + para_end
+                    md_content = md_content[:insert_pos] + "\n" + image_md + md_content[insert_pos:]
+                    print(f"      Inserted {'tabbed gallery' if len(images) > 1 else 'image'} after first paragraph for {ctrl['name']}")
+                else:
+                    md_content = md_content[:heading_end] + image_md + md_content[heading_end:]
+                    print(f"      Inserted {'tabbed gallery' if len(images) > 1 else 'image'} after heading for {ctrl['name']}")
+            else:
+                # No heading found, prepend
+                md_content = image_md + "\n" + md_content
+                print(f"      Inserted {'tabbed gallery' if len(images) > 1 else 'image'} at start for {ctrl['name']}")
 
-        # 1. Build map of control -> category
-        control_category_map = {}
-        category_controls_map = {} # cat_name -> list of controls
+        # Fix Headings: If it starts with "# Overview", demote it and add proper title
+        md_content = self._with_title(md_content, ctrl['name'])
 
-        # Parse categories to find which controls belong where
-        for cat in self.categories:
-            cat_content = cat['file'].read_text(encoding='utf-8')
-            # Extract control names from list items
-            # - **[DaisyButton](../controls/DaisyButton.html)**
-            found_controls = re.findall(r'\*\*\[?(Daisy\w+)', cat_content)
-            category_controls_map[cat['name']] = found_controls
-            for ctrl_name in found_controls:
-                control_category_map[ctrl_name] = cat
-
-        for ctrl in self.controls:
-            md_content = ctrl['file'].read_text(encoding='utf-8')
-            # Strip HTML comments from curated docs (but preserve them inside code blocks)
-            md_content = strip_html_comments_outside_code(md_content)
-
-            # Insert images if no image reference exists in the content
-            # (curated docs from llms-static/ don't have images from llms-static/images/ added)
-            # Check for markdown syntax ![...](images/...) OR HTML <img src="images/..." or "../images/...">
-            images = self._find_control_images(ctrl['name'])
-            has_image_folder_ref = bool(
-                re.search(r'!\[[^\]]*\]\(\.{0,2}/?images/', md_content) or
-                re.search(r'<img[^>]+src=["\']\.{0,2}/?images/', md_content)
-            )
-            if images and not has_image_folder_ref:
-                # Build image content - use tabbed gallery for multiple images
-                if len(images) == 1:
-                    image_md = f"\n![{ctrl['name']}]({images[0]})\n"
-                else:
-                    # Create tabbed gallery HTML for multiple images
-                    image_md = self._create_tabbed_gallery(ctrl['name'], images)
-
-                # Find insertion point after first heading (# or ##)
-                # Try "## Overview" first, then "# Overview", then any first heading
-                overview_h2 = re.search(r'(## Overview[^\n]*\n)', md_content)
-                overview_h1 = re.search(r'(# Overview[^\n]*\n)', md_content)
-                any_heading = re.search(r'(^#+ [^\n]+\n)', md_content, re.MULTILINE)
-
-                if overview_h2:
-                    insert_pos = overview_h2.end()
-                    md_content = md_content[:insert_pos] + image_md + md_content[insert_pos:]
-                    print(f"      Inserted {'tabbed gallery' if len(images) > 1 else 'image'} after ## Overview for {ctrl['name']}")
-                elif overview_h1:
-                    insert_pos = overview_h1.end()
-                    md_content = md_content[:insert_pos] + image_md + md_content[insert_pos:]
-                    print(f"      Inserted {'tabbed gallery' if len(images) > 1 else 'image'} after # Overview for {ctrl['name']}")
-                elif any_heading:
-                    # Insert after first heading, then after the following paragraph
-                    heading_end = any_heading.end()
-                    rest = md_content[heading_end:]
-                    para_end = rest.find('\n\n')
-                    if para_end > 0:
-                        insert_pos = heading_end + para_end
-                        md_content = md_content[:insert_pos] + "\n" + image_md + md_content[insert_pos:]
-                        print(f"      Inserted {'tabbed gallery' if len(images) > 1 else 'image'} after first paragraph for {ctrl['name']}")
-                    else:
-                        md_content = md_content[:heading_end] + image_md + md_content[heading_end:]
-                        print(f"      Inserted {'tabbed gallery' if len(images) > 1 else 'image'} after heading for {ctrl['name']}")
-                else:
-                    # No heading found, prepend
-                    md_content = image_md + "\n" + md_content
-                    print(f"      Inserted {'tabbed gallery' if len(images) > 1 else 'image'} at start for {ctrl['name']}")
-
-            # Fix Headings: If it starts with "# Overview", demote it and add proper title
-            stripped_content = md_content.strip()
-            if stripped_content.startswith('# Overview'):
-                # Replace the first occurrence
-                md_content = md_content.replace('# Overview', f'# {ctrl["name"]}\n\n## Overview', 1)
-            elif not stripped_content.startswith('# '):
-                # If no H1 at all, add one
-                md_content = f"# {ctrl['name']}\n\n{md_content}"
-
-            html_content = self.converter.convert(md_content)
-
-            # --- Navigation & Breadcrumbs ---
-            nav_html = ""
-            category = control_category_map.get(ctrl['name'])
-
-            if category:
-                # Breadcrumbs
-                nav_html += f'''<div class="breadcrumbs">
-    <a href="../home.html">Home</a> &gt;
-    <a href="../categories/{category["html_name"]}">{category["name"]}</a>
-</div>'''
+        html_content = self._convert(md_content)
 
-                # Prev/Next
-                siblings = category_controls_map.get(category['name'], [])
-                try:
-                    idx = siblings.index(ctrl['name'])
-                    links = []
-
-                    if idx > 0:
-                        prev_name = siblings[idx-1]
-                        links.append(f'<a href="{prev_name}.html" class="nav-prev">← {prev_name.replace("Daisy", "")}</a>')
-                    else:
-                         links.append('<span></span>') # Spacer
-
-                    if idx < len(siblings) - 1:
-                        next_name = siblings[idx+1]
-                        links.append(f'<a href="{next_name}.html" class="nav-next">{next_name.replace("Daisy", "")} →</a>')
-                    else:
-                        links.append('<span></span>') # Spacer
-
-                    if any(l != '<span></span>' for l in links):
-                        nav_html += f'<div class="doc-nav">{"".join(links)}</div>'
-                except ValueError:
-                    pass # Control not found in its category list (shouldn't happen if map is built correct)
-
-            # Inject nav at top (breadcrumbs) and bottom (prev/next)
-            # Find the end of content to append bottom nav
-            full_page_content = nav_html.split('<div class="doc-nav">')[0] + html_content # Breadcrumbs + Content
-            if '<div class="doc-nav">' in nav_html:
-                 full_page_content += nav_html.split('</div>')[-2] + '</div>' # Append doc-nav
-
-            # Actually, let's keep it simple: Breadcrumbs top, Nav bottom
-            breadcrumbs = f'''<div class="breadcrumbs">
+        # Breadcrumbs top, prev/next navigation bottom
+        category = self.model.control_category.get(ctrl['name'])
+        breadcrumbs = f'''<div class="breadcrumbs">
     <a href="../home.html">Home</a> &gt;
     <a href="../categories/{category["html_name"]}">{category["name"]}</a>
 </div>''' if category else f'<div class="breadcrumbs"><a href="../home.html">Home</a></div>'
 
-            # Prev/Next navigation - alphabetical across all main controls
-            prev_next = ""
-            all_control_names = sorted([c['name'] for c in main_controls])
-            if ctrl['name'] in all_control_names:
-                idx = all_control_names.index(ctrl['name'])
-                prev_link = f'<a href="{all_control_names[idx-1]}.html">← {all_control_names[idx-1].replace("Daisy", "")}</a>' if idx > 0 else ""
-                next_link = f'<a href="{all_control_names[idx+1]}.html">{all_control_names[idx+1].replace("Daisy", "")} →</a>' if idx < len(all_control_names) - 1 else ""
+        # Prev/Next navigation - alphabetical across all main controls
+        prev_next = ""
+        nav = self.model.nav.get(ctrl['name'])
+        if nav:
+            prev_name, next_name = nav['prev'], nav['next']
+            prev_link = f'<a href="{prev_name}.html">← {prev_name.replace("Daisy", "")}</a>' if prev_name else ""
+            next_link = f'<a href="{next_name}.html">{next_name.replace("Daisy", "")} →</a>' if next_name else ""
 
-                if prev_link or next_link:
-                    prev_next = f'''<div class="doc-nav">
+            if prev_link or next_link:
+                prev_next = f'''<div class="doc-nav">
     <div class="nav-left">{prev_link}</div>
     <div class="nav-right">{next_link}</div>
 </div>'''
 
-            final_content = breadcrumbs + html_content + prev_next
-
-            page = self._page_template(ctrl['name'], final_content, depth=1)
-            (self.output_dir / "controls" / ctrl['html_name']).write_text(page, encoding='utf-8')
+        hints = self._resource_hints(ctrl, html_content)
+        return html_content, self._page_parts(ctrl['name'], [breadcrumbs, html_content, prev_next], depth=1, hints=hints)
 
     def _generate_category_pages(self):
         """Generate HTML pages for each category."""
-        for cat in self.categories:
-            md_content = cat['file'].read_text(encoding='utf-8')
-            html_content = self.converter.convert(md_content)
-            page = self._page_template(cat['name'], html_content, depth=1)
-            (self.output_dir / "categories" / cat['html_name']).write_text(page, encoding='utf-8')
+        for cat in self.model.categories:
+            html_content, parts = self._category_parts(cat)
+            self.search.add_page(f"categories/{cat['html_name']}", cat['name'], html_content)
+            self._write_page_parts(f"categories/{cat['html_name']}", parts)
+
+    def _render_category(self, cat: dict) -> tuple[str, str]:
+        """Render a category page. Returns (content HTML, full page)."""
+        html_content, parts = self._category_parts(cat)
+        return html_content, ''.join(parts)
+
+    def _category_parts(self, cat: dict) -> tuple[str, Iterator[str]]:
+        """Render a category page. Returns (content HTML, pieces of the full page)."""
+        html_content = self._convert(cat['markdown'])
+        return html_content, self._page_parts(cat['name'], [html_content], depth=1)
 
 
-def main():
+def build_site(root: Path | None = None, fs: BuildFS | None = None, use_generated: bool = False,
+               **options) -> tuple[bool, dict[str, bytes]]:
+    """
+    Build the site of a repository (default: this one) as generate_site.py does, on fs (default:
+    the disk). options are SiteGenerator keyword arguments. Returns whether all pages are within
+    their budgets, and the generated files by path under docs/ (SiteGenerator.outputs()):
+
+        ok, outputs = build_site(fs=MemoryFS(base=DiskFS()))  # docs/ is not touched
+    """
+    root = repo_root(root)
+    generator = SiteGenerator(root / "llms", root / "docs",
+                              curated_dir=None if use_generated else root / "llms-static",
+                              cache_dir=cache_dir('site', root), fs=fs, **options)
+    within_budgets = generator.generate()
+    return within_budgets, generator.outputs()
+
+
+def main(argv: list[str] | None = None, generated_docs: dict[Path, str] | None = None):
+    """Command line entry point. generated_docs: docs generate_docs.py wrote in this process (python -m Utils all)."""
     parser = argparse.ArgumentParser(
         description="Generate Flowery.Uno static documentation site.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1100,6 +2683,10 @@ def main():
 Examples:
   python Utils/generate_site.py                # Use curated llms-static/ only (default)
   python Utils/generate_site.py --use-generated # Use llms/ (auto-generated) docs
+  python Utils/generate_site.py --link          # Hardlink images for a fast local preview
+  python Utils/generate_site.py --serve         # Dev server with live reload (writes nothing)
+  python Utils/generate_site.py --only DaisyGlass # Re-render one page after a full build
+  python Utils/generate_site.py --shell iframe  # Sidebar shell with the pages in an iframe
         """
     )
     parser.add_argument(
@@ -1108,10 +2695,101 @@ Examples:
         default=False,
         help='Use llms/ (auto-generated) docs instead of curated llms-static/'
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        '--link',
+        action='store_true',
+        default=False,
+        help='Hardlink images into docs/images/ instead of copying them (for local previews)'
+    )
+    parser.add_argument(
+        '--prune-images',
+        action='store_true',
+        default=False,
+        help='Leave images that no page references out of docs/images/'
+    )
+    parser.add_argument(
+        '--no-transcode',
+        action='store_true',
+        default=False,
+        help='Skip transcoding animated GIFs to MP4/WebP (the GIFs are embedded as they are)'
+    )
+    parser.add_argument(
+        '--no-compress',
+        action='store_true',
+        default=False,
+        help='Skip writing precompressed .gz/.br files next to the text outputs'
+    )
+    parser.add_argument(
+        '--no-optimize-images',
+        action='store_true',
+        default=False,
+        help='Copy PNGs as they are instead of recompressing them losslessly'
+    )
+    parser.add_argument(
+        '--no-minify',
+        action='store_true',
+        default=False,
+        help='Write HTML pages with their template whitespace (easier to read)'
+    )
+    parser.add_argument(
+        '--budgets',
+        metavar='FILE',
+        help='JSON file overriding page budgets in KB, e.g. {"control": {"html": 120, "total": 2048}}'
+    )
+    parser.add_argument(
+        '--strict-budgets',
+        action='store_true',
+        default=False,
+        help='Fail the build (exit code 1) when a page exceeds its budget instead of warning'
+    )
+    parser.add_argument(
+        '--streaming',
+        action='store_true',
+        default=False,
+        help='Bounded-memory build for very large corpora: docs are read when rendered and converted '
+             'block by block, and pages, sidebars and llms.txt are written piece by piece'
+    )
+    parser.add_argument(
+        '--diff-against',
+        metavar='MANIFEST',
+        help='Report files added, changed and removed relative to the build-manifest.json of a deployed build'
+    )
+    parser.add_argument(
+        '--shell',
+        choices=SHELL_MODES,
+        default='pages',
+        help="Layout: 'pages' puts the sidebar on every page and swaps content in place (default); "
+             "'iframe' shows the pages in an iframe next to the sidebar of index.html"
+    )
+    parser.add_argument(
+        '--only',
+        metavar='NAME',
+        help='Re-render just one control, guide or category page (e.g. DaisyGlass) and its images'
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        default=False,
+        help='Build in memory and list the outputs that differ from docs/ (exit code 1 if any); nothing is written'
+    )
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        default=False,
+        help='Serve the site from memory with live reload instead of writing docs/'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=8000,
+        help='Port for --serve (default: 8000)'
+    )
+    args = parser.parse_args(argv)
+    if args.check and (args.serve or args.only):
+        parser.error("--check builds the whole site; it cannot be combined with --serve or --only")
 
     script_dir = Path(__file__).parent
-    root_dir = script_dir.parent
+    root_dir = repo_root()
     llms_dir = root_dir / "llms"
     curated_dir = root_dir / "llms-static"
     docs_dir = root_dir / "docs"
@@ -1121,15 +2799,59 @@ Examples:
         if not llms_dir.exists():
             print("Error: llms/ folder not found. Run generate_docs.py --auto-parse first.")
             return
-        generator = SiteGenerator(llms_dir, docs_dir, curated_dir=None)
-    else:
+        curated_dir = None
+    elif not curated_dir.exists():
         # Use curated llms-static/ folder (default)
-        if not curated_dir.exists():
-            print("Error: llms-static/ folder not found.")
+        print("Error: llms-static/ folder not found.")
+        return
+
+    # --check: sources are read from disk, every output and cache write stays in memory
+    fs = MemoryFS(base=DiskFS()) if args.check else None
+
+    def make_generator() -> SiteGenerator:
+        return SiteGenerator(llms_dir, docs_dir, curated_dir=curated_dir,
+                             link_images=args.link, prune_images=args.prune_images,
+                             cache_dir=cache_dir('site', root_dir), compress=not args.no_compress,
+                             diff_against=Path(args.diff_against) if args.diff_against else None,
+                             shell_mode=args.shell, transcode=not args.no_transcode,
+                             optimize_images=not args.no_optimize_images, minify=not args.no_minify,
+                             budgets=load_budgets(Path(args.budgets) if args.budgets else None),
+                             strict_budgets=args.strict_budgets,
+                             streaming=args.streaming and not args.serve,  # The dev server renders from memory
+                             generated_docs=generated_docs, fs=fs)
+
+    if args.serve:
+        from site_server import DevServer  # Only the dev server needs http.server
+
+        watch = [
+            (llms_dir / "controls", "*.md"),
+            (llms_dir / "categories", "*.md"),
+            (script_dir, "site_template.css"),
+            (script_dir, "site_*.js"),
+        ]
+        if curated_dir:
+            watch += [(curated_dir, "*.md"), (curated_dir / "images", "*")]
+        DevServer(make_generator, watch, port=args.port).serve_forever()
+        return
+
+    if args.only:
+        if not docs_dir.exists():
+            print("Error: docs/ folder not found. Run a full build first.")
             return
-        generator = SiteGenerator(llms_dir, docs_dir, curated_dir=curated_dir)
-
-    generator.generate()
+        if not make_generator().generate_only(args.only):
+            sys.exit(1)
+        return
+
+    within_budgets = make_generator().generate()
+    if fs is not None:
+        written, deleted = fs.changes(docs_dir)
+        print(f"\nCheck: {len(written)} output(s) differ from docs/, {len(deleted)} would be removed")
+        for label, paths in (('changed', written), ('removed', deleted)):
+            for path in paths:
+                print(f"  {label:8} {path.relative_to(docs_dir).as_posix()}")
+        within_budgets = within_budgets and not (written or deleted)
+    if not within_budgets:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
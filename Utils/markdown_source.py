@@ -0,0 +1,72 @@
+"""
+Flowery.Uno Markdown Source
+
+Helpers for reading the curated markdown that both the site generator and
+docs_query.py need: stripping the metadata comments and listing the headings
+with the anchors the site gives them. Kept apart from generate_site.py so the
+query tool starts without importing the generator.
+"""
+
+import re
+
+
+def strip_html_comments_outside_code(content: str) -> str:
+    """
+    Remove HTML comments (<!-- ... -->) but preserve them inside code blocks.
+    Code blocks are delimited by ``` markers.
+    """
+    result = []
+    in_code_block = False
+    lines = content.split('\n')
+
+    for line in lines:
+        # Check for code block delimiter
+        if line.strip().startswith('```'):
+            in_code_block = not in_code_block
+            result.append(line)
+            continue
+
+        if in_code_block:
+            # Inside code block - preserve everything including comments
+            result.append(line)
+        else:
+            # Outside code block - strip HTML comments
+            cleaned = re.sub(r'<!--.*?-->', '', line)
+            # Only add non-empty lines (or preserve intentional blank lines)
+            if cleaned.strip() or not line.strip():
+                result.append(cleaned)
+
+    return '\n'.join(result)
+
+
+def slugify_heading(text: str) -> str:
+    """GitHub-style heading anchor: tags and punctuation removed, lowercase, spaces to hyphens."""
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'[^\w\s-]', '', text.lower()).strip()
+    return text.replace(' ', '-')
+
+
+def unique_anchor(anchor: str, used: dict[str, int]) -> str:
+    """Disambiguate repeated anchors on one page the way GitHub does (name, name-1, name-2, ...)."""
+    count = used.get(anchor, 0)
+    used[anchor] = count + 1
+    return f"{anchor}-{count}" if count else anchor
+
+
+def markdown_headings(lines: list[str], max_level: int = 4):
+    """
+    Yield (line_index, level, text, anchor) for each ATX heading up to max_level outside code blocks.
+    Anchors match the ids MarkdownToHtml (generate_site.py) gives the rendered headings.
+    """
+    used_anchors: dict[str, int] = {}
+    in_code_block = False
+    for i, line in enumerate(lines):
+        if line.strip().startswith('```'):
+            in_code_block = not in_code_block
+            continue
+        if in_code_block or not line.startswith('#'):
+            continue
+        level = len(line) - len(line.lstrip('#'))
+        if level <= max_level and line[level:level + 1] == ' ':
+            text = line[level + 1:].strip()
+            yield i, level, text, unique_anchor(slugify_heading(text), used_anchors)
@@ -0,0 +1,48 @@
+"""
+Flowery.Uno Repository Paths
+
+Repository-root discovery and the shared cache folder of the Utils tools, so the
+generators, count_loc.py, docs_query.py and `python -m Utils` agree on both.
+
+The root is the nearest folder at or above a start folder that holds a solution
+file (*.sln); by default the search starts at the folder above Utils/. Every tool
+keeps its cache in a subfolder of one cache folder: <root>/.cache, or the folder
+in FLOWERY_CACHE_DIR (set by `python -m Utils --cache-dir`).
+"""
+
+import os
+from pathlib import Path
+
+
+UTILS_DIR = Path(__file__).resolve().parent
+
+# Environment variable overriding <root>/.cache for every tool
+CACHE_DIR_ENV = 'FLOWERY_CACHE_DIR'
+
+# Folders searched upward for a solution file
+MAX_ROOT_DEPTH = 10
+
+
+def find_sln_root(start: Path) -> Path | None:
+    """Walk upward to find a directory containing a .sln file."""
+    current = start
+    for _ in range(MAX_ROOT_DEPTH):
+        if any(current.glob("*.sln")):
+            return current
+        parent = current.parent
+        if parent == current:
+            break
+        current = parent
+    return None
+
+
+def repo_root(start: Path | None = None) -> Path:
+    """The repository root above start (default: the folder above Utils/), or start itself without a solution."""
+    start = (start or UTILS_DIR.parent).resolve()
+    return find_sln_root(start) or start
+
+
+def cache_dir(tool: str, root: Path | None = None) -> Path:
+    """Cache folder of one tool (e.g. 'site'): a subfolder of the shared cache folder."""
+    shared = os.environ.get(CACHE_DIR_ENV)
+    return (Path(shared) if shared else (root or repo_root()) / ".cache") / tool
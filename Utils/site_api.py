@@ -0,0 +1,183 @@
+"""
+Flowery.Uno Site API Reference
+
+Dependency properties and enums of the library, parsed from the C# sources
+(Flowery.Uno/**/*.cs) with generate_docs.CSharpParser. Used by generate_site.py:
+    - Control pages get generated "Properties" and "Enums" sections (type, default and
+      summary from the source) when their curated doc has no such section.
+    - llms.txt lists every public enum: shared enums (property types of several
+      classes), then the enums of each class, then those no property uses.
+
+Properties are merged per owner class (the typeof() owner of the registration), so the
+parts of a partial class in several files make one table. Parse results are cached per
+source file by content hash in api.json (and dropped when the parser changes), so an
+unchanged build reads the sources but parses none of them.
+"""
+
+import hashlib
+import json
+import re
+from collections.abc import Iterator
+from pathlib import Path
+
+from build_fs import BuildFS, file_sha256
+from build_io import read_ahead
+from generate_docs import CSharpParser, EnumInfo, PropertyInfo
+
+
+# Classes whose properties use an enum before it counts as shared in llms.txt
+SHARED_ENUM_MIN_USERS = 3
+
+# Enum values listed per enum in llms.txt (the rest become '...')
+MAX_ENUM_VALUES_IN_OVERVIEW = 12
+
+# Curated doc headings that already cover the generated sections
+PROPERTIES_HEADING_PATTERN = re.compile(r'^#{2,4}\s.*\bpropert(?:y|ies)\b', re.IGNORECASE | re.MULTILINE)
+ENUMS_HEADING_PATTERN = re.compile(r'^#{2,4}\s.*\benums?\b', re.IGNORECASE | re.MULTILINE)
+
+
+def table_cell(text: str) -> str:
+    """Text for a markdown table cell: one line, '|' escaped."""
+    return ' '.join(text.split()).replace('|', '\\|')
+
+
+class ApiReference:
+    """Properties by owner class and enums by name, from every C# file under a source folder."""
+
+    def __init__(self, properties: dict[str, list[PropertyInfo]] | None = None,
+                 enums: dict[str, tuple[EnumInfo, str]] | None = None):
+        self.properties = properties or {}  # Owner class -> properties in source order
+        self.enums = enums or {}  # Enum name -> (enum, source folder relative to the source root)
+        self.parsed = 0  # Source files parsed by load() (the rest came from the cache)
+        self.files = 0  # Source files read by load()
+
+    @classmethod
+    def load(cls, fs: BuildFS, source_dir: Path, cache_path: Path) -> 'ApiReference':
+        """Read every .cs file under source_dir, parsing only those not in the cache (by content hash)."""
+        parser_hash = file_sha256(Path(__file__).with_name('generate_docs.py'))
+        try:
+            cache = json.loads(fs.read_text(cache_path))
+        except (FileNotFoundError, ValueError):
+            cache = {}
+        cached = cache.get('files', {}) if cache.get('parser') == parser_hash else {}
+
+        reference = cls()
+        parser = CSharpParser()
+        entries = {}
+        paths = fs.glob(source_dir, "**/*.cs")
+        for path, content in zip(paths, read_ahead(fs.read_text, paths)):
+            rel_path = path.relative_to(source_dir).as_posix()
+            digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+            entry = cached.get(rel_path)
+            if entry is None or entry['hash'] != digest:
+                members, enums = parser.parse_members(content)
+                entry = {
+                    'hash': digest,
+                    'properties': {owner: [vars(prop) for prop in props] for owner, props in members.items()},
+                    'enums': [vars(enum) for enum in enums],
+                }
+                reference.parsed += 1
+            entries[rel_path] = entry
+            folder = path.parent.relative_to(source_dir).as_posix()
+            for owner, props in entry['properties'].items():
+                reference.properties.setdefault(owner, []).extend(PropertyInfo(**prop) for prop in props)
+            for enum in entry['enums']:
+                reference.enums.setdefault(enum['name'], (EnumInfo(**enum), folder))
+        reference.files = len(paths)
+
+        fs.mkdir(cache_path.parent)
+        # Compact, so the C encoder writes it (an indented dump takes longer than parsing the sources)
+        fs.write_bytes(cache_path, json.dumps({'parser': parser_hash, 'files': entries},
+                                              separators=(',', ':'), sort_keys=True).encode('utf-8'))
+        return reference
+
+    def enum_users(self) -> dict[str, list[str]]:
+        """Enum name -> owner classes with a property of that type (sorted)."""
+        users: dict[str, set[str]] = {}
+        for owner, props in self.properties.items():
+            for prop in props:
+                enum_name = prop.prop_type.rstrip('?')
+                if enum_name in self.enums:
+                    users.setdefault(enum_name, set()).add(owner)
+        return {name: sorted(owners) for name, owners in users.items()}
+
+    def sections(self, name: str, md_content: str) -> str:
+        """
+        Markdown of the generated "Properties" and "Enums" sections for the doc of class name,
+        leaving out a section the doc already has (a heading about properties or enums) and
+        enums a heading names. '' if nothing is left.
+        """
+        lines = []
+        props = self.properties.get(name, [])
+        if props and not PROPERTIES_HEADING_PATTERN.search(md_content):
+            lines += ["## Properties", "",
+                      "| Property | Type | Default | Description |",
+                      "|----------|------|---------|-------------|"]
+            for prop in props:
+                lines.append(f"| `{prop.name}` | `{table_cell(prop.prop_type)}` | `{table_cell(prop.default)}` "
+                             f"| {table_cell(prop.description)} |")
+            lines.append("")
+
+        headings = ' '.join(re.findall(r'^#{2,4}\s(.*)$', md_content, re.MULTILINE))
+        enum_names = dict.fromkeys(prop.prop_type.rstrip('?') for prop in props)
+        enums = [self.enums[enum_name][0] for enum_name in enum_names
+                 if enum_name in self.enums and not re.search(rf'\b{enum_name}\b', headings)]
+        if enums and not ENUMS_HEADING_PATTERN.search(md_content):
+            lines += ["## Enums", "",
+                      "| Enum | Values | Description |",
+                      "|------|--------|-------------|"]
+            for enum in enums:
+                values = ', '.join(f"`{value}`" for value in enum.values)
+                lines.append(f"| `{enum.name}` | {values} | {table_cell(enum.description)} |")
+            lines.append("")
+
+        return '\n'.join(lines)
+
+    def llms_enum_lines(self) -> Iterator[str]:
+        """The enum overview of llms.txt: shared enums, enums per class, then enums no property uses."""
+        users = self.enum_users()
+        defaults: dict[str, dict[str, int]] = {}  # Enum name -> default value -> properties using it
+        for props in self.properties.values():
+            for prop in props:
+                if prop.prop_type.rstrip('?') in self.enums:
+                    counts = defaults.setdefault(prop.prop_type.rstrip('?'), {})
+                    counts[prop.default] = counts.get(prop.default, 0) + 1
+
+        shared = sorted((name for name, owners in users.items() if len(owners) >= SHARED_ENUM_MIN_USERS),
+                        key=lambda name: (-len(users[name]), name))
+        if shared:
+            yield "### Shared Enums"
+            yield ""
+        for name in shared:
+            enum = self.enums[name][0]
+            # The default most properties of this type use is marked
+            default = max(defaults[name].items(), key=lambda item: (item[1], item[0]))[0]
+            values = [f"{value} (default)" if value == default else value for value in enum.values]
+            summary = f"{enum.description} " if enum.description else ""
+            yield f"**{name}** - {summary}Used by {len(users[name])} classes:"
+            yield "```"
+            yield ', '.join(values)
+            yield "```"
+            yield ""
+
+        specific = sorted((owners, name) for name, owners in users.items() if name not in shared)
+        if specific:
+            yield "### Control-Specific Enums"
+            yield ""
+            for owners, name in specific:
+                yield f"- **{name}** ({', '.join(owners)}): {self._overview_values(self.enums[name][0])}"
+            yield ""
+
+        unused = sorted((folder, name) for name, (_, folder) in self.enums.items() if name not in users)
+        if unused:
+            yield "### Other Enums"
+            yield ""
+            for folder, name in unused:
+                yield f"- **{name}** ({folder}): {self._overview_values(self.enums[name][0])}"
+            yield ""
+
+    @staticmethod
+    def _overview_values(enum: EnumInfo) -> str:
+        """'A', 'B', ... for llms.txt, cut after MAX_ENUM_VALUES_IN_OVERVIEW values."""
+        values = ', '.join(f"'{value}'" for value in enum.values[:MAX_ENUM_VALUES_IN_OVERVIEW])
+        return values + ', ...' if len(enum.values) > MAX_ENUM_VALUES_IN_OVERVIEW else values
@@ -0,0 +1,169 @@
+"""
+Flowery.Uno Site Stylesheets
+
+Splits site_template.css into minified per-context stylesheets and works out the
+critical CSS of each page. Used by generate_site.py.
+
+Contexts:
+    shell.css      - Rules the sidebar shell (index.html of the iframe layout) can use
+    content.css    - Rules content pages can use: everything not specific to the shell
+    page.css       - Both, for pages that carry the sidebar themselves (default layout)
+
+Critical CSS is the subset of a page's stylesheet matched by its markup above the
+fold (the shell chrome plus the start of the content). It is inlined in <head>, and
+the stylesheet itself loads without blocking the first paint.
+
+Selector matching is conservative: a selector matches if every tag, class and id in
+it occurs in the markup (combinators, pseudo-classes and attribute selectors are
+ignored), so a rule is only left out when it cannot apply.
+"""
+
+import re
+from dataclasses import dataclass
+
+
+CONTEXTS = ('shell', 'content', 'page')
+
+# Characters of page content after the start of .content-body treated as above the fold
+CRITICAL_CONTENT_CHARS = 3000
+
+# Markup the site scripts create at runtime (search results, menu and link states)
+DYNAMIC_MARKUP = ('<ul class="search-results"><li class="search-empty"><a class="active">'
+                  '<small></small></a></li></ul><div class="open"></div>')
+
+# Markup of the shell around the sidebar, in both layouts
+SHELL_LAYOUT_MARKUP = ('<html><body><div class="shell"><iframe class="viewer"></iframe>'
+                       '<main class="viewer viewer-page"></main></div></body></html>')
+
+
+@dataclass
+class CssRule:
+    """A style rule from the template; media is the enclosing @media condition, if any."""
+    selectors: list[str]
+    declarations: str
+    media: str | None = None
+
+
+def parse_css(css: str) -> list[CssRule]:
+    """Parse style rules, including those nested one level deep in @media blocks."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    rules = []
+    pos, media, length = 0, None, len(css)
+    while pos < length:
+        open_brace = css.find('{', pos)
+        close_brace = css.find('}', pos)
+        if media is not None and close_brace != -1 and (open_brace == -1 or close_brace < open_brace):
+            media, pos = None, close_brace + 1  # End of the @media block
+            continue
+        if open_brace == -1:
+            break
+        prelude = css[pos:open_brace].strip()
+        if prelude.startswith('@media'):
+            media, pos = ' '.join(prelude[len('@media'):].split()), open_brace + 1
+            continue
+        end = css.index('}', open_brace)
+        selectors = [' '.join(s.split()) for s in prelude.split(',') if s.strip()]
+        rules.append(CssRule(selectors, css[open_brace + 1:end], media))
+        pos = end + 1
+    return rules
+
+
+def minify_declarations(declarations: str) -> str:
+    """Collapse whitespace and drop optional separators (string values are kept verbatim)."""
+    strings: list[str] = []
+
+    def keep(m: re.Match) -> str:
+        strings.append(m.group(0))
+        return f'\0{len(strings) - 1}\0'
+
+    text = re.sub(r'"[^"]*"|\'[^\']*\'', keep, declarations)
+    text = ' '.join(text.split())
+    text = re.sub(r'\s*([:;,])\s*', r'\1', text).strip(';')
+    return re.sub(r'\0(\d+)\0', lambda m: strings[int(m.group(1))], text)
+
+
+def minify_selector(selector: str) -> str:
+    return re.sub(r'\s*([>+~])\s*', r'\1', selector)
+
+
+def markup_tokens(html: str) -> set[str]:
+    """Tags, .classes and #ids occurring in markup."""
+    tokens = {tag.lower() for tag in re.findall(r'<([a-zA-Z][a-zA-Z0-9-]*)', html)}
+    for classes in re.findall(r'\bclass="([^"]*)"', html):
+        tokens.update('.' + name for name in classes.split())
+    tokens.update('#' + name for name in re.findall(r'\bid="([^"]+)"', html))
+    return tokens
+
+
+def selector_tokens(selector: str) -> list[set[str]]:
+    """Required tokens per compound selector (pseudo-classes and attributes dropped)."""
+    selector = re.sub(r'\[[^\]]*\]', '', selector)
+    selector = re.sub(r'::?[a-zA-Z-]+(\([^)]*\))?', '', selector)
+    compounds = []
+    for compound in re.split(r'[\s>+~]+', selector):
+        tokens = set(re.findall(r'[.#][\w-]+', compound))
+        tag = re.match(r'[a-zA-Z][\w-]*', compound)
+        if tag:
+            tokens.add(tag.group(0).lower())
+        compounds.append(tokens)
+    return compounds
+
+
+class SiteStylesheet:
+    """The parsed template, split into contexts, with per-page critical subsets."""
+
+    def __init__(self, css: str, shell_markup: str):
+        self.rules = parse_css(css)
+        self.source_size = len(css.encode('utf-8'))
+        self._compounds = [[selector_tokens(s) for s in rule.selectors] for rule in self.rules]
+        self._dynamic = markup_tokens(DYNAMIC_MARKUP)
+
+        # Classes and ids only the shell chrome has; rules that need one of them stay out of content.css
+        chrome = markup_tokens(shell_markup + SHELL_LAYOUT_MARKUP) | self._dynamic
+        shell_only = {t for t in chrome if t[0] in '.#'} - markup_tokens('<body class="content-body">')
+        shell_rules = set(self.matching(chrome))
+        content_rules = {i for i, selectors in enumerate(self._compounds)
+                         if not all(any(compound & shell_only for compound in s) for s in selectors)}
+        self.context_rules = {
+            'shell': shell_rules,
+            'content': content_rules,
+            'page': shell_rules | content_rules,
+        }
+
+    def matching(self, tokens: set[str], within: set[int] | None = None) -> list[int]:
+        """Indexes of the rules with a selector that can match markup with these tokens."""
+        tokens = tokens | self._dynamic
+        return [i for i, selectors in enumerate(self._compounds)
+                if (within is None or i in within)
+                and any(all(compound <= tokens for compound in s) for s in selectors)]
+
+    def stylesheet(self, context: str) -> str:
+        """Minified stylesheet of a context."""
+        return self.render(sorted(self.context_rules[context]))
+
+    def critical(self, page: str, context: str) -> str:
+        """Minified rules of a context stylesheet matched by the page markup above the fold."""
+        start = page.find('class="content-body"')
+        above_fold = page if start == -1 else page[:start + CRITICAL_CONTENT_CHARS]
+        return self.critical_for(markup_tokens(above_fold), context)
+
+    def critical_for(self, tokens: set[str], context: str) -> str:
+        """Minified rules of a context stylesheet matched by the tokens of the markup above the fold."""
+        return self.render(self.matching(tokens, self.context_rules[context]))
+
+    def render(self, indexes: list[int]) -> str:
+        """Minified CSS of the given rules in template order, grouping consecutive @media rules."""
+        parts, media = [], None
+        for i in indexes:
+            rule = self.rules[i]
+            if rule.media != media:
+                if media is not None:
+                    parts.append('}')
+                if rule.media is not None:
+                    parts.append(f'@media {rule.media}{{')
+                media = rule.media
+            selectors = ','.join(minify_selector(s) for s in rule.selectors)
+            parts.append(f'{selectors}{{{minify_declarations(rule.declarations)}}}')
+        if media is not None:
+            parts.append('}')
+        return ''.join(parts)
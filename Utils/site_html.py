@@ -0,0 +1,274 @@
+"""
+Flowery.Uno Site HTML
+
+Minifies generated pages and checks them against per-page-type size budgets.
+Used by generate_site.py.
+
+Minification removes comments and collapses the template indentation: whitespace
+runs become one space, and are dropped next to block-level tags (where browsers
+ignore them). The content of <pre>, <code>, <textarea>, <script> and <style> is
+kept verbatim. StreamMinifier gives the same result for a page written in pieces
+(the streaming build), holding back only the text after the last tag of each piece.
+
+Budgets (KB per page type) limit the HTML of a page and its total weight: the HTML
+plus the images it embeds at their shipped size (the full-size file for images
+with srcset, the WebP/MP4 for transcoded GIFs). Shared stylesheets and scripts are
+cached across pages and not counted.
+"""
+
+import json
+import re
+from collections.abc import Callable
+from pathlib import Path
+
+
+# Page type -> {'html': KB, 'total': KB}; override per type with --budgets FILE (same JSON shape)
+DEFAULT_BUDGETS = {
+    'shell': {'html': 80, 'total': 300},
+    'home': {'html': 80, 'total': 300},
+    'guide': {'html': 120, 'total': 1024},
+    'control': {'html': 100, 'total': 1024},
+    'category': {'html': 80, 'total': 300},
+}
+
+# Heaviest pages listed in the budget report
+HEAVIEST_PAGES = 5
+
+# Elements whose content is whitespace-sensitive or not HTML
+PRESERVE_PATTERN = re.compile(r'(<(pre|code|textarea|script|style)\b[^>]*>)(.*?)(</\2>)', re.DOTALL | re.IGNORECASE)
+
+# Tags next to which whitespace does not render (block-level and head elements)
+BLOCK_TAGS = ('html|head|body|meta|link|title|script|style|noscript|div|main|nav|aside|header|footer|section|'
+              'article|ul|ol|li|dl|dt|dd|p|h[1-6]|table|thead|tbody|tfoot|tr|td|th|caption|pre|blockquote|'
+              'hr|br|figure|figcaption|details|summary')
+BLOCK_TAG_PATTERN = re.compile(rf' ?(</?(?:{BLOCK_TAGS})\b[^>]*>) ?', re.IGNORECASE)
+
+# ASCII whitespace only: U+00A0 in content is not collapsible
+WHITESPACE_PATTERN = re.compile(r'[ \t\r\n\f]+')
+
+
+# Opening tag of an element kept verbatim, and the end of a comment (to find pieces cut inside them)
+PRESERVE_OPEN_PATTERN = re.compile(r'<(?:pre|code|textarea|script|style)\b', re.IGNORECASE)
+
+# A block-level tag at the start or end of minified text (a space next to it is dropped)
+LEADING_BLOCK_TAG_PATTERN = re.compile(rf'^</?(?:{BLOCK_TAGS})\b', re.IGNORECASE)
+TRAILING_BLOCK_TAG_PATTERN = re.compile(rf'</?(?:{BLOCK_TAGS})\b[^<>]*>$', re.IGNORECASE)
+
+
+def _collapse(html: str) -> str:
+    """Remove comments and collapse whitespace outside preserved elements (no stripping at the ends)."""
+    preserved: list[str] = []
+
+    def keep(m: re.Match) -> str:
+        preserved.append(m.group(3))
+        return f'{m.group(1)}\0{len(preserved) - 1}\0{m.group(4)}'
+
+    text = PRESERVE_PATTERN.sub(keep, html)
+    text = re.sub(r'<!--.*?-->', '', text, flags=re.DOTALL)
+    text = WHITESPACE_PATTERN.sub(' ', text)
+    text = BLOCK_TAG_PATTERN.sub(r'\1', text)
+    return re.sub(r'\0(\d+)\0', lambda m: preserved[int(m.group(1))], text)
+
+
+def _doctype_line(text: str) -> str:
+    # The doctype stays on its own line, like most minifiers emit it
+    return re.sub(r'^(<!DOCTYPE html>) ?', r'\1\n', text, flags=re.IGNORECASE)
+
+
+def minify_html(html: str) -> str:
+    """Minify a generated page (see the module docstring for what is kept)."""
+    return _doctype_line(_collapse(html).strip())
+
+
+class StreamMinifier:
+    """
+    minify_html for a page fed in pieces of any size: feed() returns the minified output that
+    is final so far, flush() the rest. Pieces are cut before the last tag outside preserved
+    elements and comments (and the whitespace in front of it), so every tag and preserved
+    element is minified whole, and whitespace between pieces collapses as within one.
+    """
+
+    def __init__(self):
+        self.pending = ''
+        self.started = False  # Leading whitespace and the doctype are handled in the first output
+        self.after_block = False  # The output so far ends with a block-level tag
+        self.space = False  # Whitespace after the output so far (emitted once it is known to stay)
+
+    def feed(self, html: str) -> str:
+        text = self.pending + html
+        cut = self._cut(text)
+        self.pending = text[cut:]
+        return self._emit(text[:cut])
+
+    def flush(self) -> str:
+        text, self.pending = self.pending, ''
+        return self._emit(text)
+
+    @staticmethod
+    def _cut(text: str) -> int:
+        """Where to cut text so the first part ends in front of whitespace and a whole tag."""
+        limit = len(text)
+        last_end = 0
+        for m in PRESERVE_PATTERN.finditer(text):
+            last_end = m.end()
+        unclosed = PRESERVE_OPEN_PATTERN.search(text, last_end)
+        if unclosed:
+            limit = unclosed.start()
+        comment = text.rfind('<!--', 0, limit)
+        if comment != -1 and text.find('-->', comment) == -1:
+            limit = comment
+        cut = text.rfind('<', 0, limit)
+        for m in PRESERVE_PATTERN.finditer(text, 0, limit):
+            if m.start() < cut < m.end():
+                cut = m.start()
+        if cut <= 0:
+            return 0
+        return len(text[:cut].rstrip(' \t\r\n\f'))
+
+    def _emit(self, text: str) -> str:
+        # Whitespace at either end (also what is left of a piece that was only a comment) joins
+        # the whitespace around it, and is dropped next to a block-level tag, as in minify_html
+        text = _collapse(text)
+        core = text.strip(' ')
+        space = self.space or text.startswith(' ')
+        if not core:
+            self.space = space
+            return ''
+        self.space = text.endswith(' ')
+        if not self.started:
+            self.started = True
+            return self._ends(_doctype_line(core))
+        if space and not self.after_block and not LEADING_BLOCK_TAG_PATTERN.match(core):
+            core = ' ' + core
+        return self._ends(core)
+
+    def _ends(self, text: str) -> str:
+        self.after_block = bool(TRAILING_BLOCK_TAG_PATTERN.search(text))
+        return text
+
+
+def page_type(rel_path: str) -> str:
+    """Budget type of an output page: shell, home, guide, control or category."""
+    if rel_path == 'index.html':
+        return 'shell'
+    if rel_path == 'home.html':
+        return 'home'
+    return {'controls': 'control', 'categories': 'category'}.get(rel_path.split('/')[0], 'guide')
+
+
+def load_budgets(path: Path | None) -> dict[str, dict[str, int]]:
+    """DEFAULT_BUDGETS updated with the page types and limits given in a JSON file."""
+    budgets = {kind: dict(limits) for kind, limits in DEFAULT_BUDGETS.items()}
+    if path is not None:
+        for kind, limits in json.loads(path.read_text(encoding='utf-8')).items():
+            budgets.setdefault(kind, {}).update(limits)
+    return budgets
+
+
+# Page parts measured for the budget report: (name, start tag -> its end tag, ends at the last end tag)
+HTML_PARTS = (
+    ('critical CSS', {'<style>': '</style>'}, False),
+    ('sidebar', {'<nav class="sidebar">': '</nav>'}, False),
+    ('content', {'<div class="content-body">': '</main>', '<body class="content-body">': '</body>'}, True),
+)
+
+# html_parts() patterns of the parts, from the earliest start tag to its (first or last) end tag
+HTML_PART_PATTERNS = tuple(
+    (part, re.compile('|'.join(f"{re.escape(start)}.*{'' if greedy else '?'}{re.escape(end)}"
+                               for start, end in tags.items()), re.DOTALL))
+    for part, tags, greedy in HTML_PARTS)
+
+
+def html_parts(page: str) -> dict[str, int]:
+    """Bytes of a page by part: inline critical CSS, sidebar, content and the rest of the markup."""
+    sizes = {}
+    for part, pattern in HTML_PART_PATTERNS:
+        m = pattern.search(page)
+        if m:
+            sizes[part] = len(m.group(0).encode('utf-8'))
+    sizes['markup'] = len(page.encode('utf-8')) - sum(sizes.values())
+    return sizes
+
+
+class HtmlPartCounter:
+    """html_parts for a page written in pieces that do not split tags (StreamMinifier output)."""
+
+    def __init__(self):
+        self.size = 0  # Bytes fed so far
+        self.spans: dict[str, list] = {}  # Part -> [start, end or None, end tag]
+
+    def feed(self, html: str):
+        for part, tags, greedy in HTML_PARTS:
+            span = self.spans.get(part)
+            if span is None:
+                found = [(html.find(tag), tag) for tag in tags if tag in html]
+                if not found:
+                    continue
+                pos, tag = min(found)
+                span = self.spans[part] = [self.size + len(html[:pos].encode('utf-8')), None, tags[tag]]
+                search_from = pos
+            elif span[1] is not None and not greedy:
+                continue
+            else:
+                search_from = 0
+            end = html.rfind(span[2], search_from) if greedy else html.find(span[2], search_from)
+            if end != -1:
+                span[1] = self.size + len(html[:end + len(span[2])].encode('utf-8'))
+        self.size += len(html.encode('utf-8'))
+
+    def sizes(self) -> dict[str, int]:
+        sizes = {part: span[1] - span[0] for part, span in self.spans.items() if span[1] is not None}
+        sizes['markup'] = self.size - sum(sizes.values())
+        return sizes
+
+
+class PageBudgets:
+    """Collects the weight of written pages and checks it against the budgets of their type."""
+
+    def __init__(self, budgets: dict[str, dict[str, int]]):
+        self.budgets = budgets
+        self.pages: dict[str, tuple[dict[str, int], list[str]]] = {}  # rel_path -> (HTML parts, images)
+
+    def add_page(self, rel_path: str, page: str, images: list[str]):
+        """Record a page as written (minified) and the images it embeds, by indexed image name."""
+        self.add_sizes(rel_path, html_parts(page), images)
+
+    def add_sizes(self, rel_path: str, parts: dict[str, int], images: list[str]):
+        """Record a page by the sizes of its HTML parts (html_parts or HtmlPartCounter)."""
+        self.pages[rel_path] = (parts, list(dict.fromkeys(images)))
+
+    def check(self, image_size: Callable[[str], tuple[str, int]]) -> list[str]:
+        """
+        Print the heaviest pages and what dominates their weight, and return one message per
+        exceeded budget. image_size maps an indexed image to its shipped file name and size.
+        """
+        weights = []
+        for rel_path, (parts, images) in self.pages.items():
+            html = sum(parts.values())
+            shipped = [image_size(name) for name in images]
+            components = [(f"HTML {part}", size) for part, size in parts.items()]
+            components += [(f"image {name}", size) for name, size in shipped]
+            weights.append((html + sum(size for _, size in shipped), html, rel_path, components))
+        weights.sort(key=lambda w: (-w[0], w[2]))
+
+        html_sizes = [html for _, html, _, _ in weights]
+        print(f"      {len(weights)} page(s): HTML avg {sum(html_sizes) / max(len(html_sizes), 1) / 1024:.1f} KB, "
+              f"max {max(html_sizes, default=0) / 1024:.1f} KB")
+        print("      Heaviest pages (HTML + images):")
+        for total, html, rel_path, components in weights[:HEAVIEST_PAGES]:
+            name, size = max(components, key=lambda c: c[1])
+            print(f"        {rel_path}: {total / 1024:.0f} KB (HTML {html / 1024:.0f} KB), "
+                  f"mostly {name} {size / 1024:.0f} KB ({size / total:.0%})")
+
+        over = []
+        for total, html, rel_path, components in sorted(weights, key=lambda w: w[2]):
+            kind = page_type(rel_path)
+            limits = self.budgets.get(kind, {})
+            for measure, value in (('html', html), ('total', total)):
+                limit = limits.get(measure)
+                if limit is not None and value > limit * 1024:
+                    name, size = max((c for c in components if measure == 'total' or c[0].startswith('HTML')),
+                                     key=lambda c: c[1])
+                    over.append(f"{rel_path}: {measure} {value / 1024:.0f} KB > {limit} KB {kind} budget "
+                                f"(largest: {name} {size / 1024:.0f} KB)")
+        return over
@@ -0,0 +1,119 @@
+// --- Page Navigation ---
+// Pages of the default shell mode ("pages") each carry the sidebar. Clicking a link to
+// another page fetches it and swaps only <main>, so the sidebar, its scroll position and
+// the search box survive navigation. Hovered/focused links and the prev/next pages are
+// prefetched, so most navigations need no network round trip.
+// From file:// (where fetch() is blocked) links simply load the next page as usual.
+(() => {
+    const main = document.querySelector('main.viewer-page');
+    if (!main) return;
+
+    // Syntax highlighting (site_content.js does this in the iframe layout)
+    if (window.hljs) hljs.highlightAll();
+
+    const PREFETCH_HOVER_DELAY = 65; // ms; skips links the pointer only passes over
+    const pageCache = new Map(); // Page URL (without hash) -> Promise<Document>
+    let currentPage = pageUrl(location.href);
+
+    function pageUrl(href) {
+        const url = new URL(href, location.href);
+        url.hash = '';
+        return url.href;
+    }
+
+    function setActive(href) {
+        const page = pageUrl(href);
+        document.querySelectorAll('.sidebar-nav a').forEach(link => {
+            link.classList.toggle('active', pageUrl(link.href) === page);
+        });
+    }
+
+    // index.html shows the home page
+    setActive(/\/(index\.html)?$/.test(location.pathname) ? new URL('home.html', location.href).href : location.href);
+
+    if (location.protocol === 'file:' || !window.fetch || !window.DOMParser) return;
+
+    // Sidebar links are relative to the first page; keep them valid when pushState() changes folders
+    document.querySelectorAll('.sidebar a[href]').forEach(link => { link.href = link.href; });
+
+    function isPageLink(link) {
+        if (!link || (link.target && link.target !== '_self') || link.hasAttribute('download')) return false;
+        const url = new URL(link.href, location.href);
+        return url.origin === location.origin && url.pathname.endsWith('.html');
+    }
+
+    function fetchPage(url) {
+        if (!pageCache.has(url)) {
+            const request = fetch(url)
+                .then(response => {
+                    if (!response.ok) throw new Error(`${response.status} ${url}`);
+                    return response.text();
+                })
+                .then(html => new DOMParser().parseFromString(html, 'text/html'));
+            request.catch(() => pageCache.delete(url)); // Retry on the next attempt
+            pageCache.set(url, request);
+        }
+        return pageCache.get(url);
+    }
+
+    function prefetch(href) {
+        if (navigator.connection && navigator.connection.saveData) return;
+        fetchPage(pageUrl(href)).catch(() => {});
+    }
+
+    function prefetchNeighbours() {
+        const idle = window.requestIdleCallback || (callback => setTimeout(callback, 200));
+        idle(() => main.querySelectorAll('.doc-nav a[href]').forEach(link => prefetch(link.href)));
+    }
+
+    async function navigate(href, push) {
+        const url = new URL(href, location.href);
+        let content;
+        try {
+            content = (await fetchPage(pageUrl(url.href))).querySelector('main.viewer-page');
+        } catch (e) {
+            content = null;
+        }
+        if (!content) {
+            location.href = url.href; // Not a site page (or offline) - let the browser handle it
+            return;
+        }
+
+        // Push first: relative links in the new content resolve against the new location
+        if (push) history.pushState(null, '', url.href);
+        currentPage = pageUrl(url.href);
+        main.innerHTML = content.innerHTML;
+        document.title = content.ownerDocument.title;
+        setActive(url.href);
+
+        const anchor = url.hash && document.getElementById(decodeURIComponent(url.hash.slice(1)));
+        if (anchor) anchor.scrollIntoView();
+        else main.scrollTop = 0;
+        if (window.hljs) main.querySelectorAll('pre code').forEach(block => hljs.highlightElement(block));
+        prefetchNeighbours();
+    }
+
+    document.addEventListener('click', (e) => {
+        if (e.defaultPrevented || e.button !== 0 || e.metaKey || e.ctrlKey || e.shiftKey || e.altKey) return;
+        const link = e.target.closest('a[href]');
+        if (!isPageLink(link)) return;
+        if (pageUrl(link.href) === currentPage && new URL(link.href).hash) return; // Anchor on this page
+        e.preventDefault();
+        navigate(link.href, true);
+    });
+
+    window.addEventListener('popstate', () => {
+        if (pageUrl(location.href) !== currentPage) navigate(location.href, false);
+    });
+
+    let hoverTimer = null;
+    function onHover(e) {
+        const link = e.target.closest && e.target.closest('a[href]');
+        clearTimeout(hoverTimer);
+        if (isPageLink(link)) hoverTimer = setTimeout(() => prefetch(link.href), PREFETCH_HOVER_DELAY);
+    }
+    document.addEventListener('mouseover', onHover);
+    document.addEventListener('focusin', onHover);
+
+    prefetchNeighbours();
+})();
@@ -0,0 +1,136 @@
+// --- Search ---
+// Queries the sharded index in search/ (built by site_search.py).
+// Shards are loaded as <script> tags so search also works from file://.
+const searchInput = document.querySelector('.sidebar-search');
+const searchResults = document.querySelector('.search-results');
+const searchNav = document.querySelector('.sidebar-nav');
+
+const SHARD_PREFIX_LENGTH = 2;
+const MIN_TERM_LENGTH = 2;
+const MAX_RESULTS = 12;
+
+// Site root: pre-rendered pages in subfolders set data-root="../" on <body>
+const searchRoot = new URL(document.body.dataset.root || '', location.href).href;
+const searchTarget = document.querySelector('iframe.viewer') ? 'viewer' : '';
+
+const pendingScripts = {};
+let searchDocs = null;
+const searchShards = {};
+
+window.FlowerySearch = {
+    docs(list) { searchDocs = list; },
+    shard(prefix, terms) { searchShards[prefix] = terms; }
+};
+
+function loadSearchScript(name) {
+    if (!pendingScripts[name]) {
+        pendingScripts[name] = new Promise((resolve) => {
+            const script = document.createElement('script');
+            script.src = `${searchRoot}search/${name}.js`;
+            script.onload = resolve;
+            script.onerror = resolve; // Missing shard = no terms with that prefix
+            document.head.appendChild(script);
+        });
+    }
+    return pendingScripts[name];
+}
+
+function searchTokens(query) {
+    const tokens = query.toLowerCase().match(/[a-z0-9]+/g) || [];
+    return [...new Set(tokens)].filter(t => t.length >= MIN_TERM_LENGTH);
+}
+
+async function runSearch(query) {
+    const tokens = searchTokens(query);
+    if (!tokens.length) return [];
+
+    const prefixes = [...new Set(tokens.map(t => t.slice(0, SHARD_PREFIX_LENGTH)))];
+    await Promise.all([
+        loadSearchScript('docs'),
+        ...prefixes.map(p => loadSearchScript(`shard-${p}`))
+    ]);
+    if (!searchDocs) return [];
+
+    // Every token must match; exact term matches count double over prefix matches
+    let totals = null;
+    for (const token of tokens) {
+        const shard = searchShards[token.slice(0, SHARD_PREFIX_LENGTH)] || {};
+        const tokenScores = new Map();
+        for (const term in shard) {
+            if (!term.startsWith(token)) continue;
+            const factor = term === token ? 2 : 1;
+            for (const [docId, score] of shard[term]) {
+                tokenScores.set(docId, Math.max(tokenScores.get(docId) || 0, score * factor));
+            }
+        }
+        if (totals === null) {
+            totals = tokenScores;
+        } else {
+            for (const [docId, score] of totals) {
+                if (tokenScores.has(docId)) totals.set(docId, score + tokenScores.get(docId));
+                else totals.delete(docId);
+            }
+        }
+    }
+
+    return [...totals.entries()]
+        .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+        .slice(0, MAX_RESULTS)
+        .map(([docId]) => searchDocs[docId]);
+}
+
+function renderSearchResults(results, query) {
+    searchResults.innerHTML = '';
+    if (!query.trim()) {
+        searchResults.hidden = true;
+        searchNav.hidden = false;
+        return;
+    }
+
+    searchResults.hidden = false;
+    searchNav.hidden = true;
+    if (!results.length) {
+        const empty = document.createElement('li');
+        empty.className = 'search-empty';
+        empty.textContent = 'No results';
+        searchResults.appendChild(empty);
+        return;
+    }
+
+    for (const [title, url, snippet] of results) {
+        const item = document.createElement('li');
+        const link = document.createElement('a');
+        link.href = searchRoot + url;
+        if (searchTarget) link.target = searchTarget;
+        link.textContent = title;
+        if (snippet) {
+            const small = document.createElement('small');
+            small.textContent = snippet;
+            link.appendChild(small);
+        }
+        item.appendChild(link);
+        searchResults.appendChild(item);
+    }
+}
+
+let searchTimer = null;
+let searchSeq = 0;
+searchInput.addEventListener('input', () => {
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(async () => {
+        const query = searchInput.value;
+        const seq = ++searchSeq;
+        const results = await runSearch(query);
+        if (seq === searchSeq) renderSearchResults(results, query); // Drop stale responses
+    }, 120);
+});
+
+searchInput.addEventListener('keydown', (e) => {
+    if (e.key === 'Enter') {
+        const first = searchResults.querySelector('a');
+        if (first) first.click();
+    } else if (e.key === 'Escape') {
+        searchInput.value = '';
+        renderSearchResults([], '');
+    }
+});
@@ -0,0 +1,223 @@
+"""
+Flowery.Uno Site Search Index
+
+Builds a compact inverted index over the generated docs pages for the search
+box in the site shell. Used by generate_site.py.
+
+Output (in docs/search/):
+    docs.js              - Page list: [title, url, snippet] per document
+    shard-<xx>.js        - Postings for all terms starting with <xx>
+
+Shards are plain scripts that call window.FlowerySearch.*, so they load via
+<script> tags both from a web server and from file:// (where fetch() is blocked).
+The browser only loads the shards for the prefixes of the typed query terms.
+"""
+
+import json
+import math
+import re
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+
+# Terms are sharded by their first N characters
+SHARD_PREFIX_LENGTH = 2
+
+# Shorter terms are not indexed (and not queried)
+MIN_TERM_LENGTH = 2
+
+# Score multiplier per field a term occurs in
+FIELD_WEIGHTS = {
+    'heading': 4,
+    'api': 3,    # Inline code and first table column (property, enum and value names)
+    'body': 1,
+}
+
+# Extra (undampened) weight for terms in the page title
+TITLE_BOOST = 4
+
+# Longer terms are noise (hashes, base64, long paths)
+MAX_TERM_LENGTH = 30
+
+# Keep only the best N documents per term to keep shards small
+MAX_POSTINGS_PER_TERM = 40
+
+# Characters of the first paragraph shown under a search result
+SNIPPET_LENGTH = 120
+
+STOP_WORDS = frozenset('''
+    a an and are as at be by can for from has have if in into is it its of on or
+    so such that the their then there these this to use used uses using was when
+    which will with you your
+'''.split())
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase search terms.
+    Identifiers are also indexed by their camel-case suffixes, so prefix queries
+    find them from any word boundary (DaisyNumericUpDown -> numericupdown, updown, down).
+    """
+    terms = []
+    for word in re.findall(r'[A-Za-z0-9]+', text):
+        terms.append(word.lower())
+        parts = re.findall(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+', word)
+        for i in range(1, len(parts)):
+            terms.append(''.join(parts[i:]).lower())
+    return [t for t in terms
+            if MIN_TERM_LENGTH <= len(t) <= MAX_TERM_LENGTH and not t.isdigit() and t not in STOP_WORDS]
+
+
+def html_to_text(html: str) -> str:
+    """Strip tags and decode the few entities the site generator emits."""
+    text = re.sub(r'<[^>]+>', ' ', html)
+    text = text.replace('&lt;', '<').replace('&gt;', '>').replace('&quot;', '"').replace('&amp;', '&')
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+class SearchIndexBuilder:
+    """Collects rendered pages and renders a sharded inverted index (written by generate_site.py)."""
+
+    def __init__(self):
+        self.docs: list[list[str]] = []  # [title, url, snippet]
+        self.field_counts: list[dict[str, float]] = []  # Per doc: term -> weighted count
+        self.title_terms: list[set[str]] = []  # Per doc: terms of the page title
+        self.index: dict[str, list[list[int]]] = {}  # term -> [[doc_id, score], ...]
+
+    def add_page(self, url: str, title: str, html_content: str):
+        """Index one page from its rendered content HTML (without the page template)."""
+        # Code blocks are mostly XAML/C# noise for full-text search; inline code stays as API terms
+        body_html = re.sub(r'<pre>.*?</pre>', ' ', html_content, flags=re.DOTALL)
+
+        headings = re.findall(r'<h[1-4][^>]*>(.*?)</h[1-4]>', body_html, flags=re.DOTALL)
+        api = re.findall(r'<code>(.*?)</code>', body_html, flags=re.DOTALL)
+        api += re.findall(r'<tr>\s*<td>(.*?)</td>', body_html, flags=re.DOTALL)
+
+        counts: dict[str, float] = {}
+        fields = {
+            'heading': headings,
+            'api': api,
+            'body': [body_html],
+        }
+        for field_name, texts in fields.items():
+            weight = FIELD_WEIGHTS[field_name]
+            for text in texts:
+                for term in tokenize(html_to_text(text)):
+                    counts[term] = counts.get(term, 0) + weight
+
+        paragraph = re.search(r'<p>(.*?)</p>', body_html, flags=re.DOTALL)
+        snippet = html_to_text(paragraph.group(1)) if paragraph else ''
+        if len(snippet) > SNIPPET_LENGTH:
+            snippet = snippet[:SNIPPET_LENGTH - 1].rstrip() + '…'
+
+        self.docs.append([title, url, snippet])
+        self.field_counts.append(counts)
+        self.title_terms.append(set(tokenize(title)))
+
+    def build(self):
+        """Turn the weighted term counts into scored, capped postings lists."""
+        doc_freq: dict[str, int] = {}
+        for counts, title_terms in zip(self.field_counts, self.title_terms):
+            for term in counts.keys() | title_terms:
+                doc_freq[term] = doc_freq.get(term, 0) + 1
+
+        total_docs = len(self.docs)
+        postings: dict[str, list[list[int]]] = {}
+        for doc_id, (counts, title_terms) in enumerate(zip(self.field_counts, self.title_terms)):
+            for term in counts.keys() | title_terms:
+                idf = math.log(1 + total_docs / doc_freq[term])
+                weight = 1 + math.log(counts[term]) if term in counts else 0
+                if term in title_terms:
+                    weight += TITLE_BOOST
+                score = max(1, round(10 * weight * idf))
+                postings.setdefault(term, []).append([doc_id, score])
+
+        self.index = {}
+        for term in sorted(postings):
+            ranked = sorted(postings[term], key=lambda p: (-p[1], p[0]))
+            self.index[term] = ranked[:MAX_POSTINGS_PER_TERM]
+
+    def render(self) -> dict[str, str]:
+        """Build the index and return the content of docs.js and the shard files by file name."""
+        self.build()
+        shards: dict[str, dict[str, list[list[int]]]] = {}
+        for term, postings in self.index.items():
+            shards.setdefault(term[:SHARD_PREFIX_LENGTH], {})[term] = postings
+
+        files = {'docs.js': f'FlowerySearch.docs({self._dumps(self.docs)});\n'}
+        for prefix in sorted(shards):
+            files[f'shard-{prefix}.js'] = f'FlowerySearch.shard("{prefix}",{self._dumps(shards[prefix])});\n'
+        return files
+
+    def report(self, search_dir: Path, sizes: dict[str, int], sample_queries: list[str],
+               read_text: Callable[[Path], str] | None = None):
+        """
+        Print index size and the latency of sample queries answered from the written shards
+        (read with read_text, default: from disk).
+        """
+        shard_sizes = [size for name, size in sizes.items() if name.startswith('shard-')]
+        print(f"      Indexed {len(self.docs)} page(s), {len(self.index)} term(s) "
+              f"in {len(shard_sizes)} shard(s): {sum(sizes.values()) / 1024:.1f} KB total, "
+              f"largest shard {max(shard_sizes, default=0) / 1024:.1f} KB")
+
+        timings = []
+        for query in sample_queries:
+            start = time.perf_counter()
+            query_shards(search_dir, query, read_text=read_text)
+            timings.append((time.perf_counter() - start) * 1000)
+        if timings:
+            print(f"      {len(timings)} sample queries: avg {sum(timings) / len(timings):.2f} ms, "
+                  f"max {max(timings):.2f} ms (cold shard loads included)")
+
+    @staticmethod
+    def _dumps(data) -> str:
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def query_shards(search_dir: Path, query: str, limit: int = 10,
+                 read_text: Callable[[Path], str] | None = None) -> list[tuple[str, str, int]]:
+    """
+    Answer a query from the written shard files, the same way site_search.js does:
+    every query term must prefix-match an indexed term; scores of matching docs are summed.
+    read_text reads a file (default: from disk). Returns [(title, url, score), ...].
+    """
+    tokens = [t for t in dict.fromkeys(re.findall(r'[a-z0-9]+', query.lower())) if len(t) >= MIN_TERM_LENGTH]
+    if not tokens:
+        return []
+
+    read_text = read_text or (lambda path: path.read_text(encoding='utf-8'))
+    docs = _load_script_data(read_text(search_dir / 'docs.js'))
+    shard_cache: dict[str, dict] = {}
+    totals: dict[int, int] | None = None
+    for token in tokens:
+        prefix = token[:SHARD_PREFIX_LENGTH]
+        if prefix not in shard_cache:
+            try:
+                shard_cache[prefix] = _load_script_data(read_text(search_dir / f'shard-{prefix}.js'))
+            except FileNotFoundError:
+                shard_cache[prefix] = {}
+
+        token_scores: dict[int, int] = {}
+        for term, postings in shard_cache[prefix].items():
+            if term.startswith(token):
+                # Exact matches count fully, prefix matches (while typing) half
+                factor = 2 if term == token else 1
+                for doc_id, score in postings:
+                    token_scores[doc_id] = max(token_scores.get(doc_id, 0), score * factor)
+
+        if totals is None:
+            totals = token_scores
+        else:
+            totals = {d: s + token_scores[d] for d, s in totals.items() if d in token_scores}
+
+    ranked = sorted(totals.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return [(docs[doc_id][0], docs[doc_id][1], score) for doc_id, score in ranked]
+
+
+def _load_script_data(content: str):
+    """Extract the JSON payload (last call argument) from the content of a docs.js/shard-*.js file."""
+    start = content.index('(') + 1
+    if content.startswith('FlowerySearch.shard'):
+        start = content.index(',', start) + 1
+    return json.loads(content[start:content.rindex(')')])
@@ -0,0 +1,313 @@
+"""
+Flowery.Uno Docs Dev Server
+
+Serves the docs site from memory while editing docs (generate_site.py --serve).
+Pages and the other text outputs (llms-full.txt, manifests, search shards) are
+rendered on request by SiteGenerator, pages cached by the hash of their inputs;
+nothing is written to docs/. Inputs are watched by polling, and connected
+browsers reload only the affected page (in the iframe shell mode: the page in the
+iframe, or the whole shell when the sidebar or shell scripts change).
+
+Watched:
+    llms-static/*.md, llms-static/images/*     - Curated docs and images
+    llms/controls/*.md, llms/categories/*.md   - Generated docs and categories
+    Utils/site_template.css, Utils/site_*.js   - Templates
+"""
+
+import hashlib
+import json
+import mimetypes
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from site_search import SearchIndexBuilder
+
+
+# Seconds between polls of the watched files
+POLL_INTERVAL = 0.2
+
+# Seconds between keep-alive comments on idle event streams (also detects closed tabs)
+KEEPALIVE_INTERVAL = 15
+
+EVENTS_PATH = '/__events'
+
+# Injected before </body> of served pages (not part of the built site)
+LIVE_RELOAD_SCRIPT = '''<script>
+// Dev server live reload: the shell reloads the affected iframe page, standalone pages reload themselves
+(() => {
+    if (window.parent !== window) return;
+    const events = new EventSource('%s');
+    events.onmessage = (e) => {
+        const change = JSON.parse(e.data);
+        const frame = document.querySelector('iframe.viewer');
+        if (frame && change.shell) { location.reload(); return; }
+        const target = frame ? frame.contentWindow : window;
+        const path = target.location.pathname.replace(/^\\//, '') || 'index.html';
+        if (change.pages.includes('*') || change.pages.includes(path)) target.location.reload();
+    };
+})();
+</script>
+''' % EVENTS_PATH
+
+# Served as sw.js: removes a service worker a static build registered on the same origin,
+# which would otherwise answer requests from its cache instead of the dev server
+DEV_SERVICE_WORKER = '''// Dev server: unregister the docs service worker
+self.addEventListener('install', () => self.skipWaiting());
+self.addEventListener('activate', () => self.registration.unregister());
+'''
+
+
+class FileWatcher:
+    """Detects added, modified and removed files by polling size and modification time."""
+
+    def __init__(self, patterns: list[tuple[Path, str]]):
+        self.patterns = patterns  # (folder, glob pattern)
+        self.state = self._snapshot()
+
+    def _snapshot(self) -> dict[Path, tuple[int, int]]:
+        state = {}
+        for folder, pattern in self.patterns:
+            for path in folder.glob(pattern):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue  # Removed between glob and stat
+                if path.is_file():
+                    state[path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    def poll(self) -> set[Path]:
+        """Return the files that changed since the last poll."""
+        current = self._snapshot()
+        changed = {path for path, sig in current.items() if self.state.get(path) != sig}
+        changed |= self.state.keys() - current.keys()
+        self.state = current
+        return changed
+
+
+class DevServer:
+    """In-memory docs server with input-hash page cache and live reload."""
+
+    def __init__(self, make_generator: Callable, watch_patterns: list[tuple[Path, str]],
+                 host: str = '127.0.0.1', port: int = 8000):
+        self.make_generator = make_generator  # Returns a new SiteGenerator
+        self.watcher = FileWatcher(watch_patterns)
+        self.host = host
+        self.port = port
+        self.lock = threading.RLock()
+        self.changed = threading.Condition()
+        self.version = 0
+        self.changes: dict[int, dict] = {}  # Version -> {'shell': bool, 'pages': [...]}
+        self.generation = 0  # Bumped when templates or the site structure change
+        self.cache: dict[str, tuple[str, str]] = {}  # Output page -> (input key, page)
+        self.search_files: dict[str, str] | None = None
+        self.build_manifest: bytes | None = None
+        self._load()
+
+    def _load(self):
+        """(Re)load the whole site model."""
+        self.generator = self.make_generator()
+        self.generator.load()
+        self.generation += 1
+        self.search_files = None
+        self.build_manifest = None
+        self.files = {}  # Served image name -> source file (originals, variants, animations)
+        names = self.generator.asset_names  # Images are served under their fingerprinted names
+        for name, image in self.generator.images.items():
+            self.files[names[f"images/{name}"]] = image['shipped']
+            for out_name, cached in self.generator.derived_files(image):
+                self.files[names[f"images/{out_name}"]] = cached
+
+    def serve_forever(self):
+        threading.Thread(target=self._watch, daemon=True).start()
+        httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        httpd.daemon_threads = True
+        httpd.dev = self
+        print(f"\nServing docs at http://{self.host}:{self.port}/ (Ctrl+C to stop)")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\nStopped.")
+        finally:
+            httpd.server_close()
+
+    # --- Rendering ---
+
+    def page(self, rel_path: str) -> str | None:
+        """Rendered page from the cache, re-rendered if its inputs changed."""
+        with self.lock:
+            key = self._input_key(rel_path)
+            cached = self.cache.get(rel_path)
+            if cached and cached[0] == key:
+                return cached[1]
+            page = self.generator.render(rel_path)
+            if page is None:
+                return None
+            page = page.replace('</body>', LIVE_RELOAD_SCRIPT + '</body>', 1)
+            self.cache[rel_path] = (key, page)
+            return page
+
+    def _input_key(self, rel_path: str) -> str:
+        """Hash of everything a page is rendered from."""
+        doc = self.generator.doc_pages().get(rel_path)
+        if doc:
+            data = doc[1]['markdown']
+        elif rel_path in ('home.html', 'index.html'):
+            data = '\n'.join(str(ctrl['description']) for ctrl in self.generator.model.controls)
+        else:
+            data = ''
+        return hashlib.sha256(f"{self.generation}\0{rel_path}\0{data}".encode('utf-8')).hexdigest()
+
+    def asset(self, rel_path: str) -> bytes | None:
+        """Non-HTML output: rendered text files, the search index, images and the build manifest."""
+        if rel_path == 'sw.js':
+            return DEV_SERVICE_WORKER.encode('utf-8')
+        with self.lock:
+            if rel_path == 'build-manifest.json':
+                if self.build_manifest is None:
+                    self.build_manifest = self._build_manifest()
+                return self.build_manifest
+            if rel_path.startswith('search/'):
+                if self.search_files is None:
+                    self.search_files = self._build_search()
+                content = self.search_files.get(rel_path[len('search/'):])
+                return content.encode('utf-8') if content is not None else None
+            text = self.generator.render(rel_path)
+            if text is not None:
+                return text.encode('utf-8')
+            source = self.files.get(rel_path)
+        return source.read_bytes() if source and source.exists() else None
+
+    def _build_manifest(self) -> bytes:
+        """build-manifest.json of the served site: every output path -> sha256 of the bytes served."""
+        if self.search_files is None:
+            self.search_files = self._build_search()
+        paths = [*self.generator.render_paths(), 'sw.js', *self.files,
+                 *(f"search/{name}" for name in self.search_files)]
+        files = {}
+        for rel_path in paths:
+            if rel_path.endswith('.html'):
+                page = self.page(rel_path)
+                body = page.encode('utf-8') if page is not None else None
+            else:
+                body = self.asset(rel_path)
+            if body is not None:
+                files[rel_path] = hashlib.sha256(body).hexdigest()
+        return json.dumps({'files': files}, indent=1, sort_keys=True).encode('utf-8')
+
+    def _build_search(self) -> dict[str, str]:
+        search = SearchIndexBuilder()
+        for rel_path, (title, entry, render) in self.generator.doc_pages().items():
+            search.add_page(rel_path, title, render(entry)[0])
+        return search.render()
+
+    # --- Watching ---
+
+    def _watch(self):
+        while True:
+            time.sleep(POLL_INTERVAL)
+            changed = self.watcher.poll()
+            if changed:
+                self._apply(changed)
+
+    def _apply(self, changed: set[Path]):
+        """Update the model for changed inputs, pre-render affected pages and notify browsers."""
+        start = time.perf_counter()
+        with self.lock:
+            pages: set[str] = set()
+            for path in sorted(changed):
+                affected = self.generator.reload_file(path)
+                if affected is None:
+                    print(f"      {path.name} added/removed or structural change - reloading site model")
+                    self._load()
+                    pages = {'*', 'index.html'}
+                    break
+                pages.update(affected)
+            if pages & {'*', 'index.html'}:
+                self.generation += 1
+            self.search_files = None
+            self.build_manifest = None
+
+            rendered = [p for p in sorted(pages) if p != '*']
+            for rel_path in rendered:
+                self.page(rel_path)
+
+        elapsed = (time.perf_counter() - start) * 1000
+        names = ', '.join(sorted(path.name for path in changed))
+        print(f"      Changed {names} -> {', '.join(sorted(pages))} ({elapsed:.1f} ms)")
+
+        with self.changed:
+            self.version += 1
+            self.changes[self.version] = {'shell': 'index.html' in pages, 'pages': sorted(pages)}
+            self.changed.notify_all()
+
+    def wait_for_change(self, seen: int, timeout: float) -> tuple[int, dict] | None:
+        """Block until a change newer than `seen` (merged if several), or None on timeout."""
+        with self.changed:
+            if not self.changed.wait_for(lambda: self.version > seen, timeout):
+                return None
+            merged = {'shell': False, 'pages': set()}
+            for version in range(seen + 1, self.version + 1):
+                change = self.changes.get(version, {'shell': True, 'pages': ['*']})
+                merged['shell'] |= change['shell']
+                merged['pages'].update(change['pages'])
+            return self.version, {'shell': merged['shell'], 'pages': sorted(merged['pages'])}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes requests to the DevServer (self.server.dev)."""
+
+    def do_GET(self):
+        dev: DevServer = self.server.dev
+        path = self.path.split('?', 1)[0].split('#', 1)[0]
+        if path == EVENTS_PATH:
+            self._serve_events(dev)
+            return
+
+        rel_path = path.lstrip('/') or 'index.html'
+        if '..' in rel_path.split('/'):
+            self.send_error(404)
+            return
+        if rel_path.endswith('.html'):
+            page = dev.page(rel_path)
+            body = page.encode('utf-8') if page is not None else None
+        else:
+            body = dev.asset(rel_path)
+        if body is None:
+            self.send_error(404)
+            return
+
+        content_type = mimetypes.guess_type(rel_path)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type in ('application/javascript', 'application/json'):
+            content_type += '; charset=utf-8'
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _serve_events(self, dev: DevServer):
+        """Server-sent events stream of change notifications."""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        seen = dev.version
+        try:
+            while True:
+                change = dev.wait_for_change(seen, KEEPALIVE_INTERVAL)
+                if change is None:
+                    self.wfile.write(b': keep-alive\n\n')
+                else:
+                    seen, payload = change
+                    self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass  # Changes are logged by DevServer; per-request logs drown them out
@@ -2,7 +2,7 @@
 const themeToggle = document.querySelector('.theme-toggle');
 const sunIcon = document.querySelector('.sun-icon');
 const moonIcon = document.querySelector('.moon-icon');
-const iframe = document.querySelector('iframe');
+const iframe = document.querySelector('iframe'); // Only in the iframe shell mode
 
 // Check local storage or default to dark
 const currentTheme = localStorage.getItem('theme') || 'dark';
@@ -20,6 +20,8 @@ function applyTheme(theme) {
         moonIcon.style.display = 'block';
     }
 
+    if (!iframe) return;
+
     // Sync iframe (Direct access + PostMessage fallback for local files)
     try {
         // 1. Try direct access (works for same origin)
@@ -46,7 +48,7 @@ themeToggle.addEventListener('click', () => {
 });
 
 // When iframe loads, ensure it gets the theme
-iframe.addEventListener('load', () => {
+if (iframe) iframe.addEventListener('load', () => {
     const theme = localStorage.getItem('theme') || 'dark';
     applyTheme(theme);
 
@@ -130,29 +132,48 @@ links.forEach(link => {
 });
 
 // --- Hash Navigation ---
-// Handle URL hash to load specific pages (e.g., #MigrationExample)
+// Handle URL hash to load specific pages (e.g., #MigrationExample). Links to the old iframe
+// shell (index.html#DaisyButton, #Button, #categories/...) keep working in both layouts.
+const siteRoot = new URL(document.body.dataset.root || '.', location.href).href; // Folder of index.html
+
+function findHashPage(hash) {
+    const possiblePaths = [
+        `${hash}.html`,
+        `controls/${hash}.html`,
+        `controls/Daisy${hash}.html`,
+        `categories/${hash}.html`
+    ];
+    // Compare resolved URLs: site_nav.js makes the sidebar links absolute
+    const sidebarLinks = Array.from(document.querySelectorAll('.sidebar a[href]'));
+    for (const path of possiblePaths) {
+        const url = new URL(path, siteRoot).href;
+        const matchingLink = sidebarLinks.find(link => link.href === url);
+        if (matchingLink) return matchingLink;
+    }
+    return null;
+}
+
 function handleHashNavigation() {
-    const hash = window.location.hash.slice(1); // Remove '#'
-    if (hash) {
-        // Try to find a matching page
-        const possiblePaths = [
-            `${hash}.html`,
-            `controls/${hash}.html`,
-            `controls/Daisy${hash}.html`,
-            `categories/${hash}.html`
-        ];
-
-        // Find matching sidebar link and click it
-        for (const path of possiblePaths) {
-            const matchingLink = document.querySelector(`.sidebar a[href="${path}"]`);
-            if (matchingLink) {
-                matchingLink.click();
-                return;
-            }
+    const hash = decodeURIComponent(window.location.hash.slice(1)); // Remove '#'
+    if (!hash) return;
+    const matchingLink = findHashPage(hash);
+
+    if (iframe) {
+        // Click the matching sidebar link, or try to load the page directly
+        if (matchingLink) {
+            matchingLink.click();
+        } else {
+            iframe.src = `${hash}.html`;
         }
+        return;
+    }
 
-        // Fallback: try to load directly
-        iframe.src = `${hash}.html`;
+    // Pre-rendered pages: on the old shell URL, open the page the hash names (replacing the
+    // shell URL in the history). Any other hash is a heading anchor, which the browser has
+    // already scrolled to.
+    const page = new URL(location.pathname, location.href).href;
+    if (matchingLink && (page === siteRoot || page === siteRoot + 'index.html')) {
+        location.replace(matchingLink.href);
     }
 }
 
@@ -161,3 +182,11 @@ handleHashNavigation();
 
 // Handle hash changes (back/forward navigation)
 window.addEventListener('hashchange', handleHashNavigation);
+
+// --- Offline cache ---
+// sw.js (generated by the build) serves repeat visits from Cache Storage; it needs http(s)
+if ('serviceWorker' in navigator && location.protocol !== 'file:') {
+    window.addEventListener('load', () => {
+        navigator.serviceWorker.register(`${document.body.dataset.root || ''}sw.js`).catch(() => {});
+    });
+}
@@ -0,0 +1,83 @@
+// --- Service Worker ---
+// Serves the docs from Cache Storage, so repeat visits need no network and the site works offline.
+// PRECACHE_MANIFEST (prepended by generate_site.py) lists every output of the build with a
+// content revision. The "precache" entries (HTML shells, stylesheet, scripts, small images) are
+// fetched on install; everything else (pages, large screenshots, search shards) is cached on
+// first use. Any change to an output changes the manifest version and therefore this file, so
+// the browser installs a new worker: unchanged entries are carried over from the old cache,
+// changed ones are fetched again and the old cache is dropped.
+const CACHE_PREFIX = 'flowery-docs-';
+const CACHE_NAME = CACHE_PREFIX + PRECACHE_MANIFEST.version;
+const scopeUrl = new URL(self.registration.scope);
+
+// Cache key of an output: its URL plus revision, so a cached entry is never served for new content
+function cacheKey(path) {
+    return `${new URL(path, scopeUrl).href}?__rev=${PRECACHE_MANIFEST.files[path]}`;
+}
+
+async function fetchAndCache(cache, path) {
+    const response = await fetch(new URL(path, scopeUrl).href, { cache: 'no-cache' });
+    // Redirected responses cannot answer navigations
+    if (response.ok && !response.redirected) await cache.put(cacheKey(path), response.clone());
+    return response;
+}
+
+self.addEventListener('install', (event) => {
+    event.waitUntil((async () => {
+        const cache = await caches.open(CACHE_NAME);
+        const wanted = new Set(Object.keys(PRECACHE_MANIFEST.files).map(cacheKey));
+
+        // Carry over entries whose revision did not change (precached or cached on first use)
+        for (const name of await caches.keys()) {
+            if (name === CACHE_NAME || !name.startsWith(CACHE_PREFIX)) continue;
+            const previous = await caches.open(name);
+            for (const request of await previous.keys()) {
+                if (wanted.has(request.url) && !(await cache.match(request))) {
+                    await cache.put(request, await previous.match(request));
+                }
+            }
+        }
+
+        await Promise.all(PRECACHE_MANIFEST.precache.map(async (path) => {
+            if (await cache.match(cacheKey(path))) return;
+            const response = await fetchAndCache(cache, path);
+            if (!response.ok) throw new Error(`Precaching ${path} failed: ${response.status}`);
+        }));
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', (event) => {
+    event.waitUntil((async () => {
+        for (const name of await caches.keys()) {
+            if (name !== CACHE_NAME && name.startsWith(CACHE_PREFIX)) await caches.delete(name);
+        }
+        await self.clients.claim();
+    })());
+});
+
+self.addEventListener('fetch', (event) => {
+    const request = event.request;
+    // Byte-range requests (llms-full.txt sections) go to the network
+    if (request.method !== 'GET' || request.headers.has('range')) return;
+    const url = new URL(request.url);
+    if (url.origin !== scopeUrl.origin || !url.pathname.startsWith(scopeUrl.pathname)) return;
+
+    let path = decodeURIComponent(url.pathname.slice(scopeUrl.pathname.length));
+    if (path === '' || path.endsWith('/')) path += 'index.html';
+    if (!(path in PRECACHE_MANIFEST.files)) return; // Not an output of this build
+
+    event.respondWith((async () => {
+        const cache = await caches.open(CACHE_NAME);
+        const cached = await cache.match(cacheKey(path));
+        if (cached) return cached;
+        try {
+            return await fetchAndCache(cache, path);
+        } catch (e) {
+            // Offline and not cached in this version: an older revision is better than nothing
+            const stale = await caches.match(new URL(path, scopeUrl).href, { ignoreSearch: true });
+            if (stale) return stale;
+            throw e;
+        }
+    })());
+});